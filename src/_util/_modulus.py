@@ -1,6 +1,6 @@
 def _centered_modulus(n : int, modular : int) -> int:
     temp = n % modular
-    if temp > modular / 2:
+    if 2 * temp > modular:
         temp -= modular
     return temp
 
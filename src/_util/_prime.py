@@ -1,4 +1,6 @@
 import random
+import itertools
+from _util import _vec_modulus
 
 def _miller_rabin(n, k=40):
     """
@@ -28,57 +30,196 @@ def _miller_rabin(n, k=40):
             return False
     return True
 
-def _generate_prime(bit_length : int, n_degree):
+# bases of Miller-Rabin that decide every n < 2^64 (Jaeschke / Sinclair)
+_DETERMINISTIC_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+def _small_primes(limit):
+    """odd primes below limit, sieve of Eratosthenes"""
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for p in range(2, int(limit ** 0.5) + 1):
+        if sieve[p]:
+            sieve[p * p::p] = bytes(len(range(p * p, limit, p)))
+    return [ p for p in range(3, limit) if sieve[p] ]
+
+_SMALL_PRIMES = _small_primes(1 << 12)
+
+def _is_prime(n):
+    """deterministic below 2^64, 40-round Miller-Rabin above"""
+    if n < 2:
+        return False
+    for p in (2,) + tuple(_SMALL_PRIMES[:16]):
+        if n % p == 0:
+            return n == p
+    if n >= 1 << 64:
+        return _miller_rabin(n)
+    r, d = 0, n - 1
+    while d % 2 == 0:
+        r += 1
+        d //= 2
+    for a in _DETERMINISTIC_BASES:
+        a %= n
+        if a == 0:
+            continue
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(r - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def _sieve_window(start, m, count):
     """
-    - bit_length: bit length of prime
-    - n_degree: degree of modulus polynomial (1024, 2048, 4096...)
+    candidates start - i * m (i < count) that have no factor in _SMALL_PRIMES
+    - m = 2N is a power of two, so i * m = start (mod p) has the single solution i = start * m^-1 (mod p)
     """
+    composite = bytearray(count)
+    for p in _SMALL_PRIMES:
+        if p >= start:
+            break
+        i = start * pow(m, -1, p) % p
+        if start - i * m == p:
+            i += p
+        composite[i::p] = b"\x01" * len(range(i, count, p))
+    return [ start - i * m for i in range(count) if not composite[i] ]
 
+def _ntt_primes(bit_length, n_degree, start=None, window=1024):
+    """
+    NTT-friendly primes (p = 1 mod 2N) of bit_length bits in decreasing order,
+    from the largest candidate <= start (default 2^bit_length - 1)
+    """
+    m = 2 * n_degree
+    lower_bound = (1 << (bit_length - 1))
+    if start == None:
+        start = (1 << bit_length) - 1
+    candidate = ((start - 1) // m) * m + 1
+    while candidate >= lower_bound:
+        count = min(window, (candidate - lower_bound) // m + 1)
+        for p in _sieve_window(candidate, m, count):
+            if _is_prime(p):
+                yield p
+        candidate -= count * m
+
+def _catalogue_primes(bit_length, n_degree):
+    """the largest NTT-friendly primes of bit_length bits, looked up in the bundled catalogue first"""
+    from _util._prime_catalogue import _CATALOGUE
+    primes = _CATALOGUE.get((bit_length, n_degree.bit_length() - 1))
+    if primes == None:
+        yield from _ntt_primes(bit_length, n_degree)
+        return
+    yield from primes
+    # a short list holds every such prime, a full one continues below its last entry
+    if len(primes) == _CATALOGUE_SIZE:
+        yield from _ntt_primes(bit_length, n_degree, primes[-1] - 1)
+
+def _random_primes(bit_length, n_degree):
+    """NTT-friendly primes of bit_length bits, walking down from a random start and wrapping around once"""
     m = 2 * n_degree
-    
     lower_bound = (1 << (bit_length - 1))
     upper_bound = (1 << bit_length) - 1
-    
-    while True:
-        candidate = random.randint(lower_bound, upper_bound)
-        candidate = (candidate // m) * m + 1
-        while candidate >= lower_bound:
-            if _miller_rabin(candidate):
-                return candidate
-            candidate -= m
-
-def _generate_rns_bases(bit_lengths : list, n_degree):
+    start = random.randint(lower_bound, upper_bound)
+    yield from _ntt_primes(bit_length, n_degree, start)
+    for p in _ntt_primes(bit_length, n_degree):
+        if p <= start:
+            return
+        yield p
+
+def _special_primes(bit_length, n_degree):
+    """
+    the largest NTT-friendly primes 2^k - c * 2^m + 1 whose c * 2^m - 1 is small enough for the
+    shift-add reduction of _vec_modulus._special_constants, in increasing order of c * 2^m
+    """
+    for p in _catalogue_primes(bit_length, n_degree):
+        if _vec_modulus._special_constants(p) == None:
+            return
+        yield p
+
+def _special_bit_lengths(n_degree):
+    """bit lengths (14..62) with at least one special prime = 1 mod 2N, e.g. 38..62 for N = 4096"""
+    return [ bits for bits in _CATALOGUE_BITS if next(_special_primes(bits, n_degree), None) != None ]
+
+def _check_special(bit_lengths, n_degree, exclude):
+    """raise before generating when some bit length has fewer special primes than requested"""
+    for bits in set(bit_lengths):
+        needed = bit_lengths.count(bits)
+        candidates = ( p for p in _special_primes(bits, n_degree) if p not in exclude )
+        found = len(list(itertools.islice(candidates, needed)))
+        if found < needed:
+            supported = _special_bit_lengths(n_degree)
+            ranges, start = [], None
+            for idx, b in enumerate(supported):
+                if start == None:
+                    start = b
+                if idx + 1 == len(supported) or supported[idx + 1] != b + 1:
+                    ranges.append(f"{start}" if start == b else f"{start}..{b}")
+                    start = None
+            raise Exception(f"prime mode \"special\" needs {needed} {bits} bit primes 2^k - c * 2^m + 1 = 1 mod "\
+                f"{2 * n_degree} with c * 2^m - 1 small enough for the shift-add reduction, found {found}; "\
+                f"supported bit lengths for N = {n_degree}: {', '.join(ranges) or 'none'} "\
+                f"(use prime mode \"catalogue\" for other limbs)")
+
+# mode: "catalogue" takes the largest primes (same parameters on every run),
+#       "random" starts from a random candidate for fresh primes,
+#       "special" only accepts primes with a shift-add reduction (see _special_primes); their
+#       d = c * 2^m - 1 grows with N, so the shortest supported limb does too: 38 bits at N = 2^12,
+#       41 at N = 2^15, see _special_bit_lengths
+PRIME_MODE = {"catalogue": _catalogue_primes, "random": _random_primes, "special": _special_primes}
+
+def _generate_prime(bit_length : int, n_degree, mode="random", exclude=()):
+    """
+    - bit_length: bit length of prime
+    - n_degree: degree of modulus polynomial (1024, 2048, 4096...)
+    - exclude: primes that must not be returned
+    """
+    return _generate_rns_bases([bit_length], n_degree, mode, exclude)[0]
+
+def _generate_rns_bases(bit_lengths : list, n_degree, mode="random", exclude=()):
     """
     - bit_lengths: list of bit length
     - n_degree: degree of modulus polynomial (1024, 2048, 4096...)
+    - exclude: primes that must not be returned
     """
-    m = 2 * n_degree
-    generated_primes = set()
+    if mode not in PRIME_MODE:
+        raise Exception(f"prime mode \"{mode}\" is not exist")
+    if mode == "special":
+        _check_special(list(bit_lengths), n_degree, set(exclude))
+    generated_primes = set(exclude)
     primes_list = []
-
     for bit_len in bit_lengths:
-        lower_bound = (1 << (bit_len - 1))
-        upper_bound = (1 << bit_len) - 1
-        
-        found = False
-        while not found:
-            candidate = random.randint(lower_bound, upper_bound)
-            candidate = (candidate // m) * m + 1
-            
-            while candidate >= lower_bound:
-                if candidate not in generated_primes:
-                    if _miller_rabin(candidate):
-                        generated_primes.add(candidate)
-                        primes_list.append(candidate)
-                        found = True
-                        break
-                candidate -= m
-            
-            if not found:
-                continue
-                
+        for candidate in PRIME_MODE[mode](bit_len, n_degree):
+            if candidate not in generated_primes:
+                generated_primes.add(candidate)
+                primes_list.append(candidate)
+                break
+        else:
+            raise Exception(f"not enough {bit_len} bit primes = 1 mod {2 * n_degree}")
     return primes_list
 
+# number of primes bundled per (bit length, log2 N) and the covered ranges
+_CATALOGUE_SIZE = 8
+_CATALOGUE_BITS = range(14, 63)
+_CATALOGUE_LOG_N = range(1, 17)
+
+def _write_catalogue(path):
+    """regenerate the bundled catalogue module"""
+    with open(path, "w") as f:
+        f.write("# generated by _util._prime._write_catalogue, do not edit\n")
+        f.write(f"# the {_CATALOGUE_SIZE} largest primes p = 1 mod 2N of each bit length, keyed by (bit length, log2 N)\n")
+        f.write("_CATALOGUE = {\n")
+        for bits in _CATALOGUE_BITS:
+            for log_n in _CATALOGUE_LOG_N:
+                primes = []
+                for p in _ntt_primes(bits, 1 << log_n):
+                    primes.append(p)
+                    if len(primes) == _CATALOGUE_SIZE:
+                        break
+                f.write(f"    ({bits}, {log_n}): {primes},\n")
+        f.write("}\n")
+
 if __name__ == "__main__":
     n = 4096
     bits = 60
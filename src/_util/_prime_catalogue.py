@@ -0,0 +1,788 @@
+# generated by _util._prime._write_catalogue, do not edit
+# the 8 largest primes p = 1 mod 2N of each bit length, keyed by (bit length, log2 N)
+_CATALOGUE = {
+    (14, 1): [16381, 16369, 16361, 16349, 16333, 16301, 16273, 16253],
+    (14, 2): [16369, 16361, 16273, 16249, 16217, 16193, 16097, 16073],
+    (14, 3): [16369, 16273, 16193, 16097, 16033, 16001, 15937, 15889],
+    (14, 4): [16193, 16097, 16033, 16001, 15937, 15809, 15649, 15361],
+    (14, 5): [16193, 16001, 15937, 15809, 15361, 15233, 14657, 14593],
+    (14, 6): [16001, 15361, 15233, 14593, 14081, 13697, 13441, 13313],
+    (14, 7): [15361, 14593, 14081, 13313, 12289, 11777, 10753, 9473],
+    (14, 8): [15361, 13313, 12289, 11777, 10753],
+    (14, 9): [15361, 13313, 12289],
+    (14, 10): [12289],
+    (14, 11): [12289],
+    (14, 12): [],
+    (14, 13): [],
+    (14, 14): [],
+    (14, 15): [],
+    (14, 16): [],
+    (15, 1): [32749, 32717, 32713, 32693, 32653, 32633, 32621, 32609],
+    (15, 2): [32713, 32633, 32609, 32569, 32561, 32537, 32497, 32441],
+    (15, 3): [32609, 32561, 32497, 32401, 32369, 32353, 32321, 32257],
+    (15, 4): [32609, 32353, 32321, 32257, 31873, 31649, 31489, 31393],
+    (15, 5): [32321, 32257, 31873, 31489, 30977, 30593, 30529, 29761],
+    (15, 6): [32257, 31873, 31489, 30977, 30593, 29569, 28289, 26881],
+    (15, 7): [32257, 31489, 30977, 26881, 26113, 25601, 23297, 23041],
+    (15, 8): [32257, 26113, 25601, 23041, 19457, 18433, 17921],
+    (15, 9): [25601, 19457, 18433],
+    (15, 10): [18433],
+    (15, 11): [],
+    (15, 12): [],
+    (15, 13): [],
+    (15, 14): [],
+    (15, 15): [],
+    (15, 16): [],
+    (16, 1): [65521, 65497, 65449, 65437, 65413, 65393, 65381, 65357],
+    (16, 2): [65521, 65497, 65449, 65393, 65353, 65257, 65129, 65089],
+    (16, 3): [65521, 65393, 65089, 64849, 64817, 64609, 64577, 64513],
+    (16, 4): [65089, 64609, 64577, 64513, 64033, 63841, 63809, 63649],
+    (16, 5): [65089, 64577, 64513, 63809, 63617, 63361, 62401, 62273],
+    (16, 6): [64513, 63617, 63361, 62081, 61441, 61057, 60289, 60161],
+    (16, 7): [64513, 61441, 60161, 59393, 58369, 57601, 57089, 51713],
+    (16, 8): [64513, 61441, 59393, 58369, 51713, 50177, 45569, 40961],
+    (16, 9): [64513, 61441, 59393, 58369, 50177, 40961, 39937, 37889],
+    (16, 10): [61441, 59393, 40961],
+    (16, 11): [61441, 40961],
+    (16, 12): [40961],
+    (16, 13): [],
+    (16, 14): [],
+    (16, 15): [],
+    (16, 16): [],
+    (17, 1): [131041, 131009, 130981, 130973, 130969, 130957, 130873, 130841],
+    (17, 2): [131041, 131009, 130969, 130873, 130841, 130817, 130769, 130729],
+    (17, 3): [131041, 131009, 130817, 130769, 130657, 130513, 130369, 130337],
+    (17, 4): [131041, 131009, 130817, 130657, 130369, 130337, 130241, 129953],
+    (17, 5): [131009, 130817, 130369, 130241, 129793, 129281, 129089, 128833],
+    (17, 6): [130817, 129793, 129281, 128257, 127873, 126337, 125441, 124673],
+    (17, 7): [130817, 129793, 129281, 128257, 125441, 124673, 120833, 120577],
+    (17, 8): [125441, 120833, 119809, 119297, 118273, 115201, 114689, 113153],
+    (17, 9): [120833, 119809, 114689, 101377, 95233, 87041, 86017, 83969],
+    (17, 10): [120833, 114689, 86017, 83969, 79873, 65537],
+    (17, 11): [114689, 86017, 65537],
+    (17, 12): [114689, 65537],
+    (17, 13): [114689, 65537],
+    (17, 14): [65537],
+    (17, 15): [65537],
+    (17, 16): [],
+    (18, 1): [262133, 262121, 262109, 262069, 262049, 261977, 261973, 261917],
+    (18, 2): [262121, 262049, 261977, 261881, 261761, 261721, 261713, 261697],
+    (18, 3): [262049, 261761, 261713, 261697, 261601, 261329, 261281, 261169],
+    (18, 4): [262049, 261761, 261697, 261601, 261281, 261089, 260609, 260417],
+    (18, 5): [261761, 261697, 260609, 260417, 259841, 259201, 259009, 258241],
+    (18, 6): [261761, 260609, 259841, 259201, 257921, 257281, 256129, 255617],
+    (18, 7): [260609, 259841, 257281, 254977, 254209, 251393, 249857, 249089],
+    (18, 8): [260609, 254977, 251393, 249857, 242689, 240641, 238081, 235009],
+    (18, 9): [254977, 249857, 242689, 240641, 228353, 211969, 202753, 188417],
+    (18, 10): [249857, 202753, 188417, 184321, 176129, 163841, 151553, 147457],
+    (18, 11): [249857, 188417, 184321, 176129, 163841, 151553, 147457],
+    (18, 12): [188417, 163841, 147457],
+    (18, 13): [163841, 147457],
+    (18, 14): [163841],
+    (18, 15): [],
+    (18, 16): [],
+    (19, 1): [524269, 524261, 524257, 524221, 524201, 524197, 524189, 524149],
+    (19, 2): [524257, 524201, 524113, 524081, 524057, 523969, 523937, 523801],
+    (19, 3): [524257, 524113, 524081, 523969, 523937, 523793, 523777, 523729],
+    (19, 4): [524257, 523969, 523937, 523777, 523681, 523553, 523489, 523297],
+    (19, 5): [523969, 523777, 522881, 522689, 522497, 522113, 521537, 521281],
+    (19, 6): [523777, 522881, 522497, 522113, 520193, 519553, 518657, 518017],
+    (19, 7): [523777, 522497, 520193, 518657, 514561, 514049, 509441, 507137],
+    (19, 8): [523777, 520193, 518657, 514561, 514049, 509441, 503297, 498689],
+    (19, 9): [520193, 514049, 498689, 495617, 473089, 471041, 464897, 463873],
+    (19, 10): [520193, 514049, 495617, 473089, 471041, 464897, 430081, 428033],
+    (19, 11): [520193, 495617, 471041, 430081, 417793, 380929, 331777, 319489],
+    (19, 12): [417793, 319489, 286721, 270337],
+    (19, 13): [],
+    (19, 14): [],
+    (19, 15): [],
+    (19, 16): [],
+    (20, 1): [1048573, 1048549, 1048517, 1048433, 1048361, 1048357, 1048309, 1048273],
+    (20, 2): [1048433, 1048361, 1048273, 1048217, 1048193, 1048129, 1048049, 1048009],
+    (20, 3): [1048433, 1048273, 1048193, 1048129, 1048049, 1047841, 1047713, 1047649],
+    (20, 4): [1048193, 1048129, 1047841, 1047713, 1047649, 1047041, 1046977, 1046849],
+    (20, 5): [1048193, 1048129, 1047041, 1046977, 1046849, 1046657, 1046081, 1045633],
+    (20, 6): [1048193, 1047041, 1046657, 1045633, 1044737, 1044353, 1044097, 1043969],
+    (20, 7): [1047041, 1044737, 1043969, 1043201, 1038337, 1032961, 1032193, 1027841],
+    (20, 8): [1047041, 1043969, 1038337, 1032193, 1025537, 1022977, 1021441, 1017857],
+    (20, 9): [1038337, 1032193, 1022977, 1017857, 995329, 986113, 979969, 974849],
+    (20, 10): [1038337, 1032193, 1017857, 995329, 974849, 964609, 962561, 946177],
+    (20, 11): [1032193, 995329, 974849, 962561, 946177, 925697, 921601, 790529],
+    (20, 12): [1032193, 974849, 925697, 786433, 778241, 737281, 638977, 557057],
+    (20, 13): [1032193, 786433, 737281, 638977, 557057],
+    (20, 14): [786433, 557057],
+    (20, 15): [786433],
+    (20, 16): [786433],
+    (21, 1): [2097133, 2097097, 2097041, 2097013, 2096993, 2096957, 2096909, 2096893],
+    (21, 2): [2097097, 2097041, 2096993, 2096881, 2096873, 2096777, 2096761, 2096737],
+    (21, 3): [2097041, 2096993, 2096881, 2096737, 2096449, 2096401, 2096273, 2096209],
+    (21, 4): [2096993, 2096737, 2096449, 2095969, 2095361, 2095201, 2094721, 2094497],
+    (21, 5): [2096449, 2095361, 2094721, 2093953, 2093761, 2092801, 2092481, 2091521],
+    (21, 6): [2095361, 2094721, 2093953, 2092801, 2091521, 2090497, 2088833, 2088577],
+    (21, 7): [2095361, 2092801, 2091521, 2090497, 2086657, 2085121, 2084609, 2083073],
+    (21, 8): [2091521, 2090497, 2081281, 2076161, 2073601, 2073089, 2061313, 2060801],
+    (21, 9): [2073601, 2061313, 2056193, 2052097, 2034689, 2022401, 2021377, 2012161],
+    (21, 10): [2056193, 2052097, 2021377, 1990657, 1964033, 1923073, 1908737, 1892353],
+    (21, 11): [2056193, 2052097, 1990657, 1908737, 1892353, 1847297, 1843201, 1810433],
+    (21, 12): [2056193, 1990657, 1908737, 1892353, 1843201, 1810433, 1794049, 1785857],
+    (21, 13): [1785857, 1769473, 1720321, 1589249, 1376257, 1196033, 1179649, 1146881],
+    (21, 14): [1769473, 1376257, 1179649, 1146881],
+    (21, 15): [1769473, 1376257, 1179649],
+    (21, 16): [1179649],
+    (22, 1): [4194301, 4194277, 4194217, 4194181, 4194173, 4194137, 4193977, 4193957],
+    (22, 2): [4194217, 4194137, 4193977, 4193929, 4193801, 4193753, 4193633, 4193569],
+    (22, 3): [4193633, 4193569, 4193393, 4193377, 4193297, 4193249, 4193089, 4193041],
+    (22, 4): [4193633, 4193569, 4193377, 4193249, 4193089, 4192289, 4192129, 4192033],
+    (22, 5): [4193089, 4192129, 4191233, 4191041, 4189697, 4189313, 4189121, 4189057],
+    (22, 6): [4192129, 4191233, 4189697, 4189313, 4189057, 4188161, 4187137, 4187009],
+    (22, 7): [4191233, 4189697, 4188161, 4187137, 4183297, 4181761, 4179713, 4179457],
+    (22, 8): [4191233, 4189697, 4188161, 4187137, 4179457, 4177409, 4171777, 4169729],
+    (22, 9): [4191233, 4188161, 4187137, 4171777, 4169729, 4165633, 4156417, 4151297],
+    (22, 10): [4188161, 4171777, 4169729, 4165633, 4151297, 4141057, 4120577, 4104193],
+    (22, 11): [4169729, 4165633, 4141057, 4120577, 4104193, 4079617, 4046849, 4005889],
+    (22, 12): [4169729, 4120577, 4104193, 4079617, 4046849, 4005889, 3956737, 3850241],
+    (22, 13): [4079617, 4046849, 3850241, 3735553, 3686401, 3604481, 3588097, 3489793],
+    (22, 14): [3735553, 3604481, 2752513, 2654209, 2424833],
+    (22, 15): [3735553, 3604481, 2752513, 2424833],
+    (22, 16): [2752513],
+    (23, 1): [8388593, 8388581, 8388473, 8388461, 8388449, 8388421, 8388409, 8388377],
+    (23, 2): [8388593, 8388473, 8388449, 8388409, 8388377, 8388209, 8388113, 8387993],
+    (23, 3): [8388593, 8388449, 8388209, 8388113, 8387921, 8387857, 8387809, 8387473],
+    (23, 4): [8388449, 8387809, 8387297, 8386913, 8386817, 8386529, 8386177, 8385889],
+    (23, 5): [8386817, 8386177, 8385281, 8385217, 8384641, 8384449, 8383553, 8383489],
+    (23, 6): [8386817, 8386177, 8385281, 8384641, 8383489, 8382977, 8382593, 8380417],
+    (23, 7): [8386817, 8385281, 8383489, 8382977, 8380417, 8378369, 8377601, 8375041],
+    (23, 8): [8383489, 8382977, 8380417, 8378369, 8372737, 8365057, 8363009, 8355329],
+    (23, 9): [8383489, 8380417, 8378369, 8365057, 8363009, 8352769, 8344577, 8320001],
+    (23, 10): [8380417, 8378369, 8318977, 8304641, 8292353, 8286209, 8273921, 8257537],
+    (23, 11): [8380417, 8318977, 8286209, 8273921, 8257537, 8245249, 8183809, 8163329],
+    (23, 12): [8380417, 8273921, 8257537, 8183809, 8159233, 8134657, 7979009, 7913473],
+    (23, 13): [8273921, 8257537, 8159233, 7979009, 7913473, 7815169, 7667713, 7569409],
+    (23, 14): [8257537, 8159233, 7667713, 7569409, 7438337, 7340033, 6946817, 6782977],
+    (23, 15): [8257537, 7667713, 7340033, 6946817, 6750209, 6684673, 5767169, 5308417],
+    (23, 16): [8257537, 7340033, 6946817, 6684673, 5767169],
+    (24, 1): [16777213, 16777153, 16777141, 16777121, 16777049, 16776989, 16776973, 16776961],
+    (24, 2): [16777153, 16777121, 16777049, 16776961, 16776937, 16776857, 16776833, 16776817],
+    (24, 3): [16777153, 16777121, 16776961, 16776833, 16776817, 16776689, 16776593, 16776481],
+    (24, 4): [16777153, 16777121, 16776961, 16776833, 16776481, 16776289, 16775777, 16775489],
+    (24, 5): [16777153, 16776961, 16776833, 16775489, 16775041, 16774721, 16774273, 16774081],
+    (24, 6): [16776961, 16776833, 16775041, 16774273, 16773761, 16772993, 16771457, 16770433],
+    (24, 7): [16776961, 16770049, 16769537, 16769281, 16768513, 16766209, 16760833, 16753921],
+    (24, 8): [16770049, 16769537, 16768513, 16760833, 16751617, 16748033, 16744961, 16738817],
+    (24, 9): [16770049, 16760833, 16751617, 16736257, 16731137, 16727041, 16724993, 16720897],
+    (24, 10): [16760833, 16736257, 16709633, 16699393, 16693249, 16685057, 16674817, 16650241],
+    (24, 11): [16760833, 16736257, 16699393, 16674817, 16650241, 16617473, 16592897, 16588801],
+    (24, 12): [16760833, 16736257, 16588801, 16580609, 16515073, 16490497, 16465921, 16384001],
+    (24, 13): [16760833, 16580609, 16515073, 16465921, 16384001, 16269313, 16121857, 15974401],
+    (24, 14): [16580609, 16515073, 16384001, 16121857, 15630337, 14942209, 14909441, 14155777],
+    (24, 15): [16580609, 16515073, 16384001, 16121857, 14942209, 14155777, 13631489, 13565953],
+    (24, 16): [16515073, 16384001, 16121857, 14942209, 14155777, 13631489, 13238273, 12451841],
+    (25, 1): [33554393, 33554341, 33554317, 33554273, 33554249, 33554221, 33554201, 33554137],
+    (25, 2): [33554393, 33554273, 33554249, 33554201, 33554137, 33554009, 33553969, 33553769],
+    (25, 3): [33554273, 33553969, 33553697, 33553649, 33553633, 33553537, 33553489, 33553313],
+    (25, 4): [33554273, 33553697, 33553633, 33553537, 33553313, 33553153, 33553057, 33552641],
+    (25, 5): [33553537, 33553153, 33552641, 33551873, 33551041, 33550849, 33550337, 33550081],
+    (25, 6): [33553537, 33553153, 33552641, 33551873, 33550849, 33550337, 33550081, 33549569],
+    (25, 7): [33553153, 33552641, 33551873, 33550849, 33550337, 33550081, 33549569, 33546497],
+    (25, 8): [33551873, 33550849, 33550337, 33540097, 33538049, 33533953, 33530369, 33527297],
+    (25, 9): [33550337, 33540097, 33538049, 33533953, 33519617, 33510401, 33481729, 33469441],
+    (25, 10): [33550337, 33540097, 33538049, 33533953, 33519617, 33458177, 33445889, 33433601],
+    (25, 11): [33550337, 33538049, 33533953, 33411073, 33402881, 33349633, 33304577, 33292289],
+    (25, 12): [33538049, 33349633, 33292289, 33177601, 33128449, 33120257, 33005569, 32931841],
+    (25, 13): [33538049, 33292289, 33177601, 33128449, 32931841, 32899073, 32751617, 32686081],
+    (25, 14): [33292289, 33128449, 32931841, 32899073, 32440321, 31948801, 31916033, 31424513],
+    (25, 15): [33292289, 32899073, 32440321, 31916033, 31326209, 30539777, 29884417, 29687809],
+    (25, 16): [33292289, 32899073, 31326209, 30539777, 29884417, 28704769, 28311553, 27918337],
+    (26, 1): [67108837, 67108777, 67108757, 67108753, 67108729, 67108721, 67108709, 67108693],
+    (26, 2): [67108777, 67108753, 67108729, 67108721, 67108649, 67108633, 67108529, 67108369],
+    (26, 3): [67108753, 67108721, 67108529, 67108369, 67108289, 67108177, 67108081, 67108049],
+    (26, 4): [67108289, 67108033, 67107809, 67107713, 67107617, 67107553, 67107457, 67106657],
+    (26, 5): [67108289, 67108033, 67107713, 67107457, 67106561, 67106113, 67105729, 67104833],
+    (26, 6): [67107713, 67107457, 67106561, 67104769, 67101569, 67100801, 67097729, 67093633],
+    (26, 7): [67106561, 67104769, 67093249, 67092737, 67090433, 67087873, 67086337, 67085569],
+    (26, 8): [67104769, 67090433, 67087873, 67086337, 67084289, 67082753, 67072513, 67070977],
+    (26, 9): [67104769, 67090433, 67086337, 67084289, 67070977, 67065857, 67046401, 67043329],
+    (26, 10): [67104769, 67090433, 67086337, 67084289, 67065857, 67043329, 67041281, 67028993],
+    (26, 11): [67104769, 67084289, 67043329, 66998273, 66994177, 66969601, 66961409, 66949121],
+    (26, 12): [67084289, 67043329, 66994177, 66969601, 66961409, 66936833, 66813953, 66723841],
+    (26, 13): [67043329, 66994177, 66961409, 66813953, 66551809, 66420737, 66404353, 66011137],
+    (26, 14): [67043329, 66813953, 66551809, 66420737, 65929217, 65241089, 65077249, 65044481],
+    (26, 15): [67043329, 65929217, 65077249, 64946177, 64749569, 64684033, 63897601, 63766529],
+    (26, 16): [65929217, 64749569, 63700993, 61734913, 60424193, 59637761, 58851329, 57802753],
+    (27, 1): [134217689, 134217649, 134217617, 134217613, 134217593, 134217541, 134217529, 134217509],
+    (27, 2): [134217689, 134217649, 134217617, 134217593, 134217529, 134217497, 134217409, 134217401],
+    (27, 3): [134217649, 134217617, 134217409, 134217361, 134217089, 134216881, 134216801, 134216737],
+    (27, 4): [134217409, 134217089, 134216801, 134216737, 134216609, 134216129, 134215841, 134215681],
+    (27, 5): [134217409, 134217089, 134216129, 134215681, 134215553, 134214529, 134214209, 134212097],
+    (27, 6): [134217089, 134215681, 134215553, 134214529, 134212097, 134211841, 134211713, 134210561],
+    (27, 7): [134215681, 134212097, 134211841, 134210561, 134208769, 134208257, 134207233, 134203393],
+    (27, 8): [134215681, 134212097, 134210561, 134203393, 134176769, 134175233, 134166017, 134163457],
+    (27, 9): [134215681, 134210561, 134203393, 134176769, 134163457, 134151169, 134138881, 134136833],
+    (27, 10): [134215681, 134203393, 134176769, 134111233, 134072321, 134060033, 134025217, 134012929],
+    (27, 11): [134176769, 134111233, 134025217, 134012929, 133963777, 133881857, 133857281, 133844993],
+    (27, 12): [134176769, 134111233, 134012929, 133963777, 133881857, 133857281, 133644289, 133611521],
+    (27, 13): [133857281, 133644289, 133611521, 133513217, 133251073, 132825089, 132759553, 132710401],
+    (27, 14): [133857281, 132710401, 132612097, 132120577, 131923969, 131694593, 131530753, 131432449],
+    (27, 15): [132710401, 132120577, 131923969, 131530753, 130809857, 130744321, 128253953, 127795201],
+    (27, 16): [132120577, 130809857, 127795201, 127664129, 126615553, 126222337, 125698049, 125042689],
+    (28, 1): [268435361, 268435337, 268435313, 268435273, 268435157, 268435133, 268435129, 268435121],
+    (28, 2): [268435361, 268435337, 268435313, 268435273, 268435129, 268435121, 268435033, 268435009],
+    (28, 3): [268435361, 268435313, 268435121, 268435009, 268434977, 268434961, 268434721, 268434577],
+    (28, 4): [268435361, 268435009, 268434977, 268434721, 268434401, 268433761, 268433569, 268433441],
+    (28, 5): [268435009, 268432897, 268431169, 268429633, 268428161, 268426049, 268425089, 268424449],
+    (28, 6): [268432897, 268428161, 268425089, 268424449, 268423553, 268423297, 268421761, 268421249],
+    (28, 7): [268432897, 268424449, 268416769, 268412161, 268411393, 268409857, 268407809, 268404481],
+    (28, 8): [268432897, 268411393, 268409857, 268407809, 268400129, 268397057, 268389889, 268389377],
+    (28, 9): [268409857, 268407809, 268389377, 268369921, 268367873, 268361729, 268346369, 268343297],
+    (28, 10): [268369921, 268367873, 268361729, 268343297, 268326913, 268277761, 268271617, 268257281],
+    (28, 11): [268369921, 268361729, 268271617, 268238849, 268189697, 268185601, 268177409, 268148737],
+    (28, 12): [268369921, 268361729, 268271617, 268238849, 268189697, 268148737, 268091393, 268042241],
+    (28, 13): [268369921, 268271617, 268238849, 268189697, 268091393, 268042241, 267943937, 267550721],
+    (28, 14): [268369921, 268271617, 268238849, 268042241, 267943937, 267550721, 267059201, 266895361],
+    (28, 15): [268369921, 268238849, 268042241, 267059201, 265486337, 265420801, 264634369, 264306689],
+    (28, 16): [268042241, 265420801, 264634369, 263454721, 263323649, 261881857, 261488641, 260702209],
+    (29, 1): [536870909, 536870869, 536870849, 536870837, 536870813, 536870729, 536870717, 536870701],
+    (29, 2): [536870849, 536870729, 536870657, 536870641, 536870569, 536870561, 536870513, 536870497],
+    (29, 3): [536870849, 536870657, 536870641, 536870561, 536870513, 536870497, 536870401, 536870273],
+    (29, 4): [536870849, 536870657, 536870561, 536870497, 536870401, 536870273, 536869793, 536869633],
+    (29, 5): [536870849, 536870657, 536870401, 536870273, 536869633, 536868289, 536865281, 536863937],
+    (29, 6): [536870657, 536870401, 536870273, 536869633, 536865281, 536863489, 536861057, 536858369],
+    (29, 7): [536870657, 536870401, 536869633, 536865281, 536863489, 536858369, 536856577, 536852993],
+    (29, 8): [536870401, 536865281, 536856577, 536852993, 536851969, 536845313, 536828417, 536827393],
+    (29, 9): [536856577, 536845313, 536823809, 536819713, 536816641, 536813569, 536798209, 536774657],
+    (29, 10): [536856577, 536823809, 536819713, 536813569, 536774657, 536752129, 536743937, 536719361],
+    (29, 11): [536813569, 536752129, 536743937, 536719361, 536702977, 536690689, 536641537, 536616961],
+    (29, 12): [536813569, 536690689, 536641537, 536616961, 536608769, 536543233, 536494081, 536338433],
+    (29, 13): [536690689, 536641537, 536608769, 536543233, 536494081, 536215553, 536166401, 536002561],
+    (29, 14): [536641537, 536608769, 536543233, 536215553, 535920641, 535756801, 535461889, 535232513],
+    (29, 15): [536608769, 536543233, 536215553, 535756801, 535232513, 534970369, 533790721, 533463041],
+    (29, 16): [536608769, 536215553, 533463041, 532283393, 531628033, 529924097, 529268737, 528351233],
+    (30, 1): [1073741789, 1073741741, 1073741717, 1073741689, 1073741621, 1073741561, 1073741477, 1073741441],
+    (30, 2): [1073741689, 1073741561, 1073741441, 1073741329, 1073740793, 1073740697, 1073740649, 1073740609],
+    (30, 3): [1073741441, 1073741329, 1073740609, 1073740529, 1073740177, 1073740049, 1073739937, 1073739649],
+    (30, 4): [1073741441, 1073740609, 1073739937, 1073739649, 1073739617, 1073739361, 1073739169, 1073739041],
+    (30, 5): [1073741441, 1073740609, 1073739649, 1073738753, 1073737537, 1073737409, 1073736641, 1073736449],
+    (30, 6): [1073741441, 1073739649, 1073738753, 1073736449, 1073735297, 1073734913, 1073732993, 1073732609],
+    (30, 7): [1073738753, 1073736449, 1073734913, 1073732609, 1073731073, 1073730817, 1073726977, 1073716993],
+    (30, 8): [1073738753, 1073732609, 1073731073, 1073726977, 1073707009, 1073702401, 1073698817, 1073696257],
+    (30, 9): [1073738753, 1073732609, 1073707009, 1073698817, 1073692673, 1073682433, 1073668097, 1073658881],
+    (30, 10): [1073707009, 1073698817, 1073692673, 1073682433, 1073668097, 1073655809, 1073651713, 1073643521],
+    (30, 11): [1073692673, 1073668097, 1073655809, 1073651713, 1073643521, 1073569793, 1073508353, 1073479681],
+    (30, 12): [1073692673, 1073668097, 1073651713, 1073643521, 1073569793, 1073479681, 1073430529, 1073299457],
+    (30, 13): [1073692673, 1073643521, 1073479681, 1073430529, 1073299457, 1073233921, 1073184769, 1073135617],
+    (30, 14): [1073643521, 1073479681, 1073184769, 1073053697, 1072857089, 1072496641, 1071513601, 1071415297],
+    (30, 15): [1073479681, 1072496641, 1071513601, 1070727169, 1069219841, 1068564481, 1068433409, 1068236801],
+    (30, 16): [1073479681, 1071513601, 1070727169, 1068236801, 1065484289, 1064697857, 1062862849, 1062469633],
+    (31, 1): [2147483629, 2147483549, 2147483497, 2147483489, 2147483477, 2147483353, 2147483269, 2147483249],
+    (31, 2): [2147483497, 2147483489, 2147483353, 2147483249, 2147483137, 2147483033, 2147482937, 2147482921],
+    (31, 3): [2147483489, 2147483249, 2147483137, 2147482817, 2147482801, 2147482577, 2147482481, 2147482417],
+    (31, 4): [2147483489, 2147483137, 2147482817, 2147482273, 2147482081, 2147481793, 2147480897, 2147480641],
+    (31, 5): [2147483137, 2147482817, 2147481793, 2147480897, 2147480641, 2147479937, 2147479681, 2147479489],
+    (31, 6): [2147483137, 2147479937, 2147479681, 2147478017, 2147477249, 2147475713, 2147473921, 2147473409],
+    (31, 7): [2147483137, 2147478017, 2147477249, 2147475713, 2147473921, 2147473409, 2147470081, 2147468801],
+    (31, 8): [2147483137, 2147478017, 2147473921, 2147473409, 2147468801, 2147465729, 2147455489, 2147450369],
+    (31, 9): [2147473409, 2147415041, 2147396609, 2147389441, 2147387393, 2147377153, 2147365889, 2147361793],
+    (31, 10): [2147473409, 2147389441, 2147387393, 2147377153, 2147358721, 2147352577, 2147346433, 2147338241],
+    (31, 11): [2147389441, 2147377153, 2147352577, 2147295233, 2147217409, 2147205121, 2147196929, 2147082241],
+    (31, 12): [2147377153, 2147352577, 2147295233, 2147205121, 2147196929, 2147082241, 2147074049, 2146959361],
+    (31, 13): [2147352577, 2147205121, 2147074049, 2146959361, 2146713601, 2146418689, 2146336769, 2146091009],
+    (31, 14): [2147352577, 2146959361, 2146336769, 2146041857, 2145976321, 2144960513, 2144894977, 2144796673],
+    (31, 15): [2147352577, 2146959361, 2146041857, 2145976321, 2144796673, 2144468993, 2144010241, 2143092737],
+    (31, 16): [2147352577, 2146959361, 2146041857, 2144468993, 2142502913, 2135818241, 2135162881, 2135031809],
+    (32, 1): [4294967197, 4294967189, 4294967161, 4294967029, 4294966997, 4294966981, 4294966909, 4294966877],
+    (32, 2): [4294967161, 4294966769, 4294966657, 4294966553, 4294966441, 4294966337, 4294966297, 4294966217],
+    (32, 3): [4294966769, 4294966657, 4294966337, 4294966177, 4294966129, 4294966001, 4294965937, 4294965841],
+    (32, 4): [4294966657, 4294966337, 4294966177, 4294965793, 4294965601, 4294965313, 4294964929, 4294964897],
+    (32, 5): [4294966657, 4294966337, 4294965313, 4294964929, 4294962817, 4294962689, 4294961921, 4294960321],
+    (32, 6): [4294966657, 4294962817, 4294962689, 4294961921, 4294957697, 4294957057, 4294955009, 4294954753],
+    (32, 7): [4294962689, 4294961921, 4294957057, 4294955009, 4294954753, 4294953473, 4294953217, 4294947329],
+    (32, 8): [4294962689, 4294957057, 4294955009, 4294953473, 4294947329, 4294938113, 4294937089, 4294935553],
+    (32, 9): [4294957057, 4294955009, 4294935553, 4294929409, 4294924289, 4294921217, 4294914049, 4294895617],
+    (32, 10): [4294957057, 4294955009, 4294924289, 4294914049, 4294895617, 4294850561, 4294828033, 4294809601],
+    (32, 11): [4294955009, 4294914049, 4294828033, 4294807553, 4294729729, 4294709249, 4294684673, 4294643713],
+    (32, 12): [4294828033, 4294729729, 4294483969, 4294475777, 4294451201, 4294008833, 4293918721, 4293844993],
+    (32, 13): [4294475777, 4293918721, 4293836801, 4293230593, 4293181441, 4292984833, 4292804609, 4292755457],
+    (32, 14): [4294475777, 4293918721, 4293230593, 4292804609, 4292313089, 4292149249, 4292116481, 4292018177],
+    (32, 15): [4293918721, 4292804609, 4292149249, 4292018177, 4291952641, 4289462273, 4288806913, 4288086017],
+    (32, 16): [4293918721, 4291952641, 4289462273, 4288806913, 4286709761, 4286054401, 4284874753, 4284088321],
+    (33, 1): [8589934513, 8589934289, 8589934237, 8589934201, 8589934141, 8589934117, 8589934069, 8589934049],
+    (33, 2): [8589934513, 8589934289, 8589934201, 8589934049, 8589933721, 8589933641, 8589933601, 8589933377],
+    (33, 3): [8589934513, 8589934289, 8589934049, 8589933601, 8589933377, 8589933217, 8589932881, 8589932801],
+    (33, 4): [8589934049, 8589933601, 8589933377, 8589933217, 8589932801, 8589931873, 8589931393, 8589930689],
+    (33, 5): [8589933377, 8589932801, 8589931393, 8589930689, 8589929857, 8589928577, 8589927617, 8589925697],
+    (33, 6): [8589932801, 8589931393, 8589929857, 8589928577, 8589924481, 8589921281, 8589920897, 8589920641],
+    (33, 7): [8589932801, 8589921281, 8589919489, 8589911809, 8589910529, 8589909761, 8589905921, 8589904129],
+    (33, 8): [8589921281, 8589910529, 8589905921, 8589899777, 8589898241, 8589895681, 8589892097, 8589874177],
+    (33, 9): [8589921281, 8589905921, 8589899777, 8589895681, 8589874177, 8589872129, 8589868033, 8589862913],
+    (33, 10): [8589905921, 8589899777, 8589895681, 8589862913, 8589852673, 8589844481, 8589832193, 8589760513],
+    (33, 11): [8589905921, 8589852673, 8589844481, 8589832193, 8589709313, 8589684737, 8589680641, 8589488129],
+    (33, 12): [8589852673, 8589844481, 8589680641, 8589475841, 8589279233, 8589254657, 8589090817, 8588943361],
+    (33, 13): [8589852673, 8589475841, 8589279233, 8588886017, 8588820481, 8588771329, 8588640257, 8588230657],
+    (33, 14): [8589475841, 8589279233, 8588886017, 8588820481, 8588230657, 8588197889, 8588132353, 8587018241],
+    (33, 15): [8589475841, 8589279233, 8588886017, 8588820481, 8588230657, 8586854401, 8586723329, 8586330113],
+    (33, 16): [8589279233, 8588886017, 8588230657, 8585084929, 8583774209, 8581021697, 8580759553, 8578007041],
+    (34, 1): [17179869053, 17179869041, 17179868977, 17179868957, 17179868873, 17179868869, 17179868861, 17179868833],
+    (34, 2): [17179869041, 17179868977, 17179868873, 17179868833, 17179868809, 17179868777, 17179868729, 17179868681],
+    (34, 3): [17179869041, 17179868977, 17179868833, 17179868513, 17179868369, 17179868353, 17179868081, 17179867937],
+    (34, 4): [17179868833, 17179868513, 17179868353, 17179867937, 17179867489, 17179867297, 17179866881, 17179866401],
+    (34, 5): [17179868353, 17179866881, 17179866241, 17179866049, 17179865921, 17179862849, 17179862657, 17179862081],
+    (34, 6): [17179866881, 17179866241, 17179862657, 17179861889, 17179860353, 17179859969, 17179859329, 17179858433],
+    (34, 7): [17179866881, 17179859969, 17179858433, 17179858177, 17179856129, 17179855361, 17179848449, 17179848193],
+    (34, 8): [17179859969, 17179858433, 17179855361, 17179848193, 17179841537, 17179840001, 17179826177, 17179821569],
+    (34, 9): [17179859969, 17179841537, 17179826177, 17179819009, 17179809793, 17179801601, 17179800577, 17179798529],
+    (34, 10): [17179826177, 17179809793, 17179801601, 17179791361, 17179754497, 17179752449, 17179703297, 17179678721],
+    (34, 11): [17179791361, 17179754497, 17179672577, 17179648001, 17179594753, 17179549697, 17179496449, 17179422721],
+    (34, 12): [17179754497, 17179672577, 17179648001, 17179549697, 17179410433, 17179361281, 17179041793, 17178861569],
+    (34, 13): [17179754497, 17179672577, 17179410433, 17179361281, 17178836993, 17178574849, 17178525697, 17178247169],
+    (34, 14): [17179672577, 17179410433, 17178525697, 17178198017, 17178001409, 17176952833, 17176854529, 17176166401],
+    (34, 15): [17179672577, 17179410433, 17176854529, 17175674881, 17174691841, 17173774337, 17172791297, 17172594689],
+    (34, 16): [17176854529, 17175674881, 17172791297, 17171218433, 17167024129, 17166893057, 17164664833, 17163747329],
+    (35, 1): [34359738337, 34359738289, 34359738121, 34359737917, 34359737869, 34359737849, 34359737837, 34359737821],
+    (35, 2): [34359738337, 34359738289, 34359738121, 34359737849, 34359737777, 34359737497, 34359737393, 34359737297],
+    (35, 3): [34359738337, 34359738289, 34359737777, 34359737393, 34359737297, 34359737281, 34359736913, 34359736897],
+    (35, 4): [34359738337, 34359737281, 34359736897, 34359736577, 34359736513, 34359736193, 34359735937, 34359735649],
+    (35, 5): [34359737281, 34359736897, 34359736577, 34359736513, 34359736193, 34359735937, 34359735169, 34359734593],
+    (35, 6): [34359736577, 34359736193, 34359735937, 34359735169, 34359734401, 34359732097, 34359726721, 34359724033],
+    (35, 7): [34359736577, 34359724033, 34359722497, 34359720961, 34359716609, 34359715073, 34359714049, 34359710977],
+    (35, 8): [34359724033, 34359722497, 34359720961, 34359709697, 34359708673, 34359699457, 34359697409, 34359694849],
+    (35, 9): [34359724033, 34359720961, 34359709697, 34359708673, 34359699457, 34359697409, 34359662593, 34359651329],
+    (35, 10): [34359724033, 34359709697, 34359699457, 34359697409, 34359662593, 34359605249, 34359570433, 34359564289],
+    (35, 11): [34359709697, 34359697409, 34359570433, 34359451649, 34359447553, 34359410689, 34359365633, 34359361537],
+    (35, 12): [34359697409, 34359451649, 34359410689, 34359361537, 34359214081, 34359205889, 34359140353, 34359091201],
+    (35, 13): [34359410689, 34359361537, 34359214081, 34358788097, 34358444033, 34357805057, 34357657601, 34357444609],
+    (35, 14): [34359410689, 34359214081, 34358788097, 34357805057, 34357444609, 34357411841, 34357116929, 34356756481],
+    (35, 15): [34359410689, 34359214081, 34357444609, 34357116929, 34356068353, 34355478529, 34355085313, 34353512449],
+    (35, 16): [34359214081, 34357116929, 34356068353, 34353184769, 34352398337, 34351742977, 34350039041, 34346106881],
+    (36, 1): [68719476713, 68719476577, 68719476493, 68719476433, 68719476389, 68719476377, 68719476361, 68719476281],
+    (36, 2): [68719476713, 68719476577, 68719476433, 68719476377, 68719476361, 68719476281, 68719476257, 68719476209],
+    (36, 3): [68719476577, 68719476433, 68719476257, 68719476209, 68719475809, 68719475729, 68719475569, 68719474961],
+    (36, 4): [68719476577, 68719476257, 68719475809, 68719474849, 68719474529, 68719474081, 68719474049, 68719473793],
+    (36, 5): [68719474049, 68719473793, 68719473281, 68719473217, 68719473089, 68719470977, 68719469761, 68719469633],
+    (36, 6): [68719474049, 68719473793, 68719473281, 68719470977, 68719468801, 68719468417, 68719468289, 68719464449],
+    (36, 7): [68719468801, 68719468289, 68719464449, 68719460609, 68719456769, 68719452929, 68719447297, 68719446017],
+    (36, 8): [68719464449, 68719456769, 68719446017, 68719436801, 68719423489, 68719416833, 68719414273, 68719403009],
+    (36, 9): [68719464449, 68719446017, 68719436801, 68719423489, 68719414273, 68719403009, 68719395841, 68719393793],
+    (36, 10): [68719464449, 68719446017, 68719423489, 68719403009, 68719390721, 68719384577, 68719374337, 68719306753],
+    (36, 11): [68719464449, 68719423489, 68719403009, 68719390721, 68719374337, 68719300609, 68719230977, 68719206401],
+    (36, 12): [68719403009, 68719230977, 68719206401, 68719190017, 68719157249, 68718764033, 68718428161, 68718346241],
+    (36, 13): [68719230977, 68718428161, 68718346241, 68717740033, 68717592577, 68717363201, 68717068289, 68716707841],
+    (36, 14): [68718428161, 68717740033, 68716036097, 68714954753, 68714201089, 68713873409, 68713512961, 68713480193],
+    (36, 15): [68718428161, 68714954753, 68713512961, 68712923137, 68712202241, 68712005633, 68711415809, 68711350273],
+    (36, 16): [68718428161, 68712923137, 68712005633, 68711350273, 68710039553, 68709253121, 68707680257, 68706631681],
+    (37, 1): [137438953441, 137438953349, 137438953273, 137438953121, 137438953097, 137438953037, 137438953009, 137438952953],
+    (37, 2): [137438953441, 137438953273, 137438953121, 137438953097, 137438953009, 137438952953, 137438952529, 137438952361],
+    (37, 3): [137438953441, 137438953121, 137438953009, 137438952529, 137438952337, 137438952193, 137438951857, 137438951809],
+    (37, 4): [137438953441, 137438953121, 137438952193, 137438951809, 137438951393, 137438951233, 137438951201, 137438951137],
+    (37, 5): [137438952193, 137438951809, 137438951233, 137438949889, 137438949761, 137438948737, 137438948609, 137438948417],
+    (37, 6): [137438952193, 137438951809, 137438949889, 137438949761, 137438948737, 137438948609, 137438944001, 137438943617],
+    (37, 7): [137438952193, 137438949889, 137438948609, 137438944001, 137438939137, 137438938369, 137438935297, 137438930177],
+    (37, 8): [137438949889, 137438939137, 137438926337, 137438922241, 137438921729, 137438919169, 137438903809, 137438902273],
+    (37, 9): [137438939137, 137438921729, 137438902273, 137438850049, 137438822401, 137438817281, 137438814209, 137438807041],
+    (37, 10): [137438939137, 137438902273, 137438822401, 137438814209, 137438803969, 137438791681, 137438773249, 137438771201],
+    (37, 11): [137438822401, 137438814209, 137438773249, 137438760961, 137438703617, 137438691329, 137438666753, 137438580737],
+    (37, 12): [137438822401, 137438814209, 137438773249, 137438691329, 137438666753, 137438576641, 137438543873, 137438420993],
+    (37, 13): [137438822401, 137438773249, 137438691329, 137438576641, 137438543873, 137438085121, 137437986817, 137437888513],
+    (37, 14): [137438822401, 137438691329, 137437806593, 137437511681, 137437216769, 137436823553, 137436659713, 137436037121],
+    (37, 15): [137438822401, 137438691329, 137437511681, 137436659713, 137434103809, 137433317377, 137432989697, 137431351297],
+    (37, 16): [137438822401, 137438691329, 137437511681, 137434103809, 137433317377, 137431351297, 137422962689, 137421127681],
+    (38, 1): [274877906857, 274877906837, 274877906813, 274877906753, 274877906717, 274877906713, 274877906629, 274877906573],
+    (38, 2): [274877906857, 274877906753, 274877906713, 274877906473, 274877906321, 274877906209, 274877905921, 274877905889],
+    (38, 3): [274877906753, 274877906321, 274877906209, 274877905921, 274877905889, 274877905777, 274877905633, 274877905153],
+    (38, 4): [274877906753, 274877906209, 274877905921, 274877905889, 274877905633, 274877905153, 274877905121, 274877904193],
+    (38, 5): [274877906753, 274877905921, 274877905153, 274877904193, 274877904001, 274877903617, 274877903233, 274877901313],
+    (38, 6): [274877905921, 274877905153, 274877904001, 274877903617, 274877903233, 274877901313, 274877898881, 274877898497],
+    (38, 7): [274877905921, 274877905153, 274877903617, 274877901313, 274877898497, 274877893889, 274877891329, 274877886977],
+    (38, 8): [274877905921, 274877901313, 274877886977, 274877880833, 274877875201, 274877865473, 274877856769, 274877848577],
+    (38, 9): [274877905921, 274877875201, 274877856769, 274877848577, 274877847553, 274877844481, 274877827073, 274877822977],
+    (38, 10): [274877847553, 274877827073, 274877822977, 274877820929, 274877816833, 274877796353, 274877765633, 274877761537],
+    (38, 11): [274877820929, 274877816833, 274877796353, 274877734913, 274877718529, 274877706241, 274877562881, 274877501441],
+    (38, 12): [274877816833, 274877734913, 274877718529, 274877562881, 274877390849, 274877325313, 274877202433, 274877177857],
+    (38, 13): [274877562881, 274877202433, 274877153281, 274877022209, 274876334081, 274876219393, 274875842561, 274875727873],
+    (38, 14): [274877153281, 274877022209, 274876334081, 274875842561, 274874859521, 274874695681, 274874662913, 274873876481],
+    (38, 15): [274876334081, 274874695681, 274873778177, 274873188353, 274873122817, 274872795137, 274872598529, 274870566913],
+    (38, 16): [274876334081, 274873188353, 274872795137, 274870566913, 274870435841, 274868207617, 274864275457, 274862964737],
+    (39, 1): [549755813881, 549755813869, 549755813821, 549755813797, 549755813753, 549755813669, 549755813657, 549755813561],
+    (39, 2): [549755813881, 549755813753, 549755813657, 549755813561, 549755813513, 549755813417, 549755813401, 549755813281],
+    (39, 3): [549755813281, 549755812673, 549755812561, 549755812433, 549755812273, 549755812033, 549755811889, 549755811569],
+    (39, 4): [549755813281, 549755812673, 549755812033, 549755811457, 549755810977, 549755810881, 549755810273, 549755810209],
+    (39, 5): [549755812673, 549755812033, 549755811457, 549755810881, 549755809793, 549755808449, 549755807681, 549755807617],
+    (39, 6): [549755811457, 549755809793, 549755807617, 549755805569, 549755804161, 549755799169, 549755796353, 549755793793],
+    (39, 7): [549755809793, 549755804161, 549755792897, 549755789057, 549755788033, 549755785729, 549755779841, 549755779073],
+    (39, 8): [549755809793, 549755804161, 549755792897, 549755785729, 549755779073, 549755778049, 549755777537, 549755754497],
+    (39, 9): [549755809793, 549755779073, 549755778049, 549755754497, 549755753473, 549755747329, 549755731969, 549755722753],
+    (39, 10): [549755809793, 549755779073, 549755754497, 549755731969, 549755656193, 549755652097, 549755578369, 549755566081],
+    (39, 11): [549755809793, 549755731969, 549755523073, 549755514881, 549755486209, 549755473921, 549755465729, 549755363329],
+    (39, 12): [549755731969, 549755486209, 549755363329, 549755330561, 549755215873, 549754970113, 549754920961, 549754626049],
+    (39, 13): [549755731969, 549755486209, 549754617857, 549754454017, 549754355713, 549754109953, 549753978881, 549753864193],
+    (39, 14): [549755486209, 549754109953, 549753978881, 549753782273, 549753716737, 549753389057, 549753192449, 549752045569],
+    (39, 15): [549755486209, 549754109953, 549753978881, 549753782273, 549753716737, 549753389057, 549753192449, 549750833153],
+    (39, 16): [549754109953, 549753978881, 549753716737, 549753192449, 549750833153, 549749391361, 549748604929, 549747425281],
+    (40, 1): [1099511627689, 1099511627609, 1099511627581, 1099511627573, 1099511627477, 1099511627321, 1099511627309, 1099511627297],
+    (40, 2): [1099511627689, 1099511627609, 1099511627321, 1099511627297, 1099511627177, 1099511627089, 1099511626937, 1099511626793],
+    (40, 3): [1099511627297, 1099511627089, 1099511626321, 1099511626049, 1099511625409, 1099511625073, 1099511624993, 1099511624977],
+    (40, 4): [1099511627297, 1099511626049, 1099511625409, 1099511624993, 1099511624161, 1099511624033, 1099511623297, 1099511622689],
+    (40, 5): [1099511626049, 1099511625409, 1099511623297, 1099511622593, 1099511622529, 1099511621249, 1099511619841, 1099511618753],
+    (40, 6): [1099511623297, 1099511622529, 1099511621249, 1099511619841, 1099511617409, 1099511610497, 1099511609473, 1099511607041],
+    (40, 7): [1099511619841, 1099511607041, 1099511603713, 1099511600897, 1099511593729, 1099511592961, 1099511590913, 1099511585537],
+    (40, 8): [1099511603713, 1099511592961, 1099511590913, 1099511577089, 1099511572993, 1099511560193, 1099511557121, 1099511556097],
+    (40, 9): [1099511592961, 1099511590913, 1099511560193, 1099511557121, 1099511556097, 1099511549953, 1099511534593, 1099511525377],
+    (40, 10): [1099511592961, 1099511590913, 1099511560193, 1099511556097, 1099511549953, 1099511525377, 1099511492609, 1099511480321],
+    (40, 11): [1099511590913, 1099511549953, 1099511525377, 1099511492609, 1099511480321, 1099511390209, 1099511369729, 1099511259137],
+    (40, 12): [1099511480321, 1099511390209, 1099511259137, 1099511111681, 1099510890497, 1099510824961, 1099510620161, 1099510456321],
+    (40, 13): [1099511480321, 1099510890497, 1099510824961, 1099510054913, 1099510005761, 1099508924417, 1099508760577, 1099508531201],
+    (40, 14): [1099510054913, 1099508121601, 1099507695617, 1099506515969, 1099506352129, 1099505827841, 1099504549889, 1099503894529],
+    (40, 15): [1099510054913, 1099507695617, 1099506515969, 1099504549889, 1099503894529, 1099503370241, 1099502714881, 1099502518273],
+    (40, 16): [1099510054913, 1099507695617, 1099506515969, 1099504549889, 1099503894529, 1099503370241, 1099502714881, 1099500617729],
+    (41, 1): [2199023255521, 2199023255497, 2199023255489, 2199023255477, 2199023255461, 2199023255441, 2199023255413, 2199023255357],
+    (41, 2): [2199023255521, 2199023255497, 2199023255489, 2199023255441, 2199023255137, 2199023255081, 2199023254913, 2199023254657],
+    (41, 3): [2199023255521, 2199023255489, 2199023255441, 2199023255137, 2199023254913, 2199023254657, 2199023254529, 2199023254481],
+    (41, 4): [2199023255521, 2199023255489, 2199023255137, 2199023254913, 2199023254657, 2199023254529, 2199023254081, 2199023252737],
+    (41, 5): [2199023255489, 2199023254913, 2199023254657, 2199023254529, 2199023254081, 2199023252737, 2199023252353, 2199023252161],
+    (41, 6): [2199023254913, 2199023254657, 2199023254529, 2199023252737, 2199023252353, 2199023251457, 2199023250817, 2199023246209],
+    (41, 7): [2199023254529, 2199023252737, 2199023251457, 2199023245057, 2199023244289, 2199023236097, 2199023235329, 2199023232001],
+    (41, 8): [2199023254529, 2199023251457, 2199023244289, 2199023236097, 2199023232001, 2199023228929, 2199023225857, 2199023216129],
+    (41, 9): [2199023254529, 2199023251457, 2199023244289, 2199023236097, 2199023232001, 2199023228929, 2199023225857, 2199023210497],
+    (41, 10): [2199023251457, 2199023228929, 2199023210497, 2199023190017, 2199023183873, 2199023159297, 2199023155201, 2199023136769],
+    (41, 11): [2199023251457, 2199023210497, 2199023190017, 2199023136769, 2199023104001, 2199022927873, 2199022866433, 2199022821377],
+    (41, 12): [2199023190017, 2199022927873, 2199022821377, 2199022624769, 2199022411777, 2199022354433, 2199022133249, 2199022043137],
+    (41, 13): [2199023190017, 2199022927873, 2199022354433, 2199022043137, 2199022010369, 2199021961217, 2199021862913, 2199021813761],
+    (41, 14): [2199023190017, 2199022927873, 2199022043137, 2199022010369, 2199021813761, 2199021649921, 2199021617153, 2199021518849],
+    (41, 15): [2199023190017, 2199022927873, 2199022010369, 2199021813761, 2199021617153, 2199021355009, 2199021223937, 2199020634113],
+    (41, 16): [2199021813761, 2199020634113, 2199018405889, 2199016308737, 2199013294081, 2199010148353, 2199007789057, 2199006216193],
+    (42, 1): [4398046511093, 4398046510961, 4398046510889, 4398046510877, 4398046510829, 4398046510733, 4398046510721, 4398046510597],
+    (42, 2): [4398046510961, 4398046510889, 4398046510721, 4398046510577, 4398046510313, 4398046510217, 4398046510073, 4398046509929],
+    (42, 3): [4398046510961, 4398046510721, 4398046510577, 4398046509809, 4398046509761, 4398046509617, 4398046509473, 4398046508993],
+    (42, 4): [4398046510721, 4398046509761, 4398046509473, 4398046508993, 4398046508833, 4398046507457, 4398046506241, 4398046505761],
+    (42, 5): [4398046510721, 4398046509761, 4398046508993, 4398046507457, 4398046506241, 4398046504961, 4398046504513, 4398046503937],
+    (42, 6): [4398046510721, 4398046506241, 4398046504961, 4398046503937, 4398046500097, 4398046498561, 4398046496897, 4398046495489],
+    (42, 7): [4398046506241, 4398046504961, 4398046503937, 4398046500097, 4398046498561, 4398046495489, 4398046494209, 4398046486529],
+    (42, 8): [4398046504961, 4398046503937, 4398046494209, 4398046486529, 4398046482433, 4398046475777, 4398046474753, 4398046468609],
+    (42, 9): [4398046504961, 4398046503937, 4398046486529, 4398046482433, 4398046446593, 4398046436353, 4398046399489, 4398046369793],
+    (42, 10): [4398046504961, 4398046486529, 4398046482433, 4398046369793, 4398046341121, 4398046334977, 4398046328833, 4398046304257],
+    (42, 11): [4398046486529, 4398046482433, 4398046334977, 4398046240769, 4398046236673, 4398046212097, 4398046150657, 4398046056449],
+    (42, 12): [4398046486529, 4398046240769, 4398046150657, 4398045847553, 4398045708289, 4398045536257, 4398045511681, 4398045380609],
+    (42, 13): [4398046150657, 4398045708289, 4398045511681, 4398045380609, 4398045315073, 4398044987393, 4398044938241, 4398044921857],
+    (42, 14): [4398046150657, 4398044938241, 4398044577793, 4398043594753, 4398043496449, 4398042972161, 4398042513409, 4398042185729],
+    (42, 15): [4398044938241, 4398043496449, 4398042972161, 4398042513409, 4398042185729, 4398038450177, 4398037794817, 4398035304449],
+    (42, 16): [4398044938241, 4398043496449, 4398042972161, 4398042185729, 4398034845697, 4398029340673, 4398028029953, 4398021869569],
+    (43, 1): [8796093022141, 8796093022033, 8796093021953, 8796093021941, 8796093021917, 8796093021889, 8796093021769, 8796093021533],
+    (43, 2): [8796093022033, 8796093021953, 8796093021889, 8796093021769, 8796093021449, 8796093021409, 8796093021337, 8796093021281],
+    (43, 3): [8796093022033, 8796093021953, 8796093021889, 8796093021409, 8796093021281, 8796093021041, 8796093020513, 8796093020321],
+    (43, 4): [8796093021953, 8796093021889, 8796093021409, 8796093021281, 8796093020513, 8796093020321, 8796093020129, 8796093019489],
+    (43, 5): [8796093021953, 8796093021889, 8796093019457, 8796093019201, 8796093019073, 8796093018689, 8796093017857, 8796093017281],
+    (43, 6): [8796093021953, 8796093017857, 8796093015937, 8796093012737, 8796093009793, 8796093008897, 8796093008641, 8796093008513],
+    (43, 7): [8796093021953, 8796093017857, 8796093012737, 8796093008897, 8796093008641, 8796093004289, 8796093001217, 8796093000193],
+    (43, 8): [8796093008897, 8796093004289, 8796093001217, 8796093000193, 8796092998657, 8796092987393, 8796092975617, 8796092971009],
+    (43, 9): [8796093008897, 8796092998657, 8796092987393, 8796092971009, 8796092965889, 8796092962817, 8796092904449, 8796092894209],
+    (43, 10): [8796092987393, 8796092971009, 8796092962817, 8796092878849, 8796092858369, 8796092848129, 8796092846081, 8796092835841],
+    (43, 11): [8796092878849, 8796092858369, 8796092846081, 8796092833793, 8796092817409, 8796092792833, 8796092661761, 8796092583937],
+    (43, 12): [8796092858369, 8796092833793, 8796092817409, 8796092792833, 8796092661761, 8796092399617, 8796092375041, 8796091957249],
+    (43, 13): [8796092858369, 8796092792833, 8796092661761, 8796092399617, 8796091957249, 8796091924481, 8796090679297, 8796090597377],
+    (43, 14): [8796092858369, 8796092792833, 8796092661761, 8796092399617, 8796090597377, 8796090105857, 8796090007553, 8796089843713],
+    (43, 15): [8796090597377, 8796090007553, 8796087582721, 8796087386113, 8796087255041, 8796087058433, 8796086403073, 8796085420033],
+    (43, 16): [8796090007553, 8796087386113, 8796087255041, 8796085420033, 8796082667521, 8796079915009, 8796079783937, 8796078735361],
+    (44, 1): [17592186044297, 17592186044273, 17592186044129, 17592186044089, 17592186044057, 17592186043921, 17592186043889, 17592186043877],
+    (44, 2): [17592186044297, 17592186044273, 17592186044129, 17592186044089, 17592186044057, 17592186043921, 17592186043889, 17592186043841],
+    (44, 3): [17592186044273, 17592186044129, 17592186043921, 17592186043889, 17592186043841, 17592186043409, 17592186043297, 17592186042817],
+    (44, 4): [17592186044129, 17592186043841, 17592186043297, 17592186042817, 17592186042721, 17592186042049, 17592186041761, 17592186041249],
+    (44, 5): [17592186043841, 17592186042817, 17592186042049, 17592186037249, 17592186037121, 17592186036673, 17592186036289, 17592186033473],
+    (44, 6): [17592186037249, 17592186037121, 17592186033281, 17592186032257, 17592186030593, 17592186029569, 17592186029441, 17592186028801],
+    (44, 7): [17592186037249, 17592186030593, 17592186029569, 17592186028801, 17592186028289, 17592186028033, 17592186024449, 17592186022913],
+    (44, 8): [17592186037249, 17592186030593, 17592186029569, 17592186028033, 17592186024449, 17592186022913, 17592186018817, 17592185998337],
+    (44, 9): [17592186037249, 17592186028033, 17592186022913, 17592186018817, 17592185998337, 17592185997313, 17592185982977, 17592185926657],
+    (44, 10): [17592186028033, 17592185997313, 17592185982977, 17592185853953, 17592185819137, 17592185788417, 17592185726977, 17592185690113],
+    (44, 11): [17592186028033, 17592185982977, 17592185819137, 17592185659393, 17592185511937, 17592185491457, 17592185438209, 17592185413633],
+    (44, 12): [17592186028033, 17592185659393, 17592185511937, 17592185438209, 17592185413633, 17592185331713, 17592185266177, 17592185118721],
+    (44, 13): [17592186028033, 17592185438209, 17592184717313, 17592184225793, 17592183914497, 17592183832577, 17592183439361, 17592183390209],
+    (44, 14): [17592183914497, 17592183390209, 17592183324673, 17592182833153, 17592182243329, 17592181260289, 17592181129217, 17592180736001],
+    (44, 15): [17592182833153, 17592182243329, 17592181260289, 17592181129217, 17592180736001, 17592180539393, 17592179097601, 17592178507777],
+    (44, 16): [17592182243329, 17592180539393, 17592179097601, 17592178180097, 17592174247937, 17592173068289, 17592172412929, 17592167170049],
+    (45, 1): [35184372088777, 35184372088693, 35184372088673, 35184372088517, 35184372088493, 35184372088321, 35184372088249, 35184372088241],
+    (45, 2): [35184372088777, 35184372088673, 35184372088321, 35184372088249, 35184372088241, 35184372088097, 35184372088081, 35184372087937],
+    (45, 3): [35184372088673, 35184372088321, 35184372088241, 35184372088097, 35184372088081, 35184372087937, 35184372087649, 35184372087217],
+    (45, 4): [35184372088673, 35184372088321, 35184372088097, 35184372087937, 35184372087649, 35184372086753, 35184372086657, 35184372086497],
+    (45, 5): [35184372088321, 35184372087937, 35184372086657, 35184372086081, 35184372084353, 35184372084097, 35184372082241, 35184372080129],
+    (45, 6): [35184372088321, 35184372087937, 35184372086657, 35184372084353, 35184372084097, 35184372080129, 35184372079489, 35184372076417],
+    (45, 7): [35184372088321, 35184372080129, 35184372073217, 35184372067841, 35184372067073, 35184372065281, 35184372060161, 35184372051713],
+    (45, 8): [35184372088321, 35184372080129, 35184372067841, 35184372065281, 35184372060161, 35184372042241, 35184372014593, 35184372014081],
+    (45, 9): [35184372065281, 35184372060161, 35184372014081, 35184371986433, 35184371983361, 35184371961857, 35184371940353, 35184371884033],
+    (45, 10): [35184372060161, 35184371986433, 35184371961857, 35184371884033, 35184371845121, 35184371740673, 35184371724289, 35184371703809],
+    (45, 11): [35184372060161, 35184371986433, 35184371961857, 35184371884033, 35184371740673, 35184371724289, 35184371703809, 35184371613697],
+    (45, 12): [35184371884033, 35184371703809, 35184371613697, 35184371417089, 35184371294209, 35184371138561, 35184371089409, 35184370941953],
+    (45, 13): [35184371613697, 35184371417089, 35184371138561, 35184371089409, 35184370941953, 35184370794497, 35184370352129, 35184370155521],
+    (45, 14): [35184371138561, 35184370941953, 35184370352129, 35184370155521, 35184369893377, 35184368877569, 35184368320513, 35184368025601],
+    (45, 15): [35184368877569, 35184368025601, 35184367828993, 35184366911489, 35184365273089, 35184365076481, 35184363569153, 35184362979329],
+    (45, 16): [35184368025601, 35184365273089, 35184363569153, 35184358850561, 35184355704833, 35184353083393, 35184351772673, 35184350330881],
+    (46, 1): [70368744177601, 70368744177497, 70368744177377, 70368744177353, 70368744177289, 70368744177257, 70368744177113, 70368744177029],
+    (46, 2): [70368744177601, 70368744177497, 70368744177377, 70368744177353, 70368744177289, 70368744177257, 70368744177113, 70368744176921],
+    (46, 3): [70368744177601, 70368744177377, 70368744176833, 70368744176561, 70368744176321, 70368744175841, 70368744175729, 70368744175649],
+    (46, 4): [70368744177601, 70368744177377, 70368744176833, 70368744176321, 70368744175841, 70368744175649, 70368744175553, 70368744174433],
+    (46, 5): [70368744177601, 70368744176833, 70368744176321, 70368744175553, 70368744174017, 70368744169921, 70368744169153, 70368744168193],
+    (46, 6): [70368744168193, 70368744166913, 70368744163073, 70368744161921, 70368744160769, 70368744153601, 70368744151681, 70368744149633],
+    (46, 7): [70368744168193, 70368744166913, 70368744163073, 70368744160769, 70368744153601, 70368744148481, 70368744137729, 70368744127489],
+    (46, 8): [70368744166913, 70368744160769, 70368744153601, 70368744148481, 70368744137729, 70368744127489, 70368744122881, 70368744120833],
+    (46, 9): [70368744137729, 70368744127489, 70368744107009, 70368744067073, 70368744033281, 70368744023041, 70368744019969, 70368744010753],
+    (46, 10): [70368744067073, 70368744019969, 70368743974913, 70368743925761, 70368743815169, 70368743755777, 70368743669761, 70368743589889],
+    (46, 11): [70368744067073, 70368743755777, 70368743669761, 70368743587841, 70368743489537, 70368743485441, 70368743403521, 70368743374849],
+    (46, 12): [70368743669761, 70368743587841, 70368743489537, 70368743374849, 70368743292929, 70368743268353, 70368743055361, 70368742924289],
+    (46, 13): [70368743669761, 70368743587841, 70368743489537, 70368743374849, 70368743292929, 70368742850561, 70368742653953, 70368742408193],
+    (46, 14): [70368743587841, 70368743489537, 70368743292929, 70368742408193, 70368742113281, 70368740933633, 70368740769793, 70368740442113],
+    (46, 15): [70368743587841, 70368742408193, 70368740769793, 70368740442113, 70368739065857, 70368738410497, 70368737230849, 70368737034241],
+    (46, 16): [70368740769793, 70368739065857, 70368738410497, 70368737230849, 70368736706561, 70368732774401, 70368723337217, 70368721764353],
+    (47, 1): [140737488355213, 140737488355201, 140737488355181, 140737488355049, 140737488354989, 140737488354893, 140737488354709, 140737488354613],
+    (47, 2): [140737488355201, 140737488355049, 140737488354409, 140737488354329, 140737488354233, 140737488354161, 140737488354041, 140737488353849],
+    (47, 3): [140737488355201, 140737488354161, 140737488353809, 140737488353713, 140737488353633, 140737488353569, 140737488353393, 140737488353377],
+    (47, 4): [140737488355201, 140737488353633, 140737488353569, 140737488353377, 140737488353249, 140737488353057, 140737488352609, 140737488351937],
+    (47, 5): [140737488355201, 140737488351937, 140737488351169, 140737488349697, 140737488349441, 140737488348481, 140737488348161, 140737488346561],
+    (47, 6): [140737488355201, 140737488349697, 140737488349441, 140737488348161, 140737488344449, 140737488343297, 140737488343169, 140737488341377],
+    (47, 7): [140737488349697, 140737488349441, 140737488348161, 140737488343297, 140737488340993, 140737488337921, 140737488337153, 140737488331777],
+    (47, 8): [140737488349697, 140737488348161, 140737488340993, 140737488337921, 140737488331777, 140737488308737, 140737488294401, 140737488273409],
+    (47, 9): [140737488348161, 140737488340993, 140737488337921, 140737488331777, 140737488273409, 140737488252929, 140737488237569, 140737488230401],
+    (47, 10): [140737488340993, 140737488273409, 140737488252929, 140737488230401, 140737488218113, 140737488132097, 140737488125953, 140737488111617],
+    (47, 11): [140737488273409, 140737488252929, 140737488125953, 140737488089089, 140737488044033, 140737487917057, 140737487892481, 140737487884289],
+    (47, 12): [140737488273409, 140737488125953, 140737488044033, 140737487511553, 140737487380481, 140737487306753, 140737487290369, 140737487093761],
+    (47, 13): [140737488273409, 140737488125953, 140737488044033, 140737487306753, 140737487290369, 140737487093761, 140737486716929, 140737486553089],
+    (47, 14): [140737488125953, 140737487306753, 140737486716929, 140737486553089, 140737486520321, 140737485864961, 140737485242369, 140737484685313],
+    (47, 15): [140737487306753, 140737486716929, 140737486520321, 140737485864961, 140737484685313, 140737483898881, 140737482981377, 140737481801729],
+    (47, 16): [140737487306753, 140737486520321, 140737485864961, 140737484685313, 140737483898881, 140737482981377, 140737481801729, 140737480359937],
+    (48, 1): [281474976710597, 281474976710509, 281474976710413, 281474976710197, 281474976710129, 281474976710089, 281474976710029, 281474976709757],
+    (48, 2): [281474976710129, 281474976710089, 281474976709649, 281474976709609, 281474976709361, 281474976709273, 281474976709249, 281474976709153],
+    (48, 3): [281474976710129, 281474976709649, 281474976709361, 281474976709249, 281474976709153, 281474976708833, 281474976708689, 281474976708577],
+    (48, 4): [281474976709249, 281474976709153, 281474976708833, 281474976708577, 281474976708353, 281474976707233, 281474976707137, 281474976706817],
+    (48, 5): [281474976709249, 281474976708353, 281474976707137, 281474976706817, 281474976704897, 281474976702593, 281474976701057, 281474976699841],
+    (48, 6): [281474976709249, 281474976708353, 281474976706817, 281474976704897, 281474976702593, 281474976701057, 281474976697729, 281474976697217],
+    (48, 7): [281474976708353, 281474976706817, 281474976696577, 281474976694273, 281474976690689, 281474976678913, 281474976676097, 281474976670721],
+    (48, 8): [281474976694273, 281474976690689, 281474976678913, 281474976670721, 281474976666113, 281474976636929, 281474976604673, 281474976603649],
+    (48, 9): [281474976694273, 281474976678913, 281474976670721, 281474976636929, 281474976603137, 281474976577537, 281474976575489, 281474976568321],
+    (48, 10): [281474976694273, 281474976636929, 281474976577537, 281474976575489, 281474976565249, 281474976546817, 281474976540673, 281474976495617],
+    (48, 11): [281474976694273, 281474976636929, 281474976575489, 281474976546817, 281474976423937, 281474976342017, 281474976325633, 281474976317441],
+    (48, 12): [281474976694273, 281474976636929, 281474976546817, 281474976423937, 281474976342017, 281474976325633, 281474976317441, 281474976079873],
+    (48, 13): [281474976694273, 281474976546817, 281474976317441, 281474975662081, 281474975563777, 281474975367169, 281474975285249, 281474975088641],
+    (48, 14): [281474976546817, 281474976317441, 281474975662081, 281474975563777, 281474975367169, 281474974482433, 281474972418049, 281474972188673],
+    (48, 15): [281474976317441, 281474975662081, 281474974482433, 281474972188673, 281474971926529, 281474971533313, 281474966880257, 281474966683649],
+    (48, 16): [281474976317441, 281474975662081, 281474974482433, 281474966880257, 281474962554881, 281474960326657, 281474957180929, 281474955476993],
+    (49, 1): [562949953421201, 562949953421189, 562949953421173, 562949953421029, 562949953420973, 562949953420837, 562949953420793, 562949953420741],
+    (49, 2): [562949953421201, 562949953420793, 562949953420609, 562949953420553, 562949953420457, 562949953420369, 562949953420297, 562949953420097],
+    (49, 3): [562949953421201, 562949953420609, 562949953420369, 562949953420097, 562949953419793, 562949953418689, 562949953418609, 562949953418513],
+    (49, 4): [562949953420609, 562949953420097, 562949953418689, 562949953418401, 562949953417729, 562949953417441, 562949953416001, 562949953415777],
+    (49, 5): [562949953420609, 562949953420097, 562949953418689, 562949953417729, 562949953416001, 562949953414913, 562949953414721, 562949953413761],
+    (49, 6): [562949953417729, 562949953414913, 562949953413761, 562949953411969, 562949953410433, 562949953408001, 562949953403009, 562949953396097],
+    (49, 7): [562949953417729, 562949953414913, 562949953408001, 562949953392641, 562949953391873, 562949953387777, 562949953387009, 562949953370881],
+    (49, 8): [562949953417729, 562949953408001, 562949953392641, 562949953387009, 562949953368577, 562949953361921, 562949953349633, 562949953325569],
+    (49, 9): [562949953408001, 562949953392641, 562949953361921, 562949953349633, 562949953318913, 562949953305601, 562949953266689, 562949953254401],
+    (49, 10): [562949953392641, 562949953361921, 562949953349633, 562949953318913, 562949953253377, 562949953247233, 562949953216513, 562949953124353],
+    (49, 11): [562949953392641, 562949953318913, 562949953253377, 562949953216513, 562949953105921, 562949953097729, 562949953032193, 562949952987137],
+    (49, 12): [562949953216513, 562949952987137, 562949952970753, 562949952872449, 562949952847873, 562949952798721, 562949952724993, 562949952700417],
+    (49, 13): [562949952847873, 562949952798721, 562949952700417, 562949952274433, 562949951979521, 562949951963137, 562949951881217, 562949951733761],
+    (49, 14): [562949952798721, 562949952700417, 562949952274433, 562949951979521, 562949951881217, 562949951619073, 562949950636033, 562949950537729],
+    (49, 15): [562949952700417, 562949951979521, 562949950537729, 562949948833793, 562949948440577, 562949948178433, 562949947260929, 562949947195393],
+    (49, 16): [562949951979521, 562949950537729, 562949948833793, 562949948440577, 562949948178433, 562949947260929, 562949944508417, 562949942673409],
+    (50, 1): [1125899906842597, 1125899906842589, 1125899906842573, 1125899906842553, 1125899906842493, 1125899906842429, 1125899906842357, 1125899906842273],
+    (50, 2): [1125899906842553, 1125899906842273, 1125899906842201, 1125899906842177, 1125899906842033, 1125899906841713, 1125899906841673, 1125899906841377],
+    (50, 3): [1125899906842273, 1125899906842177, 1125899906842033, 1125899906841713, 1125899906841377, 1125899906840897, 1125899906840833, 1125899906840609],
+    (50, 4): [1125899906842273, 1125899906842177, 1125899906841377, 1125899906840897, 1125899906840833, 1125899906840609, 1125899906839937, 1125899906839489],
+    (50, 5): [1125899906842177, 1125899906840897, 1125899906840833, 1125899906839937, 1125899906839489, 1125899906838337, 1125899906837633, 1125899906835521],
+    (50, 6): [1125899906840833, 1125899906839937, 1125899906837633, 1125899906826241, 1125899906824961, 1125899906822657, 1125899906820097, 1125899906819201],
+    (50, 7): [1125899906840833, 1125899906826241, 1125899906824961, 1125899906822657, 1125899906820097, 1125899906817793, 1125899906814209, 1125899906812673],
+    (50, 8): [1125899906826241, 1125899906822657, 1125899906820097, 1125899906802689, 1125899906785793, 1125899906774017, 1125899906769409, 1125899906760193],
+    (50, 9): [1125899906826241, 1125899906820097, 1125899906802689, 1125899906774017, 1125899906749441, 1125899906738177, 1125899906732033, 1125899906722817],
+    (50, 10): [1125899906826241, 1125899906820097, 1125899906738177, 1125899906732033, 1125899906701313, 1125899906676737, 1125899906629633, 1125899906562049],
+    (50, 11): [1125899906826241, 1125899906732033, 1125899906629633, 1125899906437121, 1125899906424833, 1125899906260993, 1125899906113537, 1125899906080769],
+    (50, 12): [1125899906826241, 1125899906629633, 1125899906424833, 1125899906260993, 1125899906113537, 1125899906080769, 1125899906031617, 1125899905884161],
+    (50, 13): [1125899906826241, 1125899906629633, 1125899905744897, 1125899905351681, 1125899905220609, 1125899904679937, 1125899903991809, 1125899903827969],
+    (50, 14): [1125899904679937, 1125899903991809, 1125899903827969, 1125899903795201, 1125899903500289, 1125899903107073, 1125899902124033, 1125899901665281],
+    (50, 15): [1125899904679937, 1125899903827969, 1125899903500289, 1125899903107073, 1125899902124033, 1125899901665281, 1125899899174913, 1125899896160257],
+    (50, 16): [1125899903827969, 1125899902124033, 1125899887312897, 1125899886395393, 1125899885740033, 1125899884167169, 1125899884036097, 1125899883642881],
+    (51, 1): [2251799813685109, 2251799813685017, 2251799813685001, 2251799813684893, 2251799813684857, 2251799813684809, 2251799813684789, 2251799813684777],
+    (51, 2): [2251799813685017, 2251799813685001, 2251799813684857, 2251799813684809, 2251799813684777, 2251799813684753, 2251799813684737, 2251799813684689],
+    (51, 3): [2251799813684753, 2251799813684737, 2251799813684689, 2251799813684401, 2251799813684353, 2251799813684321, 2251799813684273, 2251799813683633],
+    (51, 4): [2251799813684737, 2251799813684353, 2251799813684321, 2251799813683297, 2251799813682817, 2251799813682721, 2251799813681921, 2251799813681281],
+    (51, 5): [2251799813684737, 2251799813684353, 2251799813682817, 2251799813681921, 2251799813681281, 2251799813679553, 2251799813678273, 2251799813676737],
+    (51, 6): [2251799813684737, 2251799813684353, 2251799813682817, 2251799813681921, 2251799813681281, 2251799813676289, 2251799813672833, 2251799813667841],
+    (51, 7): [2251799813684737, 2251799813681921, 2251799813676289, 2251799813667841, 2251799813656321, 2251799813643521, 2251799813640961, 2251799813640193],
+    (51, 8): [2251799813684737, 2251799813667841, 2251799813640193, 2251799813639681, 2251799813638657, 2251799813632001, 2251799813628929, 2251799813624833],
+    (51, 9): [2251799813667841, 2251799813640193, 2251799813632001, 2251799813628929, 2251799813624833, 2251799813616641, 2251799813613569, 2251799813560321],
+    (51, 10): [2251799813640193, 2251799813632001, 2251799813613569, 2251799813560321, 2251799813554177, 2251799813517313, 2251799813486593, 2251799813480449],
+    (51, 11): [2251799813640193, 2251799813632001, 2251799813554177, 2251799813517313, 2251799813480449, 2251799813472257, 2251799813406721, 2251799813398529],
+    (51, 12): [2251799813554177, 2251799813480449, 2251799813472257, 2251799813406721, 2251799813398529, 2251799813349377, 2251799813283841, 2251799813038081],
+    (51, 13): [2251799813554177, 2251799813472257, 2251799813406721, 2251799812980737, 2251799812784129, 2251799812292609, 2251799811735553, 2251799811604481],
+    (51, 14): [2251799813554177, 2251799811391489, 2251799810670593, 2251799810605057, 2251799809916929, 2251799809884161, 2251799809785857, 2251799809392641],
+    (51, 15): [2251799813554177, 2251799811391489, 2251799810670593, 2251799810605057, 2251799809884161, 2251799809294337, 2251799807131649, 2251799806345217],
+    (51, 16): [2251799813554177, 2251799810670593, 2251799809884161, 2251799807131649, 2251799806345217, 2251799805165569, 2251799799267329, 2251799797432321],
+    (52, 1): [4503599627370449, 4503599627370353, 4503599627370313, 4503599627370161, 4503599627370101, 4503599627370001, 4503599627369861, 4503599627369837],
+    (52, 2): [4503599627370449, 4503599627370353, 4503599627370313, 4503599627370161, 4503599627370001, 4503599627369657, 4503599627368993, 4503599627368889],
+    (52, 3): [4503599627370449, 4503599627370353, 4503599627370161, 4503599627370001, 4503599627368993, 4503599627368769, 4503599627368241, 4503599627367553],
+    (52, 4): [4503599627368993, 4503599627368769, 4503599627367553, 4503599627366401, 4503599627364961, 4503599627364737, 4503599627364577, 4503599627364353],
+    (52, 5): [4503599627368769, 4503599627367553, 4503599627366401, 4503599627364737, 4503599627364353, 4503599627363201, 4503599627362753, 4503599627359169],
+    (52, 6): [4503599627367553, 4503599627366401, 4503599627364737, 4503599627364353, 4503599627363201, 4503599627355649, 4503599627355137, 4503599627354369],
+    (52, 7): [4503599627366401, 4503599627364353, 4503599627355649, 4503599627355137, 4503599627354369, 4503599627352577, 4503599627351809, 4503599627347969],
+    (52, 8): [4503599627366401, 4503599627364353, 4503599627355649, 4503599627355137, 4503599627352577, 4503599627347969, 4503599627335169, 4503599627306497],
+    (52, 9): [4503599627366401, 4503599627364353, 4503599627355137, 4503599627347969, 4503599627277313, 4503599627262977, 4503599627228161, 4503599627216897],
+    (52, 10): [4503599627366401, 4503599627364353, 4503599627347969, 4503599627216897, 4503599627155457, 4503599627149313, 4503599627139073, 4503599627124737],
+    (52, 11): [4503599627366401, 4503599627149313, 4503599627124737, 4503599626924033, 4503599626838017, 4503599626817537, 4503599626801153, 4503599626690561],
+    (52, 12): [4503599627149313, 4503599627124737, 4503599626838017, 4503599626690561, 4503599626682369, 4503599626493953, 4503599626321921, 4503599626141697],
+    (52, 13): [4503599627124737, 4503599626682369, 4503599626321921, 4503599626141697, 4503599625830401, 4503599625535489, 4503599625404417, 4503599625158657],
+    (52, 14): [4503599626682369, 4503599626321921, 4503599625830401, 4503599625535489, 4503599625404417, 4503599624847361, 4503599624716289, 4503599623864321],
+    (52, 15): [4503599626321921, 4503599625535489, 4503599625404417, 4503599623045121, 4503599621472257, 4503599619112961, 4503599618260993, 4503599616688129],
+    (52, 16): [4503599626321921, 4503599625535489, 4503599625404417, 4503599623045121, 4503599621472257, 4503599619112961, 4503599615311873, 4503599613214721],
+    (53, 1): [9007199254740881, 9007199254740761, 9007199254740677, 9007199254740653, 9007199254740649, 9007199254740613, 9007199254740541, 9007199254740529],
+    (53, 2): [9007199254740881, 9007199254740761, 9007199254740649, 9007199254740529, 9007199254740481, 9007199254740121, 9007199254740041, 9007199254739977],
+    (53, 3): [9007199254740881, 9007199254740529, 9007199254740481, 9007199254739809, 9007199254739297, 9007199254739089, 9007199254738481, 9007199254738193],
+    (53, 4): [9007199254740481, 9007199254739809, 9007199254739297, 9007199254737857, 9007199254736993, 9007199254736801, 9007199254736129, 9007199254735873],
+    (53, 5): [9007199254740481, 9007199254737857, 9007199254736129, 9007199254735873, 9007199254734977, 9007199254734529, 9007199254731841, 9007199254731137],
+    (53, 6): [9007199254740481, 9007199254736129, 9007199254735873, 9007199254734977, 9007199254731137, 9007199254728833, 9007199254728449, 9007199254725377],
+    (53, 7): [9007199254740481, 9007199254736129, 9007199254735873, 9007199254728449, 9007199254725377, 9007199254705921, 9007199254705153, 9007199254703873],
+    (53, 8): [9007199254740481, 9007199254735873, 9007199254705153, 9007199254698497, 9007199254696961, 9007199254690817, 9007199254682113, 9007199254672897],
+    (53, 9): [9007199254735873, 9007199254705153, 9007199254696961, 9007199254690817, 9007199254637569, 9007199254614017, 9007199254594561, 9007199254571009],
+    (53, 10): [9007199254614017, 9007199254571009, 9007199254566913, 9007199254515713, 9007199254480897, 9007199254429697, 9007199254398977, 9007199254368257],
+    (53, 11): [9007199254614017, 9007199254515713, 9007199254429697, 9007199254368257, 9007199254364161, 9007199254331393, 9007199254327297, 9007199254294529],
+    (53, 12): [9007199254429697, 9007199254364161, 9007199254331393, 9007199254241281, 9007199254159361, 9007199253921793, 9007199253897217, 9007199253667841],
+    (53, 13): [9007199254429697, 9007199254364161, 9007199254331393, 9007199253921793, 9007199252840449, 9007199252807681, 9007199252545537, 9007199252119553],
+    (53, 14): [9007199253921793, 9007199252840449, 9007199252807681, 9007199252545537, 9007199252119553, 9007199251660801, 9007199250874369, 9007199250481153],
+    (53, 15): [9007199252840449, 9007199252119553, 9007199251660801, 9007199250874369, 9007199250481153, 9007199250087937, 9007199249891329, 9007199248777217],
+    (53, 16): [9007199252119553, 9007199249891329, 9007199247532033, 9007199247400961, 9007199247138817, 9007199245565953, 9007199243993089, 9007199242813441],
+    (54, 1): [18014398509481853, 18014398509481789, 18014398509481729, 18014398509481669, 18014398509481657, 18014398509481613, 18014398509481601, 18014398509481589],
+    (54, 2): [18014398509481729, 18014398509481657, 18014398509481601, 18014398509481417, 18014398509481217, 18014398509481201, 18014398509481009, 18014398509480977],
+    (54, 3): [18014398509481729, 18014398509481601, 18014398509481217, 18014398509481201, 18014398509481009, 18014398509480977, 18014398509480673, 18014398509480641],
+    (54, 4): [18014398509481729, 18014398509481601, 18014398509481217, 18014398509480673, 18014398509480641, 18014398509480001, 18014398509479809, 18014398509479233],
+    (54, 5): [18014398509481729, 18014398509481601, 18014398509481217, 18014398509480641, 18014398509480001, 18014398509479809, 18014398509479233, 18014398509479041],
+    (54, 6): [18014398509481729, 18014398509481601, 18014398509481217, 18014398509479809, 18014398509479041, 18014398509478529, 18014398509476737, 18014398509471361],
+    (54, 7): [18014398509481729, 18014398509481217, 18014398509471233, 18014398509454849, 18014398509450241, 18014398509445889, 18014398509441793, 18014398509440513],
+    (54, 8): [18014398509471233, 18014398509454849, 18014398509450241, 18014398509440513, 18014398509411841, 18014398509404161, 18014398509395969, 18014398509393409],
+    (54, 9): [18014398509450241, 18014398509404161, 18014398509395969, 18014398509355009, 18014398509339649, 18014398509319169, 18014398509309953, 18014398509293569],
+    (54, 10): [18014398509404161, 18014398509395969, 18014398509355009, 18014398509309953, 18014398509293569, 18014398509281281, 18014398509211649, 18014398509199361],
+    (54, 11): [18014398509404161, 18014398509395969, 18014398509355009, 18014398509309953, 18014398509293569, 18014398509281281, 18014398509211649, 18014398509199361],
+    (54, 12): [18014398509309953, 18014398509293569, 18014398509211649, 18014398508998657, 18014398508965889, 18014398508916737, 18014398508720129, 18014398508605441],
+    (54, 13): [18014398508400641, 18014398508138497, 18014398507892737, 18014398507794433, 18014398507614209, 18014398507302913, 18014398507220993, 18014398506876929],
+    (54, 14): [18014398508400641, 18014398508138497, 18014398507614209, 18014398507220993, 18014398506827777, 18014398506729473, 18014398505943041, 18014398504206337],
+    (54, 15): [18014398506729473, 18014398505943041, 18014398499848193, 18014398498799617, 18014398498275329, 18014398496440321, 18014398496243713, 18014398495457281],
+    (54, 16): [18014398506729473, 18014398505943041, 18014398496243713, 18014398495457281, 18014398492704769, 18014398492311553, 18014398491918337, 18014398487068673],
+    (55, 1): [36028797018963913, 36028797018963901, 36028797018963869, 36028797018963841, 36028797018963821, 36028797018963797, 36028797018963769, 36028797018963761],
+    (55, 2): [36028797018963913, 36028797018963841, 36028797018963769, 36028797018963761, 36028797018963689, 36028797018963481, 36028797018963457, 36028797018963137],
+    (55, 3): [36028797018963841, 36028797018963761, 36028797018963457, 36028797018963137, 36028797018962929, 36028797018962753, 36028797018961889, 36028797018961841],
+    (55, 4): [36028797018963841, 36028797018963457, 36028797018963137, 36028797018962753, 36028797018961889, 36028797018960961, 36028797018960737, 36028797018960353],
+    (55, 5): [36028797018963841, 36028797018963457, 36028797018963137, 36028797018962753, 36028797018960961, 36028797018960001, 36028797018959809, 36028797018959489],
+    (55, 6): [36028797018963841, 36028797018963457, 36028797018960001, 36028797018959489, 36028797018957697, 36028797018952193, 36028797018951553, 36028797018949249],
+    (55, 7): [36028797018963457, 36028797018952193, 36028797018947329, 36028797018946817, 36028797018946561, 36028797018940673, 36028797018934529, 36028797018927617],
+    (55, 8): [36028797018963457, 36028797018952193, 36028797018946561, 36028797018927617, 36028797018918401, 36028797018903041, 36028797018889729, 36028797018880513],
+    (55, 9): [36028797018946561, 36028797018864641, 36028797018823681, 36028797018820609, 36028797018802177, 36028797018789889, 36028797018746881, 36028797018713089],
+    (55, 10): [36028797018820609, 36028797018802177, 36028797018789889, 36028797018746881, 36028797018667009, 36028797018652673, 36028797018646529, 36028797018615809],
+    (55, 11): [36028797018820609, 36028797018746881, 36028797018652673, 36028797018615809, 36028797018529793, 36028797018279937, 36028797018267649, 36028797018181633],
+    (55, 12): [36028797018652673, 36028797018529793, 36028797018267649, 36028797017939969, 36028797017571329, 36028797017456641, 36028797017382913, 36028797017276417],
+    (55, 13): [36028797018652673, 36028797017571329, 36028797017456641, 36028797017276417, 36028797017014273, 36028797016719361, 36028797016588289, 36028797016522753],
+    (55, 14): [36028797017456641, 36028797016178689, 36028797014704129, 36028797014573057, 36028797014376449, 36028797014081537, 36028797013327873, 36028797013098497],
+    (55, 15): [36028797017456641, 36028797014704129, 36028797014573057, 36028797014376449, 36028797013327873, 36028797013000193, 36028797012606977, 36028797010444289],
+    (55, 16): [36028797014376449, 36028797013327873, 36028797010444289, 36028797005856769, 36028797001138177, 36028796997599233, 36028796996681729, 36028796992749569],
+    (56, 1): [72057594037927909, 72057594037927889, 72057594037927789, 72057594037927741, 72057594037927657, 72057594037927637, 72057594037927577, 72057594037927573],
+    (56, 2): [72057594037927889, 72057594037927657, 72057594037927577, 72057594037927513, 72057594037927441, 72057594037927193, 72057594037927081, 72057594037927073],
+    (56, 3): [72057594037927889, 72057594037927441, 72057594037927073, 72057594037926529, 72057594037926481, 72057594037926001, 72057594037925809, 72057594037925201],
+    (56, 4): [72057594037927073, 72057594037926529, 72057594037924993, 72057594037922401, 72057594037920833, 72057594037920737, 72057594037920481, 72057594037920289],
+    (56, 5): [72057594037926529, 72057594037924993, 72057594037920833, 72057594037918081, 72057594037916801, 72057594037915201, 72057594037913089, 72057594037912513],
+    (56, 6): [72057594037926529, 72057594037924993, 72057594037918081, 72057594037916801, 72057594037913089, 72057594037912321, 72057594037909889, 72057594037905793],
+    (56, 7): [72057594037913089, 72057594037912321, 72057594037904641, 72057594037897217, 72057594037896193, 72057594037895681, 72057594037894657, 72057594037890049],
+    (56, 8): [72057594037913089, 72057594037897217, 72057594037896193, 72057594037895681, 72057594037894657, 72057594037890049, 72057594037865473, 72057594037836289],
+    (56, 9): [72057594037897217, 72057594037896193, 72057594037890049, 72057594037865473, 72057594037795841, 72057594037789697, 72057594037774337, 72057594037773313],
+    (56, 10): [72057594037897217, 72057594037774337, 72057594037641217, 72057594037616641, 72057594037565441, 72057594037555201, 72057594037524481, 72057594037475329],
+    (56, 11): [72057594037641217, 72057594037616641, 72057594037555201, 72057594037370881, 72057594037358593, 72057594037350401, 72057594037338113, 72057594037288961],
+    (56, 12): [72057594037641217, 72057594037616641, 72057594037370881, 72057594037338113, 72057594037288961, 72057594037002241, 72057594036920321, 72057594036879361],
+    (56, 13): [72057594037616641, 72057594037370881, 72057594037338113, 72057594037288961, 72057594036879361, 72057594036551681, 72057594036338689, 72057594036256769],
+    (56, 14): [72057594037370881, 72057594037338113, 72057594036879361, 72057594036551681, 72057594036256769, 72057594035306497, 72057594034913281, 72057594033012737],
+    (56, 15): [72057594037338113, 72057594036879361, 72057594036551681, 72057594035306497, 72057594034913281, 72057594033012737, 72057594031964161, 72057594030981121],
+    (56, 16): [72057594036879361, 72057594035306497, 72057594034913281, 72057594030981121, 72057594029015041, 72057594027704321, 72057594023903233, 72057594021150721],
+    (57, 1): [144115188075855761, 144115188075855677, 144115188075855509, 144115188075855449, 144115188075855421, 144115188075855413, 144115188075855133, 144115188075855077],
+    (57, 2): [144115188075855761, 144115188075855449, 144115188075854929, 144115188075854689, 144115188075854393, 144115188075854129, 144115188075853873, 144115188075853681],
+    (57, 3): [144115188075855761, 144115188075854929, 144115188075854689, 144115188075854129, 144115188075853873, 144115188075853681, 144115188075853537, 144115188075853249],
+    (57, 4): [144115188075854689, 144115188075853537, 144115188075853249, 144115188075853153, 144115188075850657, 144115188075849889, 144115188075849569, 144115188075849217],
+    (57, 5): [144115188075853249, 144115188075849217, 144115188075845761, 144115188075843713, 144115188075842561, 144115188075840193, 144115188075840001, 144115188075838081],
+    (57, 6): [144115188075849217, 144115188075845761, 144115188075843713, 144115188075842561, 144115188075840001, 144115188075838081, 144115188075837569, 144115188075835777],
+    (57, 7): [144115188075849217, 144115188075842561, 144115188075840001, 144115188075835393, 144115188075831041, 144115188075828481, 144115188075827201, 144115188075818753],
+    (57, 8): [144115188075849217, 144115188075842561, 144115188075840001, 144115188075835393, 144115188075827201, 144115188075818497, 144115188075816449, 144115188075814913],
+    (57, 9): [144115188075842561, 144115188075835393, 144115188075827201, 144115188075814913, 144115188075805697, 144115188075799553, 144115188075749377, 144115188075744257],
+    (57, 10): [144115188075835393, 144115188075827201, 144115188075814913, 144115188075749377, 144115188075737089, 144115188075620353, 144115188075593729, 144115188075569153],
+    (57, 11): [144115188075835393, 144115188075827201, 144115188075814913, 144115188075749377, 144115188075737089, 144115188075593729, 144115188075569153, 144115188075196417],
+    (57, 12): [144115188075814913, 144115188075749377, 144115188075593729, 144115188075569153, 144115188075134977, 144115188074889217, 144115188074831873, 144115188074790913],
+    (57, 13): [144115188075593729, 144115188075134977, 144115188074889217, 144115188074790913, 144115188074463233, 144115188073480193, 144115188073218049, 144115188072890369],
+    (57, 14): [144115188075593729, 144115188075134977, 144115188071170049, 144115188070809601, 144115188070776833, 144115188070023169, 144115188068810753, 144115188068745217],
+    (57, 15): [144115188075593729, 144115188075134977, 144115188070809601, 144115188070023169, 144115188068319233, 144115188068253697, 144115188067729409, 144115188066091009],
+    (57, 16): [144115188075593729, 144115188068253697, 144115188067729409, 144115188062617601, 144115188059865089, 144115188057243649, 144115188050952193, 144115188049379329],
+    (58, 1): [288230376151711717, 288230376151711681, 288230376151711597, 288230376151711541, 288230376151711493, 288230376151711453, 288230376151711429, 288230376151711373],
+    (58, 2): [288230376151711681, 288230376151711369, 288230376151711297, 288230376151710953, 288230376151710857, 288230376151710833, 288230376151710697, 288230376151710593],
+    (58, 3): [288230376151711681, 288230376151711297, 288230376151710833, 288230376151710593, 288230376151710353, 288230376151709777, 288230376151709569, 288230376151709297],
+    (58, 4): [288230376151711681, 288230376151711297, 288230376151710593, 288230376151709569, 288230376151708577, 288230376151708513, 288230376151707937, 288230376151707841],
+    (58, 5): [288230376151711681, 288230376151711297, 288230376151710593, 288230376151709569, 288230376151707841, 288230376151704769, 288230376151704001, 288230376151703681],
+    (58, 6): [288230376151710593, 288230376151709569, 288230376151703681, 288230376151701889, 288230376151701121, 288230376151699073, 288230376151697921, 288230376151696513],
+    (58, 7): [288230376151697921, 288230376151691777, 288230376151690241, 288230376151687681, 288230376151683073, 288230376151680769, 288230376151680257, 288230376151677697],
+    (58, 8): [288230376151697921, 288230376151691777, 288230376151690241, 288230376151687681, 288230376151683073, 288230376151661569, 288230376151647233, 288230376151630849],
+    (58, 9): [288230376151690241, 288230376151683073, 288230376151661569, 288230376151647233, 288230376151630849, 288230376151625729, 288230376151612417, 288230376151601153],
+    (58, 10): [288230376151683073, 288230376151625729, 288230376151601153, 288230376151554049, 288230376151545857, 288230376151529473, 288230376151422977, 288230376151388161],
+    (58, 11): [288230376151683073, 288230376151625729, 288230376151601153, 288230376151388161, 288230376151191553, 288230376151130113, 288230376150945793, 288230376150876161],
+    (58, 12): [288230376151130113, 288230376150876161, 288230376150802433, 288230376150712321, 288230376150630401, 288230376150089729, 288230376149999617, 288230376149975041],
+    (58, 13): [288230376150876161, 288230376150712321, 288230376150630401, 288230376150089729, 288230376149975041, 288230376149794817, 288230376149630977, 288230376148549633],
+    (58, 14): [288230376150630401, 288230376149975041, 288230376147582977, 288230376147386369, 288230376147320833, 288230376145453057, 288230376144568321, 288230376143781889],
+    (58, 15): [288230376147582977, 288230376147386369, 288230376147320833, 288230376144568321, 288230376143781889, 288230376143650817, 288230376138735617, 288230376135917569],
+    (58, 16): [288230376147386369, 288230376138735617, 288230376135196673, 288230376132182017, 288230376131788801, 288230376129691649, 288230376128643073, 288230376126545921],
+    (59, 1): [576460752303423433, 576460752303423389, 576460752303423061, 576460752303422881, 576460752303422801, 576460752303422617, 576460752303422557, 576460752303422533],
+    (59, 2): [576460752303423433, 576460752303422881, 576460752303422801, 576460752303422617, 576460752303422369, 576460752303422281, 576460752303422249, 576460752303422153],
+    (59, 3): [576460752303422881, 576460752303422801, 576460752303422369, 576460752303421649, 576460752303421441, 576460752303421393, 576460752303421217, 576460752303421169],
+    (59, 4): [576460752303422881, 576460752303422369, 576460752303421441, 576460752303421217, 576460752303421121, 576460752303420833, 576460752303419393, 576460752303419233],
+    (59, 5): [576460752303421441, 576460752303421121, 576460752303419393, 576460752303418817, 576460752303418369, 576460752303418049, 576460752303415297, 576460752303414977],
+    (59, 6): [576460752303421441, 576460752303419393, 576460752303418369, 576460752303415297, 576460752303408641, 576460752303408257, 576460752303408001, 576460752303406849],
+    (59, 7): [576460752303421441, 576460752303419393, 576460752303418369, 576460752303415297, 576460752303408641, 576460752303406849, 576460752303401729, 576460752303396097],
+    (59, 8): [576460752303421441, 576460752303419393, 576460752303418369, 576460752303415297, 576460752303408641, 576460752303395329, 576460752303387649, 576460752303387137],
+    (59, 9): [576460752303421441, 576460752303419393, 576460752303418369, 576460752303415297, 576460752303387649, 576460752303385601, 576460752303384577, 576460752303354881],
+    (59, 10): [576460752303421441, 576460752303419393, 576460752303415297, 576460752303384577, 576460752303353857, 576460752303347713, 576460752303261697, 576460752303237121],
+    (59, 11): [576460752303419393, 576460752303415297, 576460752303353857, 576460752303210497, 576460752303198209, 576460752303185921, 576460752303136769, 576460752303046657],
+    (59, 12): [576460752303415297, 576460752303210497, 576460752303185921, 576460752303136769, 576460752303046657, 576460752302596097, 576460752302579713, 576460752302530561],
+    (59, 13): [576460752303210497, 576460752303046657, 576460752302473217, 576460752302161921, 576460752302080001, 576460752301785089, 576460752301637633, 576460752301391873],
+    (59, 14): [576460752302473217, 576460752302080001, 576460752301785089, 576460752301391873, 576460752301228033, 576460752301096961, 576460752300310529, 576460752300113921],
+    (59, 15): [576460752301785089, 576460752301391873, 576460752300015617, 576460752298835969, 576460752298180609, 576460752293134337, 576460752291954689, 576460752290775041],
+    (59, 16): [576460752300015617, 576460752298835969, 576460752298180609, 576460752289923073, 576460752289529857, 576460752289005569, 576460752286253057, 576460752284418049],
+    (60, 1): [1152921504606846869, 1152921504606846797, 1152921504606846697, 1152921504606846581, 1152921504606846577, 1152921504606846397, 1152921504606846281, 1152921504606846269],
+    (60, 2): [1152921504606846697, 1152921504606846577, 1152921504606846281, 1152921504606846097, 1152921504606845993, 1152921504606845977, 1152921504606845849, 1152921504606845777],
+    (60, 3): [1152921504606846577, 1152921504606846097, 1152921504606845777, 1152921504606845473, 1152921504606844913, 1152921504606844849, 1152921504606844513, 1152921504606844417],
+    (60, 4): [1152921504606845473, 1152921504606844513, 1152921504606844417, 1152921504606844289, 1152921504606843233, 1152921504606843073, 1152921504606842753, 1152921504606841793],
+    (60, 5): [1152921504606844417, 1152921504606844289, 1152921504606843073, 1152921504606842753, 1152921504606841793, 1152921504606837377, 1152921504606836929, 1152921504606836161],
+    (60, 6): [1152921504606844417, 1152921504606844289, 1152921504606842753, 1152921504606837377, 1152921504606832769, 1152921504606832001, 1152921504606831233, 1152921504606830593],
+    (60, 7): [1152921504606844417, 1152921504606830593, 1152921504606827009, 1152921504606823681, 1152921504606815233, 1152921504606811393, 1152921504606798337, 1152921504606796289],
+    (60, 8): [1152921504606844417, 1152921504606830593, 1152921504606827009, 1152921504606815233, 1152921504606798337, 1152921504606796289, 1152921504606791681, 1152921504606790657],
+    (60, 9): [1152921504606830593, 1152921504606815233, 1152921504606791681, 1152921504606790657, 1152921504606757889, 1152921504606748673, 1152921504606733313, 1152921504606704641],
+    (60, 10): [1152921504606830593, 1152921504606791681, 1152921504606748673, 1152921504606683137, 1152921504606631937, 1152921504606601217, 1152921504606588929, 1152921504606584833],
+    (60, 11): [1152921504606830593, 1152921504606748673, 1152921504606683137, 1152921504606601217, 1152921504606588929, 1152921504606584833, 1152921504606515201, 1152921504606441473],
+    (60, 12): [1152921504606830593, 1152921504606748673, 1152921504606683137, 1152921504606601217, 1152921504606584833, 1152921504606109697, 1152921504605962241, 1152921504605913089],
+    (60, 13): [1152921504606830593, 1152921504606748673, 1152921504606683137, 1152921504606601217, 1152921504606584833, 1152921504606109697, 1152921504605962241, 1152921504605913089],
+    (60, 14): [1152921504606748673, 1152921504606683137, 1152921504606584833, 1152921504605962241, 1152921504604979201, 1152921504600260609, 1152921504599080961, 1152921504598720513],
+    (60, 15): [1152921504606584833, 1152921504598720513, 1152921504597016577, 1152921504595968001, 1152921504595640321, 1152921504593412097, 1152921504592822273, 1152921504592429057],
+    (60, 16): [1152921504606584833, 1152921504598720513, 1152921504597016577, 1152921504595968001, 1152921504592822273, 1152921504592429057, 1152921504589938689, 1152921504586530817],
+    (61, 1): [2305843009213693921, 2305843009213693693, 2305843009213693669, 2305843009213693613, 2305843009213693561, 2305843009213693549, 2305843009213693421, 2305843009213693373],
+    (61, 2): [2305843009213693921, 2305843009213693561, 2305843009213693193, 2305843009213693153, 2305843009213692937, 2305843009213692737, 2305843009213692601, 2305843009213692409],
+    (61, 3): [2305843009213693921, 2305843009213693153, 2305843009213692737, 2305843009213692097, 2305843009213691569, 2305843009213691041, 2305843009213690801, 2305843009213690769],
+    (61, 4): [2305843009213693921, 2305843009213693153, 2305843009213692737, 2305843009213692097, 2305843009213691041, 2305843009213690657, 2305843009213689601, 2305843009213689377],
+    (61, 5): [2305843009213692737, 2305843009213692097, 2305843009213689601, 2305843009213689089, 2305843009213687297, 2305843009213686401, 2305843009213685569, 2305843009213685441],
+    (61, 6): [2305843009213689601, 2305843009213689089, 2305843009213687297, 2305843009213686401, 2305843009213685377, 2305843009213683713, 2305843009213683073, 2305843009213682689],
+    (61, 7): [2305843009213689601, 2305843009213689089, 2305843009213687297, 2305843009213683713, 2305843009213682689, 2305843009213675777, 2305843009213673729, 2305843009213666049],
+    (61, 8): [2305843009213687297, 2305843009213683713, 2305843009213682689, 2305843009213654529, 2305843009213649921, 2305843009213644289, 2305843009213622273, 2305843009213621249],
+    (61, 9): [2305843009213683713, 2305843009213682689, 2305843009213649921, 2305843009213622273, 2305843009213621249, 2305843009213616129, 2305843009213606913, 2305843009213557761],
+    (61, 10): [2305843009213683713, 2305843009213622273, 2305843009213616129, 2305843009213554689, 2305843009213501441, 2305843009213489153, 2305843009213470721, 2305843009213444097],
+    (61, 11): [2305843009213616129, 2305843009213554689, 2305843009213501441, 2305843009213489153, 2305843009213444097, 2305843009213317121, 2305843009213243393, 2305843009213173761],
+    (61, 12): [2305843009213554689, 2305843009213489153, 2305843009213317121, 2305843009213243393, 2305843009213145089, 2305843009213120513, 2305843009212997633, 2305843009212694529],
+    (61, 13): [2305843009213317121, 2305843009213120513, 2305843009212694529, 2305843009212399617, 2305843009211662337, 2305843009211596801, 2305843009211400193, 2305843009210580993],
+    (61, 14): [2305843009211662337, 2305843009211596801, 2305843009211400193, 2305843009210580993, 2305843009210515457, 2305843009210023937, 2305843009208713217, 2305843009208123393],
+    (61, 15): [2305843009211662337, 2305843009211596801, 2305843009211400193, 2305843009210023937, 2305843009208713217, 2305843009208123393, 2305843009207468033, 2305843009202159617],
+    (61, 16): [2305843009211596801, 2305843009210023937, 2305843009208713217, 2305843009202159617, 2305843009201242113, 2305843009200586753, 2305843009196916737, 2305843009195868161],
+    (62, 1): [4611686018427387817, 4611686018427387761, 4611686018427387737, 4611686018427387733, 4611686018427387709, 4611686018427387701, 4611686018427387617, 4611686018427387461],
+    (62, 2): [4611686018427387817, 4611686018427387761, 4611686018427387737, 4611686018427387617, 4611686018427387409, 4611686018427387329, 4611686018427387241, 4611686018427387113],
+    (62, 3): [4611686018427387761, 4611686018427387617, 4611686018427387409, 4611686018427387329, 4611686018427387073, 4611686018427386897, 4611686018427386081, 4611686018427385553],
+    (62, 4): [4611686018427387617, 4611686018427387329, 4611686018427387073, 4611686018427386081, 4611686018427385537, 4611686018427384641, 4611686018427384353, 4611686018427382913],
+    (62, 5): [4611686018427387329, 4611686018427387073, 4611686018427385537, 4611686018427384641, 4611686018427382913, 4611686018427382849, 4611686018427379201, 4611686018427379009],
+    (62, 6): [4611686018427382913, 4611686018427379201, 4611686018427378049, 4611686018427375361, 4611686018427373313, 4611686018427372289, 4611686018427372161, 4611686018427370369],
+    (62, 7): [4611686018427379201, 4611686018427375361, 4611686018427373313, 4611686018427372289, 4611686018427366401, 4611686018427365377, 4611686018427361793, 4611686018427359489],
+    (62, 8): [4611686018427379201, 4611686018427366401, 4611686018427365377, 4611686018427361793, 4611686018427355649, 4611686018427337217, 4611686018427336193, 4611686018427326977],
+    (62, 9): [4611686018427366401, 4611686018427365377, 4611686018427322369, 4611686018427289601, 4611686018427286529, 4611686018427277313, 4611686018427246593, 4611686018427228161],
+    (62, 10): [4611686018427365377, 4611686018427322369, 4611686018427289601, 4611686018427277313, 4611686018427246593, 4611686018427228161, 4611686018427215873, 4611686018427199489],
+    (62, 11): [4611686018427322369, 4611686018427289601, 4611686018427277313, 4611686018427228161, 4611686018427215873, 4611686018427199489, 4611686018426953729, 4611686018426933249],
+    (62, 12): [4611686018427322369, 4611686018427289601, 4611686018427215873, 4611686018427199489, 4611686018426953729, 4611686018426658817, 4611686018426454017, 4611686018426265601],
+    (62, 13): [4611686018427322369, 4611686018427289601, 4611686018426454017, 4611686018426257409, 4611686018425815041, 4611686018424881153, 4611686018424733697, 4611686018424422401],
+    (62, 14): [4611686018427322369, 4611686018427289601, 4611686018425815041, 4611686018424733697, 4611686018423881729, 4611686018423390209, 4611686018423062529, 4611686018422669313],
+    (62, 15): [4611686018427322369, 4611686018425815041, 4611686018423390209, 4611686018423062529, 4611686018422669313, 4611686018421293057, 4611686018418147329, 4611686018416115713],
+    (62, 16): [4611686018425815041, 4611686018423062529, 4611686018422669313, 4611686018416115713, 4611686018408120321, 4611686018406940673, 4611686018406678529, 4611686018405498881],
+}
@@ -0,0 +1,77 @@
+import os
+import math
+import hashlib
+import functools
+from decimal import Decimal, localcontext
+import numpy as np
+
+# whole-polynomial samplers driven by SHAKE expansion of a 32-byte seed
+# every (seed, domain) pair gives an independent, reproducible stream, so a
+# uniform polynomial can be stored and sent as its seed alone
+# public uniform values use SHAKE-128, secret ternary / bounded values SHAKE-256
+
+_SEED_BYTES = 32
+
+def _new_seed() -> bytes:
+    return os.urandom(_SEED_BYTES)
+
+def _expand(seed : bytes, domain : int, nbytes : int, xof=hashlib.shake_256) -> bytes:
+    if len(seed) != _SEED_BYTES:
+        raise Exception(f"seed must be {_SEED_BYTES} bytes")
+    return xof(seed + domain.to_bytes(4, "little")).digest(nbytes)
+
+def _rejection_sample(seed : bytes, domain : int, n : int, bits : int, limit : int, xof=hashlib.shake_256) -> np.ndarray:
+    """n words of `bits` random bits each, keeping only those below limit"""
+    word_bytes = 8 if bits > 32 else 4
+    dtype = np.uint64 if word_bytes == 8 else np.uint32
+    mask = dtype((1 << bits) - 1)
+    count = n + n // 4 + 16
+    while True:
+        words = np.frombuffer(_expand(seed, domain, count * word_bytes, xof), dtype=dtype) & mask
+        words = words[words < dtype(limit)]
+        if len(words) >= n:
+            return words[:n].astype(np.uint64)
+        count *= 2
+
+def _sample_uniform(seed : bytes, domain : int, n : int, q : int) -> np.ndarray:
+    """uniform residues in [0, q) as a uint64 array"""
+    return _rejection_sample(seed, domain, n, q.bit_length(), q, hashlib.shake_128)
+
+def _sample_bounded(seed : bytes, domain : int, n : int, bound : int) -> np.ndarray:
+    """uniform integers in [-bound, bound] as an int64 array"""
+    if bound == 0:
+        return np.zeros(n, dtype=np.int64)
+    width = 2 * bound + 1
+    return _rejection_sample(seed, domain, n, width.bit_length(), width).astype(np.int64) - bound
+
+def _sample_ternary(seed : bytes, domain : int, n : int) -> np.ndarray:
+    """uniform integers in {-1, 0, 1} as an int64 array"""
+    return _sample_bounded(seed, domain, n, 1)
+
+# cumulative distribution table of |x| for the discrete gaussian rho(x) = exp(-x^2 / (2 sigma^2))
+# truncated at tail * sigma: entry k is P(|x| <= k) scaled to 2^63, built in 40 digit decimals
+@functools.lru_cache(maxsize=None)
+def _gaussian_cdt(sigma : float, tail : float) -> np.ndarray:
+    if sigma <= 0 or tail <= 0:
+        raise Exception("sigma and tail must be positive")
+    bound = math.ceil(tail * sigma)
+    with localcontext() as ctx:
+        ctx.prec = 40
+        two_var = 2 * Decimal(sigma) ** 2
+        rho = [ (Decimal(-k * k) / two_var).exp() * (1 if k == 0 else 2) for k in range(bound + 1) ]
+        total = sum(rho)
+        ret, acc = [], Decimal(0)
+        for weight in rho:
+            acc += weight
+            ret.append(min(int(acc / total * (1 << 63)), (1 << 63) - 1))
+    ret[-1] = (1 << 63) - 1
+    table = np.array(ret, dtype=np.uint64)
+    table.flags.writeable = False
+    return table
+
+def _sample_gaussian(seed : bytes, domain : int, n : int, cdt : np.ndarray) -> np.ndarray:
+    """discrete gaussian integers in [-(len(cdt) - 1), len(cdt) - 1] as an int64 array"""
+    words = np.frombuffer(_expand(seed, domain, 8 * n), dtype=np.uint64)
+    magnitude = np.searchsorted(cdt, words >> np.uint64(1), side="left").astype(np.int64)
+    sign = (words & np.uint64(1)).astype(np.int64)
+    return magnitude * (1 - 2 * sign)
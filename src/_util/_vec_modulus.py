@@ -0,0 +1,152 @@
+import numpy as np
+
+# modular arithmetic on numpy uint64 arrays
+# every modulus q must satisfy q < 2^62 so that 2q, 4q fit in a uint64 word
+# q and its constants are passed as np.uint64 (scalar or broadcastable array)
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+
+def _check_modulus(q : int):
+    if q <= 2 or q >= (1 << 62) or q % 2 == 0:
+        raise Exception(f"modulus {q} is not supported (odd, 2 < q < 2^62)")
+
+def _mont_constants(q : int) -> tuple[np.uint64, np.uint64, np.uint64]:
+    """
+    Montgomery constants for R = 2^64
+    - return (q, -q^-1 mod R, R^2 mod q)
+    """
+    _check_modulus(q)
+    r = 1 << 64
+    q_neg_inv = (-pow(q, -1, r)) % r
+    r2 = (r * r) % q
+    return np.uint64(q), np.uint64(q_neg_inv), np.uint64(r2)
+
+def _mulhi(a, b):
+    """high 64 bits of a * b, computed with 32-bit limbs"""
+    a_lo, a_hi = a & _MASK32, a >> _SHIFT32
+    b_lo, b_hi = b & _MASK32, b >> _SHIFT32
+    lo_lo = a_lo * b_lo
+    lo_hi = a_lo * b_hi
+    hi_lo = a_hi * b_lo
+    mid = (lo_lo >> _SHIFT32) + (lo_hi & _MASK32) + (hi_lo & _MASK32)
+    return a_hi * b_hi + (lo_hi >> _SHIFT32) + (hi_lo >> _SHIFT32) + (mid >> _SHIFT32)
+
+def _mont_reduce(hi, lo, q, q_neg_inv):
+    """
+    Montgomery reduction of (hi * 2^64 + lo) < q * 2^64
+    - return (hi * 2^64 + lo) * 2^-64 mod q in [0, 2q)
+    """
+    m = lo * q_neg_inv
+    return hi + _mulhi(m, q) + (lo != 0).astype(np.uint64)
+
+def _mont_mul(a, b, q, q_neg_inv):
+    """a * b * 2^-64 mod q in [0, 2q), a * b < q * 2^64"""
+    return _mont_reduce(_mulhi(a, b), a * b, q, q_neg_inv)
+
+def _shoup_companion(w : int, q : int) -> int:
+    """Shoup companion floor(w * 2^64 / q) of a fixed multiplicand w in [0, q)"""
+    return (w << 64) // q
+
+def _shoup_mul(a, w, w_shoup, q):
+    """
+    a * w mod q in [0, 2q) for any uint64 a, with w_shoup = floor(w * 2^64 / q)
+    - the quotient estimate is off by at most one, so the wrapping difference is exact
+    """
+    return a * w - _mulhi(a, w_shoup) * q
+
+def _reduce_2q(a, q):
+    """[0, 2q) -> [0, q)"""
+    return a - q * (a >= q)
+
+def _reduce_lazy(a, q, bound : int):
+    """[0, bound * q) -> [0, q)"""
+    if bound <= 2:
+        return _reduce_2q(a, q)
+    return a % q
+
+def _lazy_limit(q : int) -> int:
+    """largest k with k * q < 2^64, how many multiples of q an unreduced word may hold"""
+    return ((1 << 64) - 1) // q
+
+# more folds than this are slower than the two montgomery products of _mul_mod_lazy
+_SPECIAL_FOLDS = 2
+
+def _mulhi_32(a, d):
+    """high 64 bits of a * d for d < 2^32"""
+    return ((a >> _SHIFT32) * d + (((a & _MASK32) * d) >> _SHIFT32)) >> _SHIFT32
+
+def _special_constants(q : int):
+    """
+    shift-add reduction for special primes q = 2^k - c * 2^m + 1 (small c)
+    - 2^k = d (mod q) with d = 2^k - q = c * 2^m - 1, so x = (x >> k) * d + (x & (2^k - 1)) (mod q)
+    - a product below q * 2^64 takes `wide` folds that stay above 2^64, one fold into a word
+      and `folds` more to reach [0, 2q)
+    - return (k, 2^k - 1, d, 64 - k, wide, folds), the first four as np.uint64,
+      None when d is too large for the folds to pay off
+    """
+    _check_modulus(q)
+    k = q.bit_length()
+    d = (1 << k) - q
+    if d == 0 or d >= (1 << 32):
+        return None
+    mask = (1 << k) - 1
+    # largest value after each fold, starting from the largest lazy product
+    v = (q << 64) - 1
+    wide = 0
+    while (v >> k) * d + mask >= (1 << 64):
+        v = (v >> k) * d + mask
+        wide += 1
+        if wide > _SPECIAL_FOLDS:
+            return None
+    v = (v >> k) * d + mask
+    folds = 0
+    while v >= 2 * q:
+        v = (v >> k) * d + mask
+        folds += 1
+        if wide + folds > _SPECIAL_FOLDS:
+            return None
+    return np.uint64(k), np.uint64(mask), np.uint64(d), np.uint64(64 - k), wide, folds
+
+def _special_mul_lazy(a, b, special):
+    """a * b mod q in [0, 2q), a * b < q * 2^64, special = _special_constants(q)"""
+    k, mask, d, sk, wide, folds = special
+    hi, lo = _mulhi(a, b), a * b
+    for _ in range(wide):
+        x0 = lo & mask
+        x1 = (hi << sk) | (lo >> k)
+        lo = x1 * d + x0
+        hi = _mulhi_32(x1, d) + (lo < x0)
+    x = ((hi << sk) | (lo >> k)) * d + (lo & mask)
+    for _ in range(folds):
+        x = (x >> k) * d + (x & mask)
+    return x
+
+def _mul_mod_lazy(a, b, q, q_neg_inv, r2, special=None):
+    """a * b mod q in [0, 2q), a * b < q * 2^64"""
+    if special != None:
+        return _special_mul_lazy(a, b, special)
+    return _mont_mul(_mont_mul(a, b, q, q_neg_inv), r2, q, q_neg_inv)
+
+def _mul_mod(a, b, q, q_neg_inv, r2, special=None):
+    """a * b mod q in [0, q), a, b in [0, q)"""
+    return _reduce_2q(_mul_mod_lazy(a, b, q, q_neg_inv, r2, special), q)
+
+def _add_mod(a, b, q):
+    return _reduce_2q(a + b, q)
+
+def _sub_mod(a, b, q):
+    return _reduce_2q(a + (q - b), q)
+
+def _neg_mod(a, q):
+    return (q - a) * (a != 0)
+
+def _centered(a, q):
+    """residues a in [0, q) -> int64 representatives in (-q/2, q/2]"""
+    signed = a.astype(np.int64)
+    return np.where(a > (q >> np.uint64(1)), signed - q.astype(np.int64), signed)
+
+def _centered_lift(a, t, q):
+    """residues a in [0, t) read as centered (-t/2, t/2] and reduced into [0, q)"""
+    negative = a > (t >> np.uint64(1))
+    return np.where(negative, (q - (t - a) % q) % q, a % q)
@@ -0,0 +1,84 @@
+from he._ntt import _NTT_Engine, _NTT_Engine_Numpy, _NTT_Engine_Shoup
+from he.galois_ring.rns_poly import RNS_Poly
+from _util import _prime as prime
+from _util import _vec_modulus
+import numpy as np
+import time
+import random
+
+def _timeit(func, repeat):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        end = time.perf_counter()
+        if best == None or end - start < best:
+            best = end - start
+    return best
+
+# forward + inverse NTT of a batch of polynomials, best of `repeat` runs
+def ntt_benchmark(log_n_list=[12, 13, 14, 15], bit_length=60, batch=4, repeat=3):
+    print("####################################################")
+    print("#                  NTT Benchmark                   #")
+    print("####################################################\n")
+
+    engines = [("python", _NTT_Engine), ("numpy", _NTT_Engine_Numpy), ("shoup", _NTT_Engine_Shoup)]
+    for log_n in log_n_list:
+        n = 2 ** log_n
+        q = prime._generate_prime(bit_length, n)
+        block = [[random.randint(0, q - 1) for _ in range(n)] for _ in range(batch)]
+        print(f"N = 2^{log_n}, q = {q.bit_length()} bit, batch = {batch}")
+        base_time = None
+        for name, engine_class in engines:
+            engine = engine_class(n, q)
+            work = [a.copy() for a in block]
+            def run():
+                engine._transform_to_ntt_form_batch(work)
+                engine._transform_from_ntt_form_batch(work)
+            elapsed = _timeit(run, 1 if name == "python" else repeat)
+            if work != block:
+                print(f"    - {name}: round trip failed")
+            if base_time == None:
+                base_time = elapsed
+            print(f"    - {name:8s} {elapsed * 1000:10.2f} ms  (x{base_time / elapsed:.1f})")
+        print()
+
+# generic (random) primes against special primes 2^k - c * 2^m + 1 of the same bit length:
+# numpy NTT round trip and a lazy pointwise product of an (L, N) limb matrix, best of `repeat` runs
+def special_prime_benchmark(log_n_list=[12, 13, 14], bit_lengths=[45, 50, 60], batch=4, repeat=5):
+    print("####################################################")
+    print("#             Special Prime Benchmark              #")
+    print("####################################################\n")
+
+    for log_n in log_n_list:
+        n = 2 ** log_n
+        special = prime._generate_rns_bases(bit_lengths, n, "special")
+        generic = []
+        while len(generic) < len(bit_lengths):
+            q = prime._generate_prime(bit_lengths[len(generic)], n, "random", generic)
+            if _vec_modulus._special_constants(q) == None:
+                generic.append(q)
+        print(f"N = 2^{log_n}, q = {bit_lengths} bit, batch = {batch}")
+        times = {}
+        for name, rns_base in [("generic", generic), ("special", special)]:
+            rns_poly = RNS_Poly(rns_base, n)
+            block = np.stack([ np.array([random.randrange(q) for _ in range(n)], dtype=np.uint64)\
+                for q in rns_base ])
+            engines = [ _NTT_Engine_Numpy(n, q) for q in rns_base ]
+            work = [ np.tile(row, (batch, 1)) for row in block ]
+            def ntt():
+                for engine, a in zip(engines, work):
+                    engine._forward(a)
+                    engine._inverse(a)
+            def mul():
+                _vec_modulus._mul_mod_lazy(block, block, rns_poly._q, rns_poly._q_neg_inv, rns_poly._r2,\
+                    rns_poly._special)
+            times[name] = (_timeit(ntt, repeat), _timeit(mul, repeat))
+        for idx, label in enumerate(["ntt", "mul"]):
+            base, fast = times["generic"][idx], times["special"][idx]
+            print(f"    - {label}  generic {base * 1000:8.2f} ms  special {fast * 1000:8.2f} ms  (x{base / fast:.2f})")
+        print()
+
+if __name__ == "__main__":
+    ntt_benchmark()
+    special_prime_benchmark()
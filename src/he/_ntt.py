@@ -1,82 +1,368 @@
+import threading
+from collections import OrderedDict
+try:
+    import numpy as np
+    from _util import _vec_modulus
+except ImportError:
+    np = None
+
 class _NTT_Engine:
     # n: poly_modulus, q: coeff_modulus
     def __init__(self, n, q):
         self._n = n
         self._q = q
-        g = self._find_primitive_root(q)
-        self._psi = pow(g, (q - 1) // (2 * n), q)
+        self._psi = self._find_primitive_2n_root(n, q)
         self._psi_inv = pow(self._psi, q - 2, q)
         self._n_inv = pow(n, q - 2, q)
         self._tables = [0] * n
         self._inv_tables = [0] * n
         self._precompute_tables()
 
-    # find generator of finite field Z_q
-    def _find_primitive_root(self, q):
-        phi = q - 1
-        factors = [2]
-        d = 3
-        temp = phi // 2
-        while d * d <= temp:
-            if temp % d == 0:
-                factors.append(d)
-                while temp % d == 0: temp //= d
-            d += 2
-        if temp > 1: factors.append(temp)
-        for res in range(2, q):
-            if all(pow(res, phi // f, q) != 1 for f in factors):
-                return res
+    # engine state for HE_Parameter.save: python ints and lists, numpy scalars and arrays
+    def _export(self) -> dict:
+        return dict(vars(self))
+
+    # rebuild an engine from exported state without recomputing any table,
+    # arrays are used as given (HE_Parameter.load passes read-only memory maps)
+    @classmethod
+    def _restore(cls, state : dict):
+        ret = cls.__new__(cls)
+        for name, value in state.items():
+            setattr(ret, name, value)
+        return ret
+
+    # find primitive 2n-th root of unity of Z_q (q = 1 mod 2n)
+    # psi = x^((q-1)/2n) has order dividing 2n, and 2n is a power of two,
+    # so psi is primitive iff psi^n = -1, i.e. iff x is a quadratic non-residue
+    def _find_primitive_2n_root(self, n, q):
+        if (q - 1) % (2 * n) != 0:
+            raise Exception(f"{q} is not NTT-friendly (q != 1 mod {2 * n})")
+        exp = (q - 1) // (2 * n)
+        for x in range(2, q):
+            psi = pow(x, exp, q)
+            if pow(psi, n, q) == q - 1:
+                return psi
         return None
     
+    # tables[i] = psi^bitrev(i), powers built by one multiplication each
     def _precompute_tables(self):
-        for i in range(self._n):
-            rev_i = self._bit_rev_val(i, self._n.bit_length() - 1)
-            self._tables[i] = pow(self._psi, rev_i, self._q)
-            self._inv_tables[i] = pow(self._psi_inv, rev_i, self._q)
+        n, q = self._n, self._q
+        rev = self._bit_rev_table(n)
+        psi_pow, psi_inv_pow = 1, 1
+        for i in range(n):
+            self._tables[rev[i]] = psi_pow
+            self._inv_tables[rev[i]] = psi_inv_pow
+            psi_pow = (psi_pow * self._psi) % q
+            psi_inv_pow = (psi_inv_pow * self._psi_inv) % q
     
-    def _bit_rev_val(self, i, bits):
-        res = 0
-        for _ in range(bits):
-            res = (res << 1) | (i & 1)
-            i >>= 1
-        return res
+    # bit-reversal permutation of range(n), rev[i] built from rev[i >> 1]
+    def _bit_rev_table(self, n):
+        bits = n.bit_length() - 1
+        rev = [0] * n
+        for i in range(1, n):
+            rev[i] = (rev[i >> 1] >> 1) | ((i & 1) << (bits - 1))
+        return rev
     
     def _transform_to_ntt_form(self, a):
         """Cooley-Tukey NTT: Input(Normal) -> Output(Bit-reversed)"""
+        return self._transform_to_ntt_form_batch([a])[0]
+    
+    def _transform_from_ntt_form(self, a):
+        """Gentleman-Sande INTT: Input(Bit-reversed) -> Output(Normal)"""
+        return self._transform_from_ntt_form_batch([a])[0]
+
+    # block: list of polynomials (length n) sharing modulus q, transformed in place
+    # each twiddle is loaded once per butterfly group and applied to the whole block
+    def _transform_to_ntt_form_batch(self, block):
         n = self._n
+        q = self._q
         t = n
         m = 1
         while m < n:
             t >>= 1
             for i in range(m):
                 w = self._tables[m + i]
-                for j in range(2 * i * t, (2 * i + 1) * t):
-                    u = a[j]
-                    v = (a[j + t] * w) % self._q
-                    a[j] = (u + v) % self._q
-                    a[j + t] = (u - v + self._q) % self._q
+                for a in block:
+                    for j in range(2 * i * t, (2 * i + 1) * t):
+                        u = a[j]
+                        v = (a[j + t] * w) % q
+                        a[j] = (u + v) % q
+                        a[j + t] = (u - v + q) % q
             m <<= 1
-        return a
+        return block
     
-    def _transform_from_ntt_form(self, a):
-        """Gentleman-Sande INTT: Input(Bit-reversed) -> Output(Normal)"""
+    def _transform_from_ntt_form_batch(self, block):
         n = self._n
+        q = self._q
         t = 1
         m = n >> 1
         while m > 0:
             for i in range(m):
                 w = self._inv_tables[m + i]
-                for j in range(2 * i * t, (2 * i + 1) * t):
-                    u = a[j]
-                    v = a[j + t]
-                    a[j] = (u + v) % self._q
-                    a[j + t] = ((u - v + self._q) * w) % self._q
+                for a in block:
+                    for j in range(2 * i * t, (2 * i + 1) * t):
+                        u = a[j]
+                        v = a[j + t]
+                        a[j] = (u + v) % q
+                        a[j + t] = ((u - v + q) * w) % q
             t <<= 1
             m >>= 1
-        for i in range(n):
-            a[i] = (a[i] * self._n_inv) % self._q
+        for a in block:
+            for i in range(n):
+                a[i] = (a[i] * self._n_inv) % q
+        return block
+
+    # array interface used by Poly
+    # a: uint64 array of shape (batch, n) in [0, q), transformed in place
+    def _forward(self, a):
+        a[...] = self._transform_to_ntt_form_batch(a.tolist())
+        return a
+
+    def _inverse(self, a):
+        a[...] = self._transform_from_ntt_form_batch(a.tolist())
+        return a
+
+class _NTT_Engine_Numpy(_NTT_Engine):
+    """
+    same transform as _NTT_Engine, but every butterfly stage is one uint64 array operation
+    - twiddles are kept in Montgomery form (w * 2^64 mod q), products use 32-bit limb mulhi
+    - for special primes q = 2^k - c * 2^m + 1 twiddles stay plain and products use
+      shift-add reduction instead (_vec_modulus._special_constants)
+    - output is bit-identical to _NTT_Engine (canonical residues in [0, q))
+    """
+    def __init__(self, n, q):
+        if np is None:
+            raise Exception("numpy is required for the numpy ntt backend")
+        super().__init__(n, q)
+        self._np_q, self._q_neg_inv, self._r2 = _vec_modulus._mont_constants(q)
+        self._special = _vec_modulus._special_constants(q)
+        self._mont_tables = self._to_mont(self._tables)
+        self._mont_inv_tables = self._to_mont(self._inv_tables)
+        self._mont_n_inv = self._to_mont([self._n_inv])[0]
+
+    # python int lists (possibly negative, centered) -> uint64 array in [0, q)
+    def _to_array(self, block):
+        try:
+            return (np.array(block, dtype=np.int64) % self._q).astype(np.uint64)
+        except OverflowError:
+            return np.array([[e % self._q for e in a] for a in block], dtype=np.uint64)
+
+    # w -> w * 2^64 mod q, one montgomery product with R^2 (w itself for special primes)
+    def _to_mont(self, table):
+        if self._special != None:
+            return np.array(table, dtype=np.uint64)
+        return self._mont_mul(np.array(table, dtype=np.uint64), self._r2)
+
+    def _mont_mul(self, a, w):
+        if self._special != None:
+            return _vec_modulus._reduce_2q(_vec_modulus._special_mul_lazy(a, w, self._special), self._np_q)
+        return _vec_modulus._reduce_2q(
+            _vec_modulus._mont_mul(a, w, self._np_q, self._q_neg_inv), self._np_q)
+
+    # a: uint64 array of shape (batch, n), transformed in place
+    def _forward(self, a):
+        n, q = self._n, self._np_q
+        t = n
+        m = 1
+        while m < n:
+            t >>= 1
+            view = a.reshape(-1, m, 2, t)
+            w = self._mont_tables[m:2 * m].reshape(1, m, 1)
+            u = view[:, :, 0, :]
+            v = self._mont_mul(view[:, :, 1, :], w)
+            diff = _vec_modulus._sub_mod(u, v, q)
+            view[:, :, 0, :] = _vec_modulus._add_mod(u, v, q)
+            view[:, :, 1, :] = diff
+            m <<= 1
+        return a
+
+    # a: uint64 array of shape (batch, n), transformed in place
+    def _inverse(self, a):
+        n, q = self._n, self._np_q
+        t = 1
+        m = n >> 1
+        while m > 0:
+            view = a.reshape(-1, m, 2, t)
+            w = self._mont_inv_tables[m:2 * m].reshape(1, m, 1)
+            u = view[:, :, 0, :]
+            v = view[:, :, 1, :]
+            diff = self._mont_mul(_vec_modulus._sub_mod(u, v, q), w)
+            view[:, :, 0, :] = _vec_modulus._add_mod(u, v, q)
+            view[:, :, 1, :] = diff
+            t <<= 1
+            m >>= 1
+        a[...] = self._mont_mul(a, self._mont_n_inv)
+        return a
+
+    # the whole block is stacked into one (batch, n) array and transformed in one pass
+    def _transform_to_ntt_form_batch(self, block):
+        ret = self._forward(self._to_array(block).reshape(-1, self._n))
+        for a, row in zip(block, ret.tolist()):
+            a[:] = row
+        return block
+
+    def _transform_from_ntt_form_batch(self, block):
+        ret = self._inverse(self._to_array(block).reshape(-1, self._n))
+        for a, row in zip(block, ret.tolist()):
+            a[:] = row
+        return block
+
+class _NTT_Engine_Shoup(_NTT_Engine_Numpy):
+    """
+    numpy NTT with Shoup twiddles and lazy reduction (Harvey butterflies)
+    - every twiddle w is stored with its companion floor(w * 2^64 / q)
+    - forward keeps values in [0, 4q), inverse in [0, 2q), full reduction only at the end
+    - n^-1 is folded into the twiddles of the last inverse stage
+    - special primes take the same path: a Shoup product is cheaper than a shift-add fold
+    """
+    def __init__(self, n, q):
+        super().__init__(n, q)
+        self._np_tables = np.array(self._tables, dtype=np.uint64)
+        self._np_inv_tables = np.array(self._inv_tables, dtype=np.uint64)
+        self._shoup_tables = self._shoup_table(self._tables)
+        self._shoup_inv_tables = self._shoup_table(self._inv_tables)
+        # last inverse stage: (u + v) * n^-1, (u - v) * w * n^-1
+        last_w = (self._inv_tables[1] * self._n_inv) % q
+        self._last_w = np.uint64(last_w)
+        self._last_w_shoup = np.uint64(_vec_modulus._shoup_companion(last_w, q))
+        self._n_inv_w = np.uint64(self._n_inv)
+        self._n_inv_shoup = np.uint64(_vec_modulus._shoup_companion(self._n_inv, q))
+
+    def _shoup_table(self, table):
+        return np.array([_vec_modulus._shoup_companion(w, self._q) for w in table], dtype=np.uint64)
+
+    # a: uint64 array of shape (batch, n) in [0, q), transformed in place
+    def _forward(self, a):
+        n, q = self._n, self._np_q
+        two_q = q + q
+        t = n
+        m = 1
+        while m < n:
+            t >>= 1
+            view = a.reshape(-1, m, 2, t)
+            w = self._np_tables[m:2 * m].reshape(1, m, 1)
+            w_shoup = self._shoup_tables[m:2 * m].reshape(1, m, 1)
+            u = view[:, :, 0, :]
+            u = u - two_q * (u >= two_q)
+            v = _vec_modulus._shoup_mul(view[:, :, 1, :], w, w_shoup, q)
+            view[:, :, 0, :] = u + v
+            view[:, :, 1, :] = u - v + two_q
+            m <<= 1
+        a -= two_q * (a >= two_q)
+        a -= q * (a >= q)
+        return a
+
+    # a: uint64 array of shape (batch, n) in [0, q), transformed in place
+    def _inverse(self, a):
+        n, q = self._n, self._np_q
+        two_q = q + q
+        t = 1
+        m = n >> 1
+        while m > 1:
+            view = a.reshape(-1, m, 2, t)
+            w = self._np_inv_tables[m:2 * m].reshape(1, m, 1)
+            w_shoup = self._shoup_inv_tables[m:2 * m].reshape(1, m, 1)
+            u = view[:, :, 0, :]
+            v = view[:, :, 1, :]
+            diff = _vec_modulus._shoup_mul(u - v + two_q, w, w_shoup, q)
+            add = u + v
+            view[:, :, 0, :] = add - two_q * (add >= two_q)
+            view[:, :, 1, :] = diff
+            t <<= 1
+            m >>= 1
+        if n > 1:
+            view = a.reshape(-1, 2, t)
+            u = view[:, 0, :]
+            v = view[:, 1, :]
+            diff = _vec_modulus._shoup_mul(u - v + two_q, self._last_w, self._last_w_shoup, q)
+            view[:, 0, :] = _vec_modulus._shoup_mul(u + v, self._n_inv_w, self._n_inv_shoup, q)
+            view[:, 1, :] = diff
+        else:
+            a[...] = _vec_modulus._shoup_mul(a, self._n_inv_w, self._n_inv_shoup, q)
+        a -= q * (a >= q)
         return a
 
+# process-wide cache of NTT engines keyed by (n, q, backend), least recently used
+# engines are evicted beyond maxsize; HE_Parameter holds _NTT_Handle objects, so
+# parameter sets with the same (n, q) share one engine
+class _NTT_Registry:
+    def __init__(self, maxsize=64):
+        if maxsize <= 0:
+            raise Exception("registry size must be positive")
+        self._maxsize = maxsize
+        self._engines = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    # engine of key, built on a miss (outside the lock, tables of large n take a while)
+    def _get(self, key, engine_class):
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine != None:
+                self._engines.move_to_end(key)
+                self._hits += 1
+                return engine
+            self._misses += 1
+        return self._insert(key, engine_class(key[0], key[1]))
+
+    # add a ready engine (e.g. restored by HE_Parameter.load), an engine built
+    # concurrently for the same key wins so every handle sees one engine
+    def _insert(self, key, engine):
+        with self._lock:
+            engine = self._engines.setdefault(key, engine)
+            self._engines.move_to_end(key)
+            while len(self._engines) > self._maxsize:
+                self._engines.popitem(last=False)
+                self._evictions += 1
+            return engine
+
+    def resize(self, maxsize : int):
+        if maxsize <= 0:
+            raise Exception("registry size must be positive")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._engines) > self._maxsize:
+                self._engines.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._engines.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "engines": len(self._engines),
+                "maxsize": self._maxsize,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+_NTT_REGISTRY = _NTT_Registry()
+
+# stand-in for the engine of (n, q, backend): the engine is taken from the registry
+# on the first transform and then kept, so a handle never waits on the registry lock
+# again and an eviction only stops sharing, it does not rebuild the tables
+class _NTT_Handle:
+    def __init__(self, n, q, engine_class, engine=None):
+        self._n = n
+        self._q = q
+        self._engine_class = engine_class
+        self._resolved = engine
+
+    def _engine(self):
+        if self._resolved == None:
+            self._resolved = _NTT_REGISTRY._get((self._n, self._q, self._engine_class.__name__), self._engine_class)
+        return self._resolved
+
+    def __getattr__(self, name):
+        if name.startswith("__") or name in ("_n", "_q", "_engine_class", "_resolved"):
+            raise AttributeError(name)
+        return getattr(self._engine(), name)
+
 if __name__ == "__main__":
     n = 8
     q = 12289
@@ -91,4 +377,10 @@ if __name__ == "__main__":
 
     # Inverse (Bit-reversed -> Normal)
     recovered = engine._transform_from_ntt_form(curr)
-    print(f"INTT: {recovered}")
\ No newline at end of file
+    print(f"INTT: {recovered}")
+    # numpy backend must give the same output
+    if np is not None:
+        np_engine = _NTT_Engine_Numpy(n, q)
+        np_curr = np_engine._transform_to_ntt_form(poly[:])
+        print(f"numpy NTT equal: {np_curr == engine._transform_to_ntt_form(poly[:])}")
+        print(f"numpy INTT: {np_engine._transform_from_ntt_form(np_curr)}")
@@ -1,22 +1,35 @@
 import copy
+import itertools
+import struct
+import numpy as np
 from typing import Self
+from _util import _modulus
 from he.galois_ring.poly import Poly
 from he.galois_ring.rns_poly import RNS_Poly
 from he.he_parameter import HE_Parameter
+from he.prepared_plaintext import Prepared_Plaintext
 
 class Ciphertext:
     # data: list of RNS_Poly
+    # level: the ciphertext lives over the first level + 1 coefficient moduli,
+    #        mod_switch_to_next drops the last one
+    # correction: the decrypted plaintext is correction * m mod t, every dropped
+    #             modulus q multiplies it by q^-1 mod t
+    # seed: set when component 0 was expanded from a seed (public key, switching keys,
+    #       symmetric encryption), to_bytes then stores the seed instead of the component
     def __init__(self, param : HE_Parameter, data : list[RNS_Poly], error_bound : int, is_ntt_form=False):
         self._param = param
-        self._coeff_modulus = param.coeff_modulus
+        self._coeff_modulus = data[0]._rns_base if len(data) > 0 else param.coeff_modulus
         self._poly_modulus = param.poly_modulus
         self._debug = param._debug
         self._data = data
         self._is_ntt_form = is_ntt_form
         self._error_bound = error_bound
+        self._correction = 1
+        self._seed = None
         if self._debug:
             for d in data:
-                if d._rns_base != self._param.coeff_modulus:
+                if d._rns_base != self._coeff_modulus:
                     raise Exception(f"data rns base isn't match")
                 if d.is_ntt_form() != is_ntt_form:
                     raise Exception(f"data form isn't match")
@@ -24,11 +37,14 @@ class Ciphertext:
     def __add__(self, other : Self):
         if self.is_ntt_form() != other.is_ntt_form():
             raise Exception(f"ciphertext form is defferent")
+        self, other = self._align(other)
         long, short = self, other
         if self.size() < other.size():
             long, short = other, self
         diff = long.size() - short.size()
         ret = Ciphertext(self._param, [], self._error_bound + other._error_bound, self._is_ntt_form)
+        ret._coeff_modulus = self._coeff_modulus
+        ret._correction = self._correction
         for idx in range(diff):
             ret._data.append(long._data[idx])
         for idx in range(diff, long.size()):
@@ -38,7 +54,10 @@ class Ciphertext:
     def __sub__(self, other : Self):
         if self.is_ntt_form() != other.is_ntt_form():
             raise Exception(f"ciphertext form is defferent")
+        self, other = self._align(other)
         ret = Ciphertext(self._param, [], self._error_bound + other._error_bound, self._is_ntt_form)
+        ret._coeff_modulus = self._coeff_modulus
+        ret._correction = self._correction
         if self.size() >= other.size():
             diff = self.size() - other.size()
             for idx in range(diff):
@@ -62,19 +81,104 @@ class Ciphertext:
     def __mul__(self, other : Self):
         if self.is_ntt_form() != other.is_ntt_form():
             raise Exception(f"ciphertext form is different")
-        temp_data = []
-        for _ in range(self.size() + other.size() - 1):
-            temp_poly = RNS_Poly(self._param.coeff_modulus, self._param.poly_modulus, self._is_ntt_form)
-            temp_poly._set_ntt_engines(self._param.ntt_engines)
-            temp_data.append(temp_poly)
-        for i in range(self.size()):
-            for j in range(other.size()):
-                temp_data[i + j].add_inplace(self._data[i] * other._data[j])
+        if other is self:
+            return self.square()
+        self, other = self._align(other, False)
+        return self._product(other, self._tensor(self._data, other._data))
+    
+    def _product(self, other : Self, data : list[RNS_Poly]) -> Self:
         temp_error_bound = self._error_bound * other._error_bound\
              + (self._error_bound + other._error_bound) * self._param.plain_modulus
-        return Ciphertext(self._param, temp_data, temp_error_bound, self._is_ntt_form)
+        ret = Ciphertext(self._param, data, temp_error_bound, self._is_ntt_form)
+        ret._correction = self._correction * other._correction % self._param.plain_modulus
+        return ret
+    
+    def _zero_poly(self) -> RNS_Poly:
+        return RNS_Poly(self._coeff_modulus, self._param.poly_modulus, self._is_ntt_form)\
+            ._set_ntt_engines(self._param.ntt_engines)
+    
+    # tensor product of two component lists (polynomials in s)
+    # equal sizes use Karatsuba: 3 products for 2 x 2, 7 for 3 x 3 instead of 4 and 9
+    def _tensor(self, a : list[RNS_Poly], b : list[RNS_Poly]) -> list[RNS_Poly]:
+        res = [ None for _ in range(len(a) + len(b) - 1) ]
+        if len(a) != len(b) or len(a) == 1:
+            for i, j in itertools.product(range(len(a)), range(len(b))):
+                if res[i + j] == None:
+                    res[i + j] = a[i] * b[j]
+                else:
+                    res[i + j].mul_add_inplace(a[i], b[j])
+            return res
+        half = len(a) // 2
+        low = self._tensor(a[:half], b[:half])
+        high = self._tensor(a[half:], b[half:])
+        a_sum = [ x if y == None else x + y for x, y in itertools.zip_longest(a[half:], a[:half]) ]
+        b_sum = [ x if y == None else x + y for x, y in itertools.zip_longest(b[half:], b[:half]) ]
+        mid = self._tensor(a_sum, b_sum)
+        for i, poly in enumerate(low):
+            mid[i].sub_inplace(poly)
+            res[i] = poly
+        for i, poly in enumerate(high):
+            mid[i].sub_inplace(poly)
+            res[i + 2 * half] = poly
+        for i, poly in enumerate(mid):
+            if res[i + half] == None:
+                res[i + half] = poly
+            else:
+                res[i + half].add_inplace(poly)
+        return [ self._zero_poly() if poly == None else poly for poly in res ]
+    
+    # self * self: k (k + 1) / 2 products, cross terms are computed once and doubled
+    def square(self) -> Self:
+        res = [ None for _ in range(2 * self.size() - 1) ]
+        for i in range(self.size()):
+            for j in range(i, self.size()):
+                product = self._data[i] * self._data[j]
+                if i != j:
+                    product.add_inplace(product)
+                if res[i + j] == None:
+                    res[i + j] = product
+                else:
+                    res[i + j].add_inplace(product)
+        return self._product(self, res)
+    
+    # bring other to the level of self (or self to the level of other) and,
+    # unless only levels matter (products), to the same plaintext correction
+    def _align(self, other : Self, match_correction=True) -> tuple[Self, Self]:
+        if self.level() > other.level():
+            self = self.mod_switch_to(other.level())
+        elif other.level() > self.level():
+            other = other.mod_switch_to(self.level())
+        # the factor scales the noise of other as well, by up to t / 2 in centered form
+        if match_correction and self._correction != other._correction:
+            t = self._param.plain_modulus
+            factor = _modulus._centered_modulus(self._correction * pow(other._correction, -1, t), t)
+            other = other.mul_scalar(factor)
+            other._correction = self._correction
+            other._error_bound = other._error_bound * abs(factor)
+        return self, other
+    
+    # in-place variant, self is switched down in place and the aligned other is returned
+    def _align_inplace(self, other : Self, match_correction=True) -> Self:
+        if self.level() > other.level():
+            self.mod_switch_to_inplace(other.level())
+        return self._align(other, match_correction)[1]
+    
+    # plain operand (Poly or Prepared_Plaintext) lifted to the limbs of this ciphertext, in its form
+    # added plaintexts are scaled by the correction factor
+    def _plain_limbs(self, plain, scale : bool) -> RNS_Poly:
+        if plain.is_ntt_form():
+            raise Exception("plain must be coeff form")
+        if scale and self._correction != 1:
+            if isinstance(plain, Prepared_Plaintext):
+                plain = plain._plain
+            plain = plain.mul_scalar(self._correction)
+        if not isinstance(plain, Prepared_Plaintext):
+            plain = Prepared_Plaintext(self._param, plain)
+        return plain._limbs(self._coeff_modulus, self.is_ntt_form())
     
     def add_inplace(self, other : Self):
+        other = self._align_inplace(other)
+        self._error_bound += other._error_bound
         if self.size() >= other.size():
             diff = self.size() - other.size()
             for idx in range(diff, self.size()):
@@ -87,6 +191,8 @@ class Ciphertext:
         return self
     
     def sub_inplace(self, other : Self):
+        other = self._align_inplace(other)
+        self._error_bound += other._error_bound
         if self.size() >= other.size():
             diff = self.size() - other.size()
             for idx in range(diff, self.size()):
@@ -108,59 +214,72 @@ class Ciphertext:
     def mul_inplace(self, other : Self):
         if self.is_ntt_form() != other.is_ntt_form():
             raise Exception(f"ciphertext form is defferent")
-        temp_data = []
-        for _ in range(self.size() + other.size):
-            temp_poly = RNS_Poly(self._param.coeff_modulus, self._param.poly_modulus, self._is_ntt_form)
-            temp_poly._set_ntt_engines(self._param.ntt_engines)
-            temp_data.append(temp_poly)
-        for i in range(self.size()):
-            for j in range(other.size()):
-                temp_data[i + j].add_inplace(self._data[i] * other._data[j])
-        self._data = temp_data
-        self._error_bound = self._error_bound * other._error_bound\
-             + (self._error_bound + other._error_bound) * self._param.plain_modulus
+        other = self._align_inplace(other, False)
+        ret = self.square() if other is self else self._product(other, self._tensor(self._data, other._data))
+        self._data = ret._data
+        self._error_bound = ret._error_bound
+        self._correction = ret._correction
         return self
     
-    def add_plain(self, other : Poly) -> Self:
-        if other.is_ntt_form():
-            raise Exception("plain must be coeff form")
+    # other: Poly in coefficient form or Prepared_Plaintext (Encoder.prepare)
+    def add_plain(self, other : Poly | Prepared_Plaintext) -> Self:
         ret = self.copy()
-        ret._data[0].add_poly_inplace(other)
-        return ret
+        return ret.add_plain_inplace(other)
     
-    def sub_plain(self, other : Poly) -> Self:
-        if other.is_ntt_form():
-            raise Exception("plain must be coeff form")
+    def sub_plain(self, other : Poly | Prepared_Plaintext) -> Self:
         ret = self.copy()
-        ret._data[0].sub_poly_inplace(other)
-        return ret
+        return ret.sub_plain_inplace(other)
     
-    def mul_plain(self, other : Poly) -> Self:
-        if other.is_ntt_form():
-            raise Exception("plain must be coeff form")
+    def mul_plain(self, other : Poly | Prepared_Plaintext) -> Self:
         ret = self.copy()
-        for rns_poly in ret._data:
-            rns_poly.mul_poly_inplace(other)
-        ret._error_bound = self._error_bound * other.norm()
-        return ret
+        return ret.mul_plain_inplace(other)
     
-    def add_plain_inplace(self, other : Poly) -> Self:
-        if other.is_ntt_form():
+    # (k, c) with c centered mod t when the plain operand is c * X^k, None otherwise
+    def _plain_monomial(self, plain):
+        if plain.is_ntt_form():
             raise Exception("plain must be coeff form")
-        self._data[-1].add_poly_inplace(other)
+        monomial = plain._monomial if isinstance(plain, Prepared_Plaintext) else plain._monomial()
+        if monomial == None:
+            return None
+        return monomial[0], _modulus._centered_modulus(monomial[1], self._param.plain_modulus)
+    
+    # a constant plaintext is a scalar added to the constant term component
+    def add_plain_inplace(self, other : Poly | Prepared_Plaintext) -> Self:
+        monomial = self._plain_monomial(other)
+        if monomial != None and monomial[0] == 0:
+            scalar = _modulus._centered_modulus(monomial[1] * self._correction, self._param.plain_modulus)
+            self._data[-1].add_scalar_inplace(scalar)
+            return self
+        self._data[-1].add_inplace(self._plain_limbs(other, True))
         return self
     
-    def sub_plain_inplace(self, other : Poly) -> Self:
-        if other.is_ntt_form():
-            raise Exception("plain must be coeff form")
-        self._data[-1].sub_poly_inplace(other)
+    def sub_plain_inplace(self, other : Poly | Prepared_Plaintext) -> Self:
+        monomial = self._plain_monomial(other)
+        if monomial != None and monomial[0] == 0:
+            scalar = _modulus._centered_modulus(monomial[1] * self._correction, self._param.plain_modulus)
+            self._data[-1].add_scalar_inplace(-scalar)
+            return self
+        self._data[-1].sub_inplace(self._plain_limbs(other, True))
         return self
     
-    def mul_plain_inplace(self, other : Poly) -> Self:
-        if other.is_ntt_form():
-            raise Exception("plain must be coeff form")
+    # c * X^k plaintexts are a negacyclic shift (or slot product) plus a scalar product,
+    # others go through NTT form for the product
+    def mul_plain_inplace(self, other : Poly | Prepared_Plaintext) -> Self:
+        monomial = self._plain_monomial(other)
+        if monomial != None:
+            for rns_poly in self._data:
+                rns_poly.mul_monomial_inplace(monomial[0], monomial[1])
+            self._error_bound = self._error_bound * other.norm()
+            return self
+        if not isinstance(other, Prepared_Plaintext):
+            other = Prepared_Plaintext(self._param, other)
+        limbs = other._limbs(self._coeff_modulus, True)
+        if not self.is_ntt_form():
+            RNS_Poly._transform_batch(self._data, True)
         for rns_poly in self._data:
-            rns_poly.mul_poly_inplace(other)
+            rns_poly.mul_inplace(limbs)
+        if not self.is_ntt_form():
+            RNS_Poly._transform_batch(self._data, False)
         self._error_bound = self._error_bound * other.norm()
         return self
 
@@ -171,24 +290,127 @@ class Ciphertext:
         temp_data = []
         for d in self._data:
             temp_data.append(d.copy())
-        return Ciphertext(self._param, temp_data, self._error_bound, self._is_ntt_form)
+        ret = Ciphertext(self._param, temp_data, self._error_bound, self._is_ntt_form)
+        ret._correction = self._correction
+        ret._seed = self._seed
+        return ret
+    
+    def level(self) -> int:
+        return len(self._coeff_modulus) - 1
+    
+    # drop the last coefficient modulus q_L, dividing every component by q_L with
+    # a rounding term that is 0 mod t: noise shrinks by q_L, the plaintext picks up q_L^-1 mod t
+    def mod_switch_to_next_inplace(self):
+        if self.level() == 0:
+            raise Exception("ciphertext is already at the lowest level")
+        t = self._param.plain_modulus
+        last = self._coeff_modulus[-1]
+        data = self._data
+        if self.is_ntt_form():
+            data = [ rns_poly.copy() for rns_poly in data ]
+            RNS_Poly._transform_batch(data, False)
+        data = [ rns_poly.mod_switch_to_next(t) for rns_poly in data ]
+        if self.is_ntt_form():
+            RNS_Poly._transform_batch(data, True)
+        self._data = data
+        self._coeff_modulus = data[0]._rns_base
+        self._correction = self._correction * pow(last, -1, t) % t
+        self._error_bound = self._error_bound // last + 1\
+            + t * self.size() * self._poly_modulus * self._param._secret_key_bound ** (self.size() - 1)
+        return self
+    
+    def mod_switch_to_next(self) -> Self:
+        ret = self.copy()
+        return ret.mod_switch_to_next_inplace()
+    
+    def mod_switch_to_inplace(self, level : int):
+        if level < 0 or level > self.level():
+            raise Exception(f"can not switch from level {self.level()} to {level}")
+        while self.level() > level:
+            self.mod_switch_to_next_inplace()
+        return self
+    
+    def mod_switch_to(self, level : int) -> Self:
+        if level == self.level():
+            return self
+        ret = self.copy()
+        return ret.mod_switch_to_inplace(level)
+    
+    # header: magic, format version, size, ntt form, number of limbs, compressed, correction,
+    # error bound byte length
+    _HEADER = struct.Struct("<4sBBBBBQI")
+    _VERSION = 1
+    
+    # component 0 is written as its seed when it still is the seed expansion
+    def _compressible(self) -> bool:
+        if self._seed == None or self.size() == 0 or not self.is_ntt_form():
+            return False
+        expanded = RNS_Poly._from_seed(self._coeff_modulus, self._poly_modulus, self._seed)
+        return bool(np.array_equal(expanded._data, self._data[0]._data))
+    
+    def to_bytes(self) -> bytes:
+        compressed = self._compressible()
+        error_bound = self._error_bound.to_bytes((self._error_bound.bit_length() + 7) // 8, "little")
+        ret = [ Ciphertext._HEADER.pack(b"HECT", Ciphertext._VERSION, self.size(), int(self._is_ntt_form),\
+            len(self._coeff_modulus), int(compressed), self._correction, len(error_bound)), error_bound ]
+        for idx, rns_poly in enumerate(self._data):
+            if idx == 0 and compressed:
+                ret.append(self._seed)
+            else:
+                ret.append(rns_poly._data.astype("<u8").tobytes())
+        return b"".join(ret)
+    
+    @staticmethod
+    def from_bytes(param : HE_Parameter, data : bytes) -> Self:
+        magic, version, size, is_ntt_form, limbs, compressed, correction, length =\
+            Ciphertext._HEADER.unpack_from(data)
+        if magic != b"HECT":
+            raise Exception("data is not a serialized ciphertext")
+        if version != Ciphertext._VERSION:
+            raise Exception(f"ciphertext format version {version} is not supported")
+        if limbs > len(param.coeff_modulus):
+            raise Exception(f"ciphertext has {limbs} limbs, parameter has {len(param.coeff_modulus)}")
+        rns_base = param.coeff_modulus[:limbs]
+        offset = Ciphertext._HEADER.size
+        error_bound = int.from_bytes(data[offset:offset + length], "little")
+        offset += length
+        polys = []
+        for idx in range(size):
+            if idx == 0 and compressed:
+                seed = data[offset:offset + 32]
+                offset += 32
+                polys.append(RNS_Poly._from_seed(rns_base, param.poly_modulus, seed, bool(is_ntt_form)))
+                continue
+            nbytes = 8 * limbs * param.poly_modulus
+            rns_poly = RNS_Poly(rns_base, param.poly_modulus, bool(is_ntt_form))
+            rns_poly._data = np.frombuffer(data, dtype="<u8", count=limbs * param.poly_modulus, offset=offset)\
+                .astype(np.uint64).reshape(limbs, param.poly_modulus)
+            offset += nbytes
+            polys.append(rns_poly)
+        for rns_poly in polys:
+            rns_poly._set_ntt_engines(param.ntt_engines)
+        ret = Ciphertext(param, polys, error_bound, bool(is_ntt_form))
+        ret._coeff_modulus = rns_base
+        ret._correction = correction
+        if compressed:
+            ret._seed = seed
+        return ret
     
     def is_ntt_form(self) -> bool:
         return self._is_ntt_form
     
+    # every component is transformed in one batch per RNS limb
     def transform_to_ntt_form(self):
         if self.is_ntt_form():
             raise Exception("alread NTT form")
-        for poly in self._data:
-            poly.transform_to_ntt_form()
+        RNS_Poly._transform_batch(self._data, True)
         self._is_ntt_form = True
         return self
     
     def transform_from_ntt_form(self):
         if not self.is_ntt_form():
             raise Exception("alread basic form")
-        for poly in self._data:
-            poly.transform_from_ntt_form()
+        RNS_Poly._transform_batch(self._data, False)
         self._is_ntt_form = False
         return self
 
@@ -199,8 +421,10 @@ class Ciphertext:
             ret += poly.toString(length, print_zero)
         return ret
     
+    # the constant term of the plaintext lives in the last component
     def add_scalar_inplace(self, scalar : int):
-        self._data[0].add_scalar_inplace(scalar)
+        scalar = _modulus._centered_modulus(scalar * self._correction, self._param.plain_modulus)
+        self._data[-1].add_scalar_inplace(scalar)
         return self
     
     def add_scalar(self, scalar : int):
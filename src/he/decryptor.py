@@ -1,9 +1,13 @@
-from _util import _modulus
-from he.galois_ring.poly import Poly
+import numpy as np
+from _util import _vec_modulus
+from he.galois_ring.poly import Poly, _modulus_constants
 from he.galois_ring.rns_poly import RNS_Poly
 from he.he_parameter import HE_Parameter
 from he.ciphertext import Ciphertext
 
+# the float sum of y_i / q_i is off by about L * 2^-53, far below this margin
+_ROUNDING_MARGIN = 2.0 ** -30
+
 class Decryptor:
     def __init__(self, parameter : HE_Parameter, secret_key : RNS_Poly):
         if parameter._setup_complete == False:
@@ -12,33 +16,57 @@ class Decryptor:
         secret_key_copy = secret_key.copy()
         if not secret_key_copy.is_ntt_form():
             raise Exception("Secret key must be NTT form")
+        # s, s^2, ... grown on demand up to the largest ciphertext seen
         self._secret_keys = [secret_key_copy]
-        for idx in range(1, 100):
-            self._secret_keys.append(self._secret_keys[-1] * secret_key_copy)
+    
+    def _secret_key_power(self, power : int) -> RNS_Poly:
+        while len(self._secret_keys) < power:
+            self._secret_keys.append(self._secret_keys[-1] * self._secret_keys[0])
+        return self._secret_keys[power - 1]
 
+    # centered CRT reconstruction mod Q, then reduction mod t, for all coefficients at once
+    # fast base conversion: x mod t = sum_i y_i * (qhat_i mod t) - v * (Q mod t)
+    # where the float estimate v = round(sum_i y_i / q_i) is exact while |x| is well below Q / 2;
+    # coefficients whose sum lies within _ROUNDING_MARGIN of a half integer are rounded exactly
     def _recover_rns(self, rns_poly : RNS_Poly) -> Poly:
-        ret = Poly(self._param.plain_modulus, self._param.poly_modulus)\
+        tables = self._param._crt_tables(rns_poly._rns_base)
+        t, t_neg_inv, t_r2 = _modulus_constants(self._param.plain_modulus)
+        y = _vec_modulus._reduce_2q(_vec_modulus._shoup_mul(rns_poly._data, tables._qhat_inv,\
+            tables._qhat_inv_shoup, tables._q), tables._q)
+        estimate = (y.astype(np.float64) / tables._q_float).sum(axis=0)
+        v = np.rint(estimate).astype(np.int64)
+        for col in np.nonzero(np.abs(estimate - np.floor(estimate) - 0.5) < _ROUNDING_MARGIN)[0]:
+            total = sum(int(y[idx, col]) * qhat_i for idx, qhat_i in enumerate(tables._qhat))
+            v[col] = (total + tables._total_modulus // 2) // tables._total_modulus
+        y_t = y % t
+        data = np.zeros(self._param.poly_modulus, dtype=np.uint64)
+        for idx in range(len(rns_poly._rns_base)):
+            data = _vec_modulus._add_mod(data,\
+                _vec_modulus._mul_mod(y_t[idx], tables._qhat_mod_t[idx], t, t_neg_inv, t_r2), t)
+        v_t = (v % self._param.plain_modulus).astype(np.uint64)
+        data = _vec_modulus._sub_mod(data, _vec_modulus._mul_mod(v_t, tables._q_mod_t, t, t_neg_inv, t_r2), t)
+        return Poly(self._param.plain_modulus, self._param.poly_modulus, data)\
             ._set_ntt_engine(self._param.ntt_engines[self._param.plain_modulus])
-        ret._is_ntt_form = False
-        ret._data = [ 0 for _ in range(self._param.poly_modulus) ]
-        for deg in range(self._param.poly_modulus):
-            acc = 0
-            for coeff_modulus in self._param.coeff_modulus:
-                if deg >= len(rns_poly._rns_poly[coeff_modulus]._data):
-                    break
-                residue = rns_poly._rns_poly[coeff_modulus]._data[deg]
-                acc += residue * self._param._basis[coeff_modulus]
-            ret._data[deg] = _modulus._centered_modulus(_modulus._centered_modulus(\
-                acc, self._param._total_modulus), self._param.plain_modulus)
-        return ret
 
-    def decrypt(self, encrypted : Ciphertext) -> Poly:
+    # horner: evaluate ((c_0 * s + c_1) * s + c_2) ... without the secret key power table
+    def decrypt(self, encrypted : Ciphertext, horner=False) -> Poly:
         encrypted_copy = encrypted.copy()
         if not encrypted_copy.is_ntt_form():
             encrypted_copy.transform_to_ntt_form()
         enc_data = encrypted_copy._data # list of rns_poly
-        poly_sum = enc_data[-1] # rns_poly
-        for i in range(len(enc_data) - 1):
-            poly_sum.add_inplace(enc_data[i] * self._secret_keys[len(enc_data) - i - 2])
+        if horner:
+            secret_key = self._secret_keys[0]._restrict(encrypted_copy._coeff_modulus)
+            poly_sum = enc_data[0] # rns_poly
+            for i in range(1, len(enc_data)):
+                poly_sum.mul_inplace(secret_key)
+                poly_sum.add_inplace(enc_data[i])
+        else:
+            poly_sum = enc_data[-1] # rns_poly
+            for i in range(len(enc_data) - 1):
+                poly_sum.mul_add_inplace(enc_data[i], self._secret_key_power(len(enc_data) - i - 1)\
+                    ._restrict(encrypted_copy._coeff_modulus))
         poly_sum.transform_from_ntt_form()
-        return self._recover_rns(poly_sum) # poly
\ No newline at end of file
+        ret = self._recover_rns(poly_sum) # poly
+        if encrypted._correction != 1:
+            ret.mul_scalar_inplace(pow(encrypted._correction, -1, self._param.plain_modulus))
+        return ret
\ No newline at end of file
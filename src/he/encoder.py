@@ -1,11 +1,17 @@
-from he.galois_ring.poly import Poly
+from collections import OrderedDict
+from _util import _vec_modulus
+from he.galois_ring.poly import Poly, _slot_exponents
 from he.he_parameter import HE_Parameter
+from he.prepared_plaintext import Prepared_Plaintext
 
 class Encoder:
-    def __init__(self, parameter : HE_Parameter):
+    # prepared_cache_size: number of prepared plaintexts kept (least recently used are dropped)
+    def __init__(self, parameter : HE_Parameter, prepared_cache_size=128):
         self.param = parameter
         self.poly_modulus = parameter.poly_modulus
         self.plain_modulus = parameter.plain_modulus
+        self._prepared_cache = OrderedDict()
+        self._prepared_cache_size = prepared_cache_size
 
     def slot_encode(self, data : list[int]):
         if len(data) > self.poly_modulus:
@@ -19,4 +25,38 @@ class Encoder:
             raise Exception("Too many datas")
         ret = Poly(self.plain_modulus, self.poly_modulus, data, False)
         ret._set_ntt_engine(self.param.ntt_engines[self.plain_modulus])
-        return ret
\ No newline at end of file
+        return ret
+    
+    # plaintext slots in centered form (-t/2, t/2]
+    def slot_decode(self, poly : Poly) -> list[int]:
+        if not poly.is_ntt_form():
+            poly = poly.copy().transform_to_ntt_form()
+        return _vec_modulus._centered(poly._data, poly._q).tolist()
+    
+    # plaintext coefficients in centered form (-t/2, t/2]
+    def coeff_decode(self, poly : Poly) -> list[int]:
+        if poly.is_ntt_form():
+            poly = poly.copy().transform_from_ntt_form()
+        return _vec_modulus._centered(poly._data, poly._q).tolist()
+    
+    # ntt slot indices of the two rows (X at psi^(5^i) and psi^(-5^i)), i = 0 .. N/2 - 1
+    # Evaluator.rotate(c, k) moves the value of row position i + k to position i
+    def slot_rotation_order(self) -> list[int]:
+        n = self.poly_modulus
+        slot_of = { int(e): idx for idx, e in enumerate(_slot_exponents(n)) }
+        row = [ pow(5, i, 2 * n) for i in range(n // 2) ]
+        return [ slot_of[e] for e in row ] + [ slot_of[2 * n - e] for e in row ]
+    
+    # lift a plaintext to the RNS limbs once, cached by content
+    def prepare(self, plain : Poly) -> Prepared_Plaintext:
+        if plain.is_ntt_form():
+            plain = plain.copy().transform_from_ntt_form()
+        key = plain._data.tobytes()
+        if key in self._prepared_cache:
+            self._prepared_cache.move_to_end(key)
+            return self._prepared_cache[key]
+        ret = Prepared_Plaintext(self.param, plain.copy())
+        self._prepared_cache[key] = ret
+        if len(self._prepared_cache) > self._prepared_cache_size:
+            self._prepared_cache.popitem(last=False)
+        return ret
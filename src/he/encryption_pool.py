@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import deque
+from he.galois_ring.poly import Poly
+from he.ciphertext import Ciphertext
+from he.encryptor import Encryptor
+
+# offline / online encryption
+# a background thread keeps up to `size` fresh encryptions of zero, refilling in batches of
+# `refill_batch` once the pool drops below `low_watermark`; online encryption pops one and adds
+# the plaintext. an empty pool falls back to encrypting on the calling thread (a miss)
+class Encryption_Pool:
+    def __init__(self, encryptor : Encryptor, size=32, low_watermark=8, refill_batch=8, background=True):
+        if size <= 0 or not 0 <= low_watermark < size or refill_batch <= 0:
+            raise Exception("Invalid pool setting: need 0 <= low_watermark < size and refill_batch > 0")
+        self._encryptor = encryptor
+        self._size = size
+        self._low_watermark = low_watermark
+        self._refill_batch = refill_batch
+        self._pool = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._refills = 0
+        self._refill_time = 0.0
+        self._last_refill_latency = 0.0
+        self._thread = None
+        if background:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _refill_once(self) -> int:
+        with self._cond:
+            count = min(self._refill_batch, self._size - len(self._pool))
+        if count <= 0:
+            return 0
+        start = time.perf_counter()
+        zeros = self._encryptor._encrypt_zero_batch(count)
+        latency = time.perf_counter() - start
+        with self._cond:
+            self._pool.extend(zeros)
+            self._refills += 1
+            self._refill_time += latency
+            self._last_refill_latency = latency
+            self._cond.notify_all()
+        return count
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._closed and len(self._pool) >= self._low_watermark:
+                    self._cond.wait()
+                if self._closed:
+                    return
+            while not self._closed and self._refill_once() > 0:
+                pass
+
+    # fill the pool up to its size on the calling thread
+    def fill(self):
+        while self._refill_once() > 0:
+            pass
+        return self
+
+    def encrypt(self, poly : Poly) -> Ciphertext:
+        if poly.is_ntt_form():
+            raise Exception("plaintext must be basic form")
+        with self._cond:
+            encrypted = self._pool.popleft() if len(self._pool) > 0 else None
+            if encrypted != None:
+                self._hits += 1
+            else:
+                self._misses += 1
+            if len(self._pool) < self._low_watermark:
+                self._cond.notify_all()
+        if encrypted == None:
+            encrypted = self._encryptor.encrypt_zero()
+        return encrypted.add_plain_inplace(poly)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread != None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "available": len(self._pool),
+                "size": self._size,
+                "low_watermark": self._low_watermark,
+                "hits": self._hits,
+                "misses": self._misses,
+                "refills": self._refills,
+                "refill_time": self._refill_time,
+                "last_refill_latency": self._last_refill_latency,
+            }
@@ -1,7 +1,18 @@
+import multiprocessing
+import numpy as np
+from _util import _vec_modulus
+from _util import _sampler
 from he.galois_ring.poly import Poly
 from he.galois_ring.rns_poly import RNS_Poly
 from he.he_parameter import HE_Parameter
 from he.ciphertext import Ciphertext
+from he.key_generator import Key_Generator
+
+# worker of Encryptor.encrypt_batch, encrypts one chunk in a separate process
+# every sample is expanded from a fresh os.urandom seed, so forked workers never share randomness
+def _encrypt_chunk(args):
+    encryptor, polys = args
+    return encryptor.encrypt_batch(polys)
 
 class Encryptor:
     def __init__(self, parameter : HE_Parameter, public_key : Ciphertext):
@@ -12,12 +23,83 @@ class Encryptor:
         if not public_key.is_ntt_form():
             raise Exception("Public Key must be NTT form")
         self._param = parameter
+        # reduced once here: a key at bound 1 is never reduced in place by a product, so
+        # Encryption_Pool's refill thread and the callers can read it concurrently
         self.public_key = public_key.copy()
+        for rns_poly in self.public_key._data:
+            rns_poly._reduce()
+        self._sampler = Key_Generator(parameter)
+
+    # fresh encryptions of zero (pk_0 * u + t * e_0, pk_1 * u + t * e_1), the data independent
+    # part of encryption: u, e_0, e_1 of all ciphertexts are transformed in one batched NTT
+    def _encrypt_zero_batch(self, count : int) -> list[Ciphertext]:
+        param = self._param
+        masks = self._sampler.generate_bound_rns_polys(param._secret_key_bound, count)
+        errors = self._sampler.generate_error_rns_polys(2 * count)
+        RNS_Poly._transform_batch(masks + errors, True)
+        pk_mask, pk_body = self.public_key._data
+        error_bound = self.public_key._error_bound * param.poly_modulus * param._secret_key_bound\
+            + param._first_error_bound * param.plain_modulus
+        ret = []
+        for idx, u in enumerate(masks):
+            c0 = (pk_mask * u).add_inplace(errors[2 * idx].mul_scalar_inplace(param.plain_modulus))
+            c1 = (pk_body * u).add_inplace(errors[2 * idx + 1].mul_scalar_inplace(param.plain_modulus))
+            ret.append(Ciphertext(param, [c0, c1], error_bound, True))
+        return ret
+
+    def encrypt_zero(self) -> Ciphertext:
+        return self._encrypt_zero_batch(1)[0]
 
     def encrypt(self, poly : Poly) -> Ciphertext:
         if poly.is_ntt_form():
             raise Exception("plaintext must be basic form")
-        poly.centered_mod()
-        encrypted = self.public_key.copy()
+        # plaintext residues are lifted to the limbs in centered form by add_plain
+        encrypted = self.encrypt_zero()
         encrypted.add_plain_inplace(poly)
-        return encrypted
\ No newline at end of file
+        return encrypted
+
+    # secret key encryption (a, -a * s + t * e + m) with a uniform a expanded from a seed,
+    # so the ciphertext serializes to about half the size of a public key encryption
+    def encrypt_symmetric(self, poly : Poly, secret_key : RNS_Poly) -> Ciphertext:
+        if poly.is_ntt_form():
+            raise Exception("plaintext must be basic form")
+        if not secret_key.is_ntt_form():
+            raise Exception("Secret Key must be NTT form")
+        param = self._param
+        seed = _sampler._new_seed()
+        c0 = self._sampler.generate_uniform_rns_poly(seed)
+        error = self._sampler.generate_error_rns_poly().transform_to_ntt_form()
+        c1 = (c0 * secret_key).neg_inplace().add_inplace(error.mul_scalar_inplace(param.plain_modulus))
+        encrypted = Ciphertext(param, [c0, c1], param._first_error_bound * param.plain_modulus, True)
+        encrypted._seed = seed
+        return encrypted.add_plain_inplace(poly)
+
+    # encrypt several plaintexts at once: all plaintexts are lifted to the RNS limbs in one
+    # vectorized step and transformed with one batched NTT per limb
+    # processes > 1 splits the batch into contiguous chunks encrypted by worker processes,
+    # ciphertexts are returned in input order
+    def encrypt_batch(self, polys : list[Poly], processes=1) -> list[Ciphertext]:
+        for poly in polys:
+            if poly.is_ntt_form():
+                raise Exception("plaintext must be basic form")
+        if len(polys) == 0:
+            return []
+        if processes > 1 and len(polys) > 1:
+            chunk = -(-len(polys) // processes)
+            chunks = [ (self, polys[idx:idx + chunk]) for idx in range(0, len(polys), chunk) ]
+            with multiprocessing.Pool(min(processes, len(chunks))) as pool:
+                results = pool.map(_encrypt_chunk, chunks)
+            return [ encrypted for result in results for encrypted in result ]
+        param = self._param
+        encrypted = self._encrypt_zero_batch(len(polys))
+        plain = np.stack([ poly._data for poly in polys ]).reshape(len(polys), 1, -1)
+        lifted = _vec_modulus._centered_lift(plain, np.uint64(param.plain_modulus), self.public_key._data[1]._q)
+        rns_polys = []
+        for data in lifted:
+            rns_poly = RNS_Poly(param.coeff_modulus, param.poly_modulus)._set_ntt_engines(param.ntt_engines)
+            rns_poly._data = data
+            rns_polys.append(rns_poly)
+        RNS_Poly._transform_batch(rns_polys, True)
+        for zero, rns_poly in zip(encrypted, rns_polys):
+            zero._data[1].add_inplace(rns_poly)
+        return encrypted
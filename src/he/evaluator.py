@@ -1,8 +1,142 @@
+from _util import _vec_modulus
 from he.galois_ring.poly import Poly
+from he.galois_ring.rns_poly import RNS_Poly
+from he.ciphertext import Ciphertext
 from he.he_parameter import HE_Parameter
+from he.relin_keys import Relin_Keys
+from he.galois_keys import Galois_Keys
 
 class Evaluator:
-    def __init__(self, parameter : HE_Parameter):
-        if parameter.generate_context == False:
+    # auto_mod_switch: drop one coefficient modulus after every multiply
+    def __init__(self, parameter : HE_Parameter, relin_keys : Relin_Keys = None, auto_mod_switch=False,\
+        galois_keys : Galois_Keys = None):
+        if parameter._setup_complete == False:
             raise Exception("parameter setting is not complete")
-        self.param = parameter
\ No newline at end of file
+        self.param = parameter
+        self.relin_keys = relin_keys
+        self.auto_mod_switch = auto_mod_switch
+        self.galois_keys = galois_keys
+
+    # RNS decomposition: limb j of a coefficient form polynomial, lifted to every limb in centered form
+    # sum_j piece_j * g_j = rns_poly mod Q
+    def _decompose(self, rns_poly : RNS_Poly) -> list[RNS_Poly]:
+        pieces = []
+        for idx, base in enumerate(rns_poly._rns_base):
+            piece = RNS_Poly(rns_poly._rns_base, rns_poly._poly_modulus)
+            piece._data = _vec_modulus._centered_lift(rns_poly._data[idx:idx + 1], rns_poly._q[idx], rns_poly._q)
+            piece._set_ntt_engines(self.param.ntt_engines)
+            pieces.append(piece)
+        return pieces
+
+    # bring a ciphertext (c_0, ..., c_{k-1}) back to size 2
+    # every c_p * s^p (p >= 2) is replaced by sum_j piece_j * (a_j, b_j) of the keys for s^p
+    def relinearize_inplace(self, encrypted : Ciphertext) -> Ciphertext:
+        if self.relin_keys == None:
+            raise Exception("relinearization keys are not set")
+        size = encrypted.size()
+        if size <= 2:
+            return encrypted
+        if size > self.relin_keys.max_size():
+            raise Exception(f"ciphertext size {size} exceeds relinearization keys ({self.relin_keys.max_size()})")
+        keys = [ self.relin_keys._keys[size - 1 - idx] for idx in range(size - 2) ]
+        acc = self._key_switch(encrypted, encrypted._data[:size - 2], keys)
+        encrypted._data = encrypted._data[size - 2:]
+        encrypted._data[0].add_inplace(acc[0])
+        encrypted._data[1].add_inplace(acc[1])
+        return encrypted
+
+    # sum_i sum_j piece_ij * (a_ij, b_ij) for components[i] with key switching keys[i][q_j]
+    # returned in the form of encrypted, over its RNS base
+    def _key_switch(self, encrypted : Ciphertext, components : list[RNS_Poly], keys : list[dict]) -> list[RNS_Poly]:
+        rns_base = encrypted._coeff_modulus
+        components = [ rns_poly.copy() for rns_poly in components ]
+        if encrypted.is_ntt_form():
+            RNS_Poly._transform_batch(components, False)
+        pieces = [ self._decompose(rns_poly) for rns_poly in components ]
+        RNS_Poly._transform_batch([ piece for piece_list in pieces for piece in piece_list ], True)
+        acc = [ RNS_Poly(rns_base, self.param.poly_modulus, True)._set_ntt_engines(self.param.ntt_engines)\
+            for _ in range(2) ]
+        for piece_list, key in zip(pieces, keys):
+            for base, piece in zip(rns_base, piece_list):
+                acc[0].mul_add_inplace(piece, key[base]._data[0]._restrict(rns_base))
+                acc[1].mul_add_inplace(piece, key[base]._data[1]._restrict(rns_base))
+        if not encrypted.is_ntt_form():
+            RNS_Poly._transform_batch(acc, False)
+        encrypted._error_bound += len(components) * len(rns_base) * max(rns_base) * self.param.poly_modulus\
+            * self.param._first_error_bound * self.param.plain_modulus
+        return acc
+
+    def relinearize(self, encrypted : Ciphertext) -> Ciphertext:
+        return self.relinearize_inplace(encrypted.copy())
+
+    # product of two ciphertexts, relinearized to size 2 when keys are set
+    # and switched down one level with auto_mod_switch
+    def multiply(self, encrypted1 : Ciphertext, encrypted2 : Ciphertext) -> Ciphertext:
+        return self._finish_product(encrypted1 * encrypted2)
+
+    def square(self, encrypted : Ciphertext) -> Ciphertext:
+        return self._finish_product(encrypted.square())
+
+    def _finish_product(self, ret : Ciphertext) -> Ciphertext:
+        if self.relin_keys != None:
+            self.relinearize_inplace(ret)
+        if self.auto_mod_switch and ret.level() > 0:
+            ret.mod_switch_to_next_inplace()
+        return ret
+
+    def mod_switch_to_next(self, encrypted : Ciphertext) -> Ciphertext:
+        return encrypted.mod_switch_to_next()
+
+    def mod_switch_to_next_inplace(self, encrypted : Ciphertext) -> Ciphertext:
+        return encrypted.mod_switch_to_next_inplace()
+
+    # X -> X^k on a size 2 ciphertext, switched back to the secret key s with the galois key of k
+    def apply_galois_inplace(self, encrypted : Ciphertext, galois_element : int) -> Ciphertext:
+        if self.galois_keys == None or not self.galois_keys.has_key(galois_element):
+            raise Exception(f"galois key for {galois_element} is not set")
+        if encrypted.size() != 2:
+            raise Exception("relinearize before applying galois automorphisms")
+        data = [ rns_poly.apply_galois(galois_element) for rns_poly in encrypted._data ]
+        acc = self._key_switch(encrypted, data[:1], [ self.galois_keys._keys[galois_element] ])
+        data[1].add_inplace(acc[1])
+        encrypted._data = [ acc[0], data[1] ]
+        return encrypted
+
+    def apply_galois(self, encrypted : Ciphertext, galois_element : int) -> Ciphertext:
+        return self.apply_galois_inplace(encrypted.copy(), galois_element)
+
+    # rotate both slot rows left by steps (X -> X^(5^steps)), see Encoder.slot_rotation_order
+    # without a key for 5^steps the rotation is composed from the power of two keys
+    def rotate_inplace(self, encrypted : Ciphertext, steps : int) -> Ciphertext:
+        n = self.param.poly_modulus
+        steps %= n // 2
+        if steps == 0:
+            return encrypted
+        galois_element = pow(5, steps, 2 * n)
+        if self.galois_keys != None and self.galois_keys.has_key(galois_element):
+            return self.apply_galois_inplace(encrypted, galois_element)
+        for bit in range(steps.bit_length()):
+            if (steps >> bit) & 1:
+                self.apply_galois_inplace(encrypted, pow(5, 1 << bit, 2 * n))
+        return encrypted
+
+    def rotate(self, encrypted : Ciphertext, steps : int) -> Ciphertext:
+        return self.rotate_inplace(encrypted.copy(), steps)
+
+    # swap the two slot rows (X -> X^(2N - 1))
+    def conjugate(self, encrypted : Ciphertext) -> Ciphertext:
+        return self.apply_galois(encrypted, 2 * self.param.poly_modulus - 1)
+
+    # every slot holds the sum of all slots, log2(N/2) rotations and one row swap
+    def sum_slots(self, encrypted : Ciphertext) -> Ciphertext:
+        ret = encrypted.copy()
+        steps = 1
+        while steps < self.param.poly_modulus // 2:
+            ret.add_inplace(self.rotate(ret, steps))
+            steps *= 2
+        ret.add_inplace(self.conjugate(ret))
+        return ret
+
+    # every slot holds sum_i a_i * b_i over the slots of the two ciphertexts
+    def inner_product(self, encrypted1 : Ciphertext, encrypted2 : Ciphertext) -> Ciphertext:
+        return self.sum_slots(self.multiply(encrypted1, encrypted2))
@@ -0,0 +1,15 @@
+from he.ciphertext import Ciphertext
+from he.he_parameter import HE_Parameter
+
+# RNS-decomposed key switching keys for the automorphisms X -> X^k
+# keys[k][q_j] is a ciphertext (a, b) in NTT form with a * s + b = t * e + g_j * s(X^k)
+class Galois_Keys:
+    def __init__(self, parameter : HE_Parameter, keys : dict[int, dict[int, Ciphertext]]):
+        self._param = parameter
+        self._keys = keys
+    
+    def has_key(self, galois_element : int) -> bool:
+        return galois_element in self._keys
+    
+    def galois_elements(self) -> list[int]:
+        return list(self._keys.keys())
@@ -1,109 +1,178 @@
+import itertools
+import functools
 from typing import Self
-from _util import _modulus
+import numpy as np
+from _util import _vec_modulus
 from he._ntt import _NTT_Engine
 from _util._prime import *
 
+_KARATSUBA_THRESHOLD = 32
+
+# reduce coefficient list modulo X^N + 1 (X^N = -1), zero padded to length N
+def _negacyclic_fold(data : list[int], n : int) -> list[int]:
+    res = data[:n] + [ 0 for _ in range(n - len(data)) ]
+    for idx in range(n, len(data)):
+        if (idx // n) % 2 == 0:
+            res[idx % n] += data[idx]
+        else:
+            res[idx % n] -= data[idx]
+    return res
+
+# full (non-reduced) product of two coefficient lists
+def _karatsuba_mul(a : list[int], b : list[int]) -> list[int]:
+    if len(a) == 0 or len(b) == 0:
+        return []
+    if min(len(a), len(b)) <= _KARATSUBA_THRESHOLD:
+        res = [ 0 for _ in range(len(a) + len(b) - 1) ]
+        for i, x in enumerate(a):
+            if x == 0:
+                continue
+            for j, y in enumerate(b):
+                res[i + j] += x * y
+        return res
+    half = max(len(a), len(b)) // 2
+    a0, a1 = a[:half], a[half:]
+    b0, b1 = b[:half], b[half:]
+    low = _karatsuba_mul(a0, b0)
+    high = _karatsuba_mul(a1, b1)
+    a_sum = [ x + y for x, y in itertools.zip_longest(a0, a1, fillvalue=0) ]
+    b_sum = [ x + y for x, y in itertools.zip_longest(b0, b1, fillvalue=0) ]
+    mid = _karatsuba_mul(a_sum, b_sum)
+    res = [ 0 for _ in range(len(a) + len(b) - 1) ]
+    for i, c in enumerate(low):
+        res[i] += c
+        mid[i] -= c
+    for i, c in enumerate(high):
+        res[i + 2 * half] += c
+        mid[i] -= c
+    for i, c in enumerate(mid):
+        if c != 0:
+            res[i + half] += c
+    return res
+
+# (q, -q^-1 mod 2^64, 2^128 mod q) as np.uint64, shared by every Poly over Z_q
+@functools.lru_cache(maxsize=None)
+def _modulus_constants(q : int):
+    return _vec_modulus._mont_constants(q)
+
+# shift-add reduction constants when q = 2^k - c * 2^m + 1 is a special prime, None otherwise
+# products over such a q skip the montgomery form
+@functools.lru_cache(maxsize=None)
+def _modulus_special(q : int):
+    return _vec_modulus._special_constants(q)
+
+# ntt slot j holds a(psi^e_j) with e_j = 2 * bitrev(j) + 1
+@functools.lru_cache(maxsize=None)
+def _slot_exponents(n : int) -> np.ndarray:
+    bits = n.bit_length() - 1
+    rev = np.zeros(n, dtype=np.int64)
+    for i in range(1, n):
+        rev[i] = (rev[i >> 1] >> 1) | ((i & 1) << (bits - 1))
+    return 2 * rev + 1
+
+# automorphism X -> X^k (k odd) as a gather on ntt slots:
+# the image of slot j is the slot evaluated at psi^(k * e_j mod 2N)
+@functools.lru_cache(maxsize=None)
+def _galois_permutation(n : int, k : int) -> np.ndarray:
+    exponents = _slot_exponents(n)
+    slot_of = np.zeros(2 * n, dtype=np.int64)
+    slot_of[exponents] = np.arange(n)
+    return slot_of[(exponents * k) % (2 * n)]
+
+# automorphism X -> X^k (k odd) on coefficients: X^i -> +-X^(i * k mod N)
+@functools.lru_cache(maxsize=None)
+def _galois_coeff_map(n : int, k : int) -> tuple[np.ndarray, np.ndarray]:
+    dest = (np.arange(n) * k) % (2 * n)
+    return dest % n, dest >= n
+
+def _check_galois_element(n : int, k : int):
+    if k % 2 == 0 or not 0 < k < 2 * n:
+        raise Exception(f"galois element {k} must be odd and in (0, {2 * n})")
+
+# python int list or array (any sign, any length) -> uint64 array of length N in [0, q)
+# uint64 arrays of length N (the results of Poly operations) are kept, reduced if needed
+def _to_residues(data, q : int, n : int, is_ntt_form : bool):
+    if isinstance(data, np.ndarray):
+        if data.dtype == np.uint64 and data.shape == (n,):
+            return data if data.max(initial=0) < q else data % np.uint64(q)
+        data = data.ravel().tolist()
+    data = list(data)
+    if len(data) > n:
+        if is_ntt_form:
+            raise Exception(f"ntt form polynomial has {len(data)} > {n} slots")
+        data = _negacyclic_fold(data, n)
+    ret = np.zeros(n, dtype=np.uint64)
+    try:
+        ret[:len(data)] = np.array(data, dtype=np.int64) % q
+    except OverflowError:
+        ret[:len(data)] = [ e % q for e in data ]
+    return ret
+
 # element of galois field Z_q[X]/f(X), negacyclic ring
 # q: prime, f(X) = X^N + 1
+# coefficients (or ntt slots) are stored as a length N uint64 array in [0, q)
 class Poly:
 
     def __init__(self, coeff_modulus : int, poly_modulus : int, data=[], is_ntt_form=False):
-        self._data = data
         self._coeff_modulus = coeff_modulus
         self._poly_modulus = poly_modulus
+        self._q, self._q_neg_inv, self._r2 = _modulus_constants(coeff_modulus)
+        self._special = _modulus_special(coeff_modulus)
+        self._data = _to_residues(data, coeff_modulus, poly_modulus, is_ntt_form)
         self._is_ntt_form = is_ntt_form
         self._ntt_engine = None
         self._norm = 0
-        if is_ntt_form:
-            if len(data) < poly_modulus:
-                self._data += [ 0 for _ in range(poly_modulus - len(data))]
-        else:
-            self._compress()
-
+    
     def __add__(self, other : Self):
-        if self._coeff_modulus != other._coeff_modulus:
-            raise Exception(f"except Z_{self._coeff_modulus} but Z_{other._coeff_modulus}")
-        if self._poly_modulus != other._poly_modulus:
-            raise Exception(f"except Z_{self._poly_modulus} but Z_{other._poly_modulus}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"polynomial form is not match")
-        if len(self._data) < len(other._data):
-            res = self._data.copy()
-            long = other._data
-        else:
-            res = other._data.copy()
-            long = self._data
-        for idx in range(len(res)):
-            res[idx] = _modulus._centered_modulus(res[idx] + long[idx], self._coeff_modulus)
-        res += long[len(res):]
-        return Poly(self._coeff_modulus, self._poly_modulus, res, self._is_ntt_form)\
-            ._set_ntt_engine(self._ntt_engine)\
-            ._compress()
+        self._check_operand(other)
+        res = _vec_modulus._add_mod(self._data, other._data, self._q)
+        return self._new(res)
     
     def __neg__(self):
-        res = self._data.copy()
-        for idx in range(len(res)):
-            res[idx] = _modulus._centered_modulus(-1 * res[idx], self._coeff_modulus)
-        return Poly(self._coeff_modulus, self._poly_modulus, res, self._is_ntt_form)\
-            ._set_ntt_engine(self._ntt_engine)\
-            ._compress()
+        res = _vec_modulus._neg_mod(self._data, self._q)
+        return self._new(res)
     
     def __sub__(self, other : Self):
-        if self._coeff_modulus != other._coeff_modulus:
-            raise Exception(f"except Z_{self._coeff_modulus} but Z_{other._coeff_modulus}")
-        if self._poly_modulus != other._poly_modulus:
-            raise Exception(f"except Z_{self._poly_modulus} but Z_{other._poly_modulus}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"polynomial form is not match")
-        res = self._data.copy()
-        for idx in range(min(len(res), len(other._data))):
-            res[idx] = _modulus._centered_modulus(res[idx] - other._data[idx], self._coeff_modulus)
-        if len(res) < len(other._data):
-            res += (-other)._data
-        return Poly(self._coeff_modulus, self._poly_modulus, res, self._is_ntt_form)\
-            ._set_ntt_engine(self._ntt_engine)\
-            ._compress()
+        self._check_operand(other)
+        res = _vec_modulus._sub_mod(self._data, other._data, self._q)
+        return self._new(res)
     
     def __mul__(self, other : Self):
+        self._check_operand(other)
+        if self.is_ntt_form():
+            res = _vec_modulus._mul_mod(self._data, other._data, self._q, self._q_neg_inv, self._r2, self._special)
+        else:
+            res = self._negacyclic_mul(other)
+        return self._new(res)
+    
+    # zero-copy view of coefficients (ntt slots)
+    def __getitem__(self, key):
+        return self._data[key]
+    
+    def _new(self, data) -> Self:
+        return Poly(self._coeff_modulus, self._poly_modulus, data, self._is_ntt_form)\
+            ._set_ntt_engine(self._ntt_engine)
+    
+    def _check_operand(self, other : Self):
         if self._coeff_modulus != other._coeff_modulus:
             raise Exception(f"except Z_{self._coeff_modulus} but Z_{other._coeff_modulus}")
         if self._poly_modulus != other._poly_modulus:
             raise Exception(f"except Z_{self._poly_modulus} but Z_{other._poly_modulus}")
         if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"polynomial form is not match")
-        if self.is_ntt_form():
-            res = [ _modulus._centered_modulus(a * b, self._coeff_modulus) for a, b in zip(self._data, other._data) ]
-            return Poly(self._coeff_modulus, self._poly_modulus, res, self._is_ntt_form)\
-                ._set_ntt_engine(self._ntt_engine)\
-                ._compress()
-        else:
-            res = [0 for _ in range(len(self._data) + len(other._data))]
-            for i in range(len(self._data)):
-                for j in range(len(other._data)):
-                    res[i + j] = _modulus._centered_modulus(self._data[i] * other._data[j], self._coeff_modulus)
-            if len(res) >= self._poly_modulus:
-                for deg in range(len(res) - 1, self._poly_modulus - 1, -1):
-                    res[deg - self._poly_modulus] = _modulus._centered_modulus(res[deg - self._poly_modulus] - res[deg], self._coeff_modulus)
-            return Poly(self._coeff_modulus, self._poly_modulus, res, self._is_ntt_form)\
-                ._set_ntt_engine(self._ntt_engine)\
-                ._compress()\
+            raise Exception(f"polynomial form is not match {self.is_ntt_form()} {other.is_ntt_form()}")
     
-    def _compress(self):
-        if self.is_ntt_form():
-            return self
-        while len(self._data) > 0 and self._data[-1] == 0:
-            self._data.pop()
-        return self
-
-    def _eval_centered_mod(self):
-        ntt_flag = False
-        if self.is_ntt_form():
-            ntt_flag = True
-            self.transform_from_ntt_form()
-        for i in range(len(self._data)):
-            self._data[i] = _modulus._centered_modulus(self._data[i], self._poly_modulus)
-        if ntt_flag:
-            self.transform_to_ntt_form()
+    # coefficient form product in Z_q[X]/(X^N + 1)
+    # through the attached ntt engine (forward, pointwise, inverse), Karatsuba without one
+    def _negacyclic_mul(self, other : Self):
+        n, q = self._poly_modulus, self._coeff_modulus
+        engine = self._ntt_engine
+        if engine != None and engine._q == q and engine._n == n:
+            block = np.stack([self._data, other._data])
+            engine._forward(block)
+            res = _vec_modulus._mul_mod(block[0], block[1], self._q, self._q_neg_inv, self._r2, self._special)
+            return engine._inverse(res.reshape(1, n))[0]
+        res = _negacyclic_fold(_karatsuba_mul(self._data.tolist(), other._data.tolist()), n)
+        return _to_residues(res, q, n, False)
     
     def _set_ntt_engine(self, ntt_engine : _NTT_Engine):
         self._ntt_engine = ntt_engine
@@ -116,100 +185,70 @@ class Poly:
         return self._norm
     
     def transform_to_ntt_form(self):
-        if self._ntt_engine == None:
-            raise Exception(f"set ntt engine before ntt")
-        if self._is_ntt_form == True:
-            raise Exception(f"polynomial is already ntt form")
-        if len(self._data) < self._poly_modulus:
-            self._data += [ 0 for _ in range(self._poly_modulus - len(self._data))]
-        self._data = self._ntt_engine._transform_to_ntt_form(self._data)
-        self._is_ntt_form = True
-        self._compress()
+        Poly._transform_batch([self], True)
         return self
     
     def transform_from_ntt_form(self):
-        if self._ntt_engine == None:
-            raise Exception(f"set ntt engine before intt")
-        if self._is_ntt_form == False:
-            raise Exception(f"polynomial is already basic form")
-        if len(self._data) < self._poly_modulus:
-            self._data += [ 0 for _ in range(self._poly_modulus - len(self._data))]
-            raise Exception("polynomial is broken")
-        self._data = self._ntt_engine._transform_from_ntt_form(self._data)
-        self._is_ntt_form = False
-        self._compress()
+        Poly._transform_batch([self], False)
         return self
     
+    # transform polynomials over the same Z_q[X]/(X^N + 1) with one batched engine call
+    @staticmethod
+    def _transform_batch(polys : list[Self], to_ntt_form : bool):
+        polys = list({ id(poly): poly for poly in polys }.values())
+        if len(polys) == 0:
+            return polys
+        head = polys[0]
+        for poly in polys:
+            if poly._ntt_engine == None:
+                raise Exception(f"set ntt engine before ntt")
+            if poly._coeff_modulus != head._coeff_modulus or poly._poly_modulus != head._poly_modulus:
+                raise Exception(f"batch polynomials must share the same modulus")
+            if poly._is_ntt_form == to_ntt_form:
+                raise Exception(f"polynomial is already {'ntt' if to_ntt_form else 'basic'} form")
+        block = np.stack([ poly._data for poly in polys ])
+        if to_ntt_form:
+            head._ntt_engine._forward(block)
+        else:
+            head._ntt_engine._inverse(block)
+        for poly, row in zip(polys, block):
+            poly._data[...] = row
+            poly._is_ntt_form = to_ntt_form
+        return polys
+    
     def copy(self) -> Self:
-        temp_data = self._data.copy()
-        ret = Poly(self._coeff_modulus, self._poly_modulus, temp_data, self._is_ntt_form)\
-            ._set_ntt_engine(self._ntt_engine)\
-            ._compress()
+        ret = self._new(self._data.copy())
         ret._norm = self._norm
         return ret
     
     def add_inplace(self, other : Self):
-        if self._coeff_modulus != other._coeff_modulus:
-            raise Exception(f"except Z_{self._coeff_modulus} but Z_{other._coeff_modulus}")
-        if self._poly_modulus != other._poly_modulus:
-            raise Exception(f"except Z_{self._poly_modulus} but Z_{other._poly_modulus}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"polynomial form is not match")
-        if len(self._data) < len(other._data):
-            for i in range(len(self._data)):
-                self._data[i] = _modulus._centered_modulus(self._data[i] + other._data[i], self._coeff_modulus)
-            self._data += other._data[len(self._data):]
-        else:
-            for i in range(len(other._data)):
-                self._data[i] = _modulus._centered_modulus(self._data[i] + other._data[i], self._coeff_modulus)
+        self._check_operand(other)
+        self._data[...] = _vec_modulus._add_mod(self._data, other._data, self._q)
         return self
     
     def sub_inplace(self, other : Self):
-        if self._coeff_modulus != other._coeff_modulus:
-            raise Exception(f"except Z_{self._coeff_modulus} but Z_{other._coeff_modulus}")
-        if self._poly_modulus != other._poly_modulus:
-            raise Exception(f"except Z_{self._poly_modulus} but Z_{other._poly_modulus}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"polynomial form is not match")
-        if len(self._data) < len(other._data):
-            for i in range(len(self._data)):
-                self._data[i] = _modulus._centered_modulus(self._data[i] - other._data[i], self._coeff_modulus)
-            for i in range(len(self._data), len(other._data)):
-                self._data.append(_modulus._centered_modulus(-1 * other._data[i], self._coeff_modulus))
-        else:
-            for i in range(len(other._data)):
-                self._data[i] = _modulus._centered_modulus(self._data[i] - other._data[i], self._coeff_modulus)
+        self._check_operand(other)
+        self._data[...] = _vec_modulus._sub_mod(self._data, other._data, self._q)
         return self
     
     def neg_inplace(self):
-        for idx, d in enumerate(self._data):
-            self._data[idx] = _modulus._centered_modulus(-1 * (d + self._coeff_modulus), self._coeff_modulus)
+        self._data[...] = _vec_modulus._neg_mod(self._data, self._q)
         return self
     
     def mul_inplace(self, other : Self):
-        if self._coeff_modulus != other._coeff_modulus:
-            raise Exception(f"except Z_{self._coeff_modulus} but Z_{other._coeff_modulus}")
-        if self._poly_modulus != other._poly_modulus:
-            raise Exception(f"except Z_{self._poly_modulus} but Z_{other._poly_modulus}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"polynomial form is not match {self.is_ntt_form()} {other.is_ntt_form()}")
+        self._check_operand(other)
         if self.is_ntt_form():
-            for i in range(self._poly_modulus):
-                self._data[i] = _modulus._centered_modulus(self._data[i] * other._data[i], self._coeff_modulus)
+            self._data[...] = _vec_modulus._mul_mod(self._data, other._data, self._q, self._q_neg_inv, self._r2,\
+                self._special)
         else:
-            res = [0 for _ in range(len(self._data) + len(other._data))]
-            for i in range(len(self._data)):
-                for j in range(len(other._data)):
-                    res[i + j] = _modulus._centered_modulus(self._data[i] * other._data[j], self._coeff_modulus)
-            if len(res) >= self._poly_modulus:
-                for deg in range(len(res) - 1, self._poly_modulus - 1, -1):
-                    res[deg - self._poly_modulus] = _modulus._centered_modulus(res[deg - self._poly_modulus] - res[deg], self._coeff_modulus)
-            self._data = res
+            self._data[...] = self._negacyclic_mul(other)
         return self
     
     def mul_scalar_inplace(self, scalar : int):
-        for i in range(len(self._data)):
-            self._data[i] = _modulus._centered_modulus(self._data[i] * scalar, self._coeff_modulus)
+        scalar = int(scalar) % self._coeff_modulus
+        w_shoup = np.uint64(_vec_modulus._shoup_companion(scalar, self._coeff_modulus))
+        res = _vec_modulus._shoup_mul(self._data, np.uint64(scalar), w_shoup, self._q)
+        self._data[...] = _vec_modulus._reduce_2q(res, self._q)
         return self
     
     def mul_scalar(self, scalar : int):
@@ -218,43 +257,58 @@ class Poly:
         return ret
     
     def add_scalar_inplace(self, scalar : int):
+        scalar = np.uint64(int(scalar) % self._coeff_modulus)
         if self.is_ntt_form() == True:
-            for i in range(len(self._data)):
-                self._data[i] = _modulus._centered_modulus(self._data[i] + scalar, self._coeff_modulus)
+            self._data[...] = _vec_modulus._add_mod(self._data, scalar, self._q)
         else:
-            self._data[0] = _modulus._centered_modulus(self._data[0] + scalar, self._coeff_modulus)
+            self._data[:1] = _vec_modulus._add_mod(self._data[:1], scalar, self._q)
         return self
     
     def add_scalar(self, scalar : int):
         ret = self.copy()
         return ret.add_scalar_inplace(scalar)
     
+    # (k, c) when the polynomial is c * X^k in coefficient form (the zero polynomial is (0, 0)),
+    # None otherwise
+    def _monomial(self):
+        if self.is_ntt_form():
+            return None
+        nonzero = np.flatnonzero(self._data)
+        if len(nonzero) > 1:
+            return None
+        if len(nonzero) == 0:
+            return 0, 0
+        k = int(nonzero[0])
+        return k, int(self._data[k])
+    
+    # a(X) -> a(X^k), k odd
+    def apply_galois(self, k : int) -> Self:
+        _check_galois_element(self._poly_modulus, k)
+        if self.is_ntt_form():
+            return self._new(self._data[_galois_permutation(self._poly_modulus, k)])
+        dest, negate = _galois_coeff_map(self._poly_modulus, k)
+        res = np.zeros_like(self._data)
+        res[dest] = np.where(negate, _vec_modulus._neg_mod(self._data, self._q), self._data)
+        return self._new(res)
+    
     def equal(self, other : Self) -> bool:
         if self.is_ntt_form() != other.is_ntt_form():
             raise Exception(f"polynomial form is not match {self.is_ntt_form()} {other.is_ntt_form()}")
         if self._coeff_modulus != other._coeff_modulus or self._poly_modulus != other._poly_modulus:
             return False
-        for i in range(len(self._data)):
-            if self._data[i] != other._data[i]:
-                return False
-        return True
+        return bool(np.array_equal(self._data, other._data))
     
-    def centered_mod(self):
-        for i in range(len(self._data)):
-            self._data[i] = _modulus._centered_modulus(self._data[i], self._coeff_modulus)
-        return self
-        
     def toString(self, length=-1, print_zero=False) -> str:
         ret = ""
         if self.is_ntt_form():
             ret += "["
-            for idx, e in enumerate(self._data):
+            for idx, e in enumerate(self._data.tolist()):
                 if idx == length:
                     break
                 ret += f"{e}, "
             return ret[:-2] + "]"
         else:
-            for deg, coef in enumerate(self._data):
+            for deg, coef in enumerate(self._data.tolist()):
                 if deg == length:
                     break
                 if coef == 0 and not print_zero:
@@ -268,15 +322,15 @@ class Poly:
 if __name__ == "__main__":
     n = 8
     q = 12289
-    p1 = Poly(q, n, [1, 2, 3, 0, 4, 5, 6, 0, 0])
-    p2 = Poly(q, n, [2, 4, 6, 1])
+    engine = _NTT_Engine(n, q)
+    p1 = Poly(q, n, [1, 2, 3, 0, 4, 5, 6, 0, 0])._set_ntt_engine(engine)
+    p2 = Poly(q, n, [2, 4, 6, 1])._set_ntt_engine(engine)
     print("p1: " + p1.toString(True))
     print("p2: " + p2.toString())
-    print("compress: " + p1._compress().toString(True))
     print("p1 - p2: " + (p1 - p2).toString())
     print("p1 * p2: " + (p1 * p2).toString())
     print("p1 NTT: " + p1.transform_to_ntt_form().toString())
     print("p1 INTT: " + p1.transform_from_ntt_form().toString())
     print("p1 + p2: " + (p1 + p2).toString())
     p3 = (p1.transform_to_ntt_form() + p2.transform_to_ntt_form()).transform_from_ntt_form()
-    print("p1 + p2: " + p3.toString())
\ No newline at end of file
+    print("p1 + p2: " + p3.toString())
@@ -1,128 +1,281 @@
+import functools
+import operator
 from typing import Self
-from he.galois_ring.poly import Poly
-from _util import _modulus
+import numpy as np
+from he.galois_ring.poly import Poly, _modulus_constants, _modulus_special
+from he.galois_ring.poly import _check_galois_element, _galois_permutation, _galois_coeff_map, _slot_exponents
+from _util import _vec_modulus
+from _util import _sampler
 from he._ntt import _NTT_Engine
 
+# stacked (L, 1) modulus constants, broadcast over the (L, N) limb matrix
+@functools.lru_cache(maxsize=None)
+def _rns_constants(rns_base : tuple[int]):
+    constants = [ _modulus_constants(base) for base in rns_base ]
+    return tuple(np.array([ c[i] for c in constants ], dtype=np.uint64).reshape(-1, 1) for i in range(3))
+
+# stacked special prime constants when every limb is a special prime, None otherwise
+@functools.lru_cache(maxsize=None)
+def _rns_special(rns_base : tuple[int]):
+    constants = [ _modulus_special(base) for base in rns_base ]
+    if any(c == None for c in constants):
+        return None
+    stacked = tuple(np.array([ c[i] for c in constants ], dtype=np.uint64).reshape(-1, 1) for i in range(4))
+    return stacked + (max(c[4] for c in constants), max(c[5] for c in constants))
+
+# how many multiples of the largest limb modulus an unreduced word may hold
+@functools.lru_cache(maxsize=None)
+def _rns_lazy_limit(rns_base : tuple[int]) -> int:
+    return _vec_modulus._lazy_limit(max(rns_base))
+
+# psi^i for i in [0, 2N), psi the primitive 2N-th root of an ntt engine
+@functools.lru_cache(maxsize=None)
+def _psi_powers(n : int, q : int, psi : int) -> np.ndarray:
+    ret = [ 1 for _ in range(2 * n) ]
+    for i in range(1, 2 * n):
+        ret[i] = ret[i - 1] * psi % q
+    return np.array(ret, dtype=np.uint64)
+
+# dict-like access to the limbs of RNS_Poly
+# rns_poly._rns_poly[base] is a Poly whose data is a view of the limb row
+class _RNS_Poly_View:
+    def __init__(self, rns_poly):
+        self._parent = rns_poly
+
+    def __getitem__(self, base : int) -> Poly:
+        parent = self._parent
+        idx = parent._index(base)
+        return Poly(base, parent._poly_modulus, parent._data[idx], parent._is_ntt_form)\
+            ._set_ntt_engine(parent._ntt_engines[idx])
+
+    def __setitem__(self, base : int, poly : Poly):
+        self._parent._set_poly(poly)
+
+    def __contains__(self, base : int) -> bool:
+        return base in self._parent._rns_base
+
+    def __iter__(self):
+        return iter(self._parent._rns_base)
+
+    def __len__(self):
+        return len(self._parent._rns_base)
+
+    def keys(self):
+        return dict.fromkeys(self._parent._rns_base).keys()
+
+    def items(self):
+        return [ (base, self[base]) for base in self._parent._rns_base ]
+
+# polynomial in RNS form, limbs stored as one (L, N) uint64 matrix
+# row i holds residues modulo rns_base[i]
+# reduction is lazy: the raw buffer _buf holds values in [0, _bound * q) and
+# add / sub / mul / scalar ops only grow _bound until it would wrap a uint64 word.
+# reading _data reduces the buffer back to [0, q) first
 class RNS_Poly:
 
     def __init__(self, rns_base : list[int], poly_modulus : int, is_ntt_form=False):
         self._rns_base = rns_base
         self._poly_modulus = poly_modulus
-        self._rns_poly = { e: Poly(e, poly_modulus, [], is_ntt_form) for e in rns_base }
+        self._q, self._q_neg_inv, self._r2 = _rns_constants(tuple(rns_base))
+        self._special = _rns_special(tuple(rns_base))
+        self._max_bound = _rns_lazy_limit(tuple(rns_base))
+        self._data = np.zeros((len(rns_base), poly_modulus), dtype=np.uint64)
+        self._ntt_engines = [ None for _ in rns_base ]
+        self._rns_poly = _RNS_Poly_View(self)
         self._is_ntt_form = is_ntt_form
-
+    
+    # residues in [0, q), reduced on read
+    @property
+    def _data(self):
+        self._reduce()
+        return self._buf
+    
+    @_data.setter
+    def _data(self, data):
+        self._buf = data
+        self._bound = 1
+    
     def __add__(self, other : Self):
-        if self._rns_poly.keys() != other._rns_poly.keys():
-            raise Exception(f"Expect RNS base {self._rns_poly.keys()} but {other._rns_poly.keys()}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"form is different")
-        ret = RNS_Poly(self._rns_base, self._poly_modulus, self._is_ntt_form)
-        for rns_base in self._rns_base:
-            ret._rns_poly[rns_base] = self._rns_poly[rns_base] + other._rns_poly[rns_base]
-        return ret
+        self._check_operand(other)
+        self._fit(other, operator.add)
+        return self._new(self._buf + other._buf, self._bound + other._bound)
     
     def __neg__(self):
-        ret = RNS_Poly(self._rns_base)
-        for rns_base in self._rns_base:
-            ret[rns_base] = -ret[rns_base]
-        return ret
+        self._fit_neg()
+        return self._new(self._q * np.uint64(self._bound) - self._buf, self._bound + 1)
     
     def __sub__(self, other : Self):
-        if self._rns_poly.keys() != other._rns_poly.keys():
-            raise Exception(f"Expect RNS base {self._rns_poly.keys()} but {other._rns_poly.keys()}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"form is different")
+        self._check_operand(other)
+        self._fit(other, operator.add)
+        return self._new(self._buf + (self._q * np.uint64(other._bound) - other._buf), self._bound + other._bound)
+    
+    def __mul__(self, other : Self):
+        self._check_operand(other)
+        if not self.is_ntt_form():
+            ret = self.copy()
+            return ret.mul_inplace(other)
+        self._fit(other, operator.mul)
+        return self._new(_vec_modulus._mul_mod_lazy(self._buf, other._buf, self._q, self._q_neg_inv, self._r2,\
+            self._special), 2)
+    
+    def _new(self, data, bound=1) -> Self:
         ret = RNS_Poly(self._rns_base, self._poly_modulus, self._is_ntt_form)
-        for rns_base in self._rns_base:
-            ret._rns_poly[rns_base] = self._rns_poly[rns_base] - other._rns_poly[rns_base]
+        ret._data = data
+        ret._bound = bound
+        ret._ntt_engines = self._ntt_engines.copy()
         return ret
     
-    def __mul__(self, other : Self):
-        if self._rns_poly.keys() != other._rns_poly.keys():
-            raise Exception(f"Expect RNS base {self._rns_poly.keys()} but {other._rns_poly.keys()}")
+    def _reduce(self):
+        if self._bound > 1:
+            self._buf[...] = _vec_modulus._reduce_lazy(self._buf, self._q, self._bound)
+            self._bound = 1
+        return self
+    
+    # reduce operands until combine(bound, other bound) multiples of q fit in a word
+    # add / sub need bound + other bound, montgomery products need bound * other bound
+    def _fit(self, other : Self, combine):
+        if combine(self._bound, other._bound) > self._max_bound:
+            self._reduce()
+        if combine(self._bound, other._bound) > self._max_bound:
+            other._reduce()
+    
+    # q * bound - buf lies in (0, bound * q]: a zero becomes bound * q, so a negation
+    # needs one more multiple of q than the buffer it negates
+    def _fit_neg(self):
+        if self._bound + 1 > self._max_bound:
+            self._reduce()
+    
+    def _index(self, base : int) -> int:
+        if base not in self._rns_base:
+            raise Exception(f"no RNS modulus {base}")
+        return self._rns_base.index(base)
+    
+    def _check_operand(self, other : Self):
+        if self._rns_base != other._rns_base:
+            raise Exception(f"Expect RNS base {self._rns_base} but {other._rns_base}")
         if self.is_ntt_form() != other.is_ntt_form():
             raise Exception(f"form is different")
-        ret = RNS_Poly(self._rns_base, self._poly_modulus, self._is_ntt_form)
-        for rns_base in self._rns_base:
-            ret._rns_poly[rns_base] = self._rns_poly[rns_base] * other._rns_poly[rns_base]
-        return ret
-
+    
     def _set_poly(self, rns_poly : Poly):
-        if rns_poly._coeff_modulus not in self._rns_poly:
-            raise Exception(f"no RNS modulus {rns_poly._coeff_modulus}")
+        idx = self._index(rns_poly._coeff_modulus)
         if rns_poly.is_ntt_form() != self.is_ntt_form():
             raise Exception(f"Expect is_ntt_form {self._is_ntt_form} but {rns_poly.is_ntt_form()}")
-        self._rns_poly[rns_poly._coeff_modulus] = rns_poly
+        self._data[idx] = rns_poly._data
+        if rns_poly._ntt_engine != None:
+            self._ntt_engines[idx] = rns_poly._ntt_engine
         return self
     
+    # lift polynomial over Z_t to every RNS limb, coefficients read in centered form
     def _eval_rns(self, poly : Poly):
         if poly.is_ntt_form():
             raise Exception("polynomial must be basic form")
         self._is_ntt_form = False
-        for rns_base in self._rns_base:
-            temp_ntt_engine = self._rns_poly[rns_base]._ntt_engine
-            self._rns_poly[rns_base] = Poly(rns_base, poly._poly_modulus, [], poly.is_ntt_form())\
-                ._set_ntt_engine(temp_ntt_engine)
-            for idx, coeff in enumerate(poly._data):
-                if idx >= len(self._rns_poly[rns_base]._data):
-                    self._rns_poly[rns_base]._data.append(_modulus._centered_modulus(coeff, rns_base))
-                else:
-                    self._rns_poly[rns_base]._data[idx] = _modulus._centered_modulus(coeff, rns_base)
+        self._data = _vec_modulus._centered_lift(poly._data.reshape(1, -1), poly._q, self._q)
         return self
     
-    def _eval_centered_mod(self):
-        ntt_flag = False
+    # uniform polynomial expanded from a seed, limb i from the stream (seed, i)
+    # so the limbs of a lower level are the prefix of the expansion
+    @staticmethod
+    def _from_seed(rns_base : list[int], poly_modulus : int, seed : bytes, is_ntt_form=True) -> Self:
+        ret = RNS_Poly(rns_base, poly_modulus, is_ntt_form)
+        ret._data = np.stack([ _sampler._sample_uniform(seed, idx, poly_modulus, base)\
+            for idx, base in enumerate(rns_base) ])
+        return ret
+    
+    # the limbs of a prefix rns_base of this polynomial's base, sharing its buffer
+    def _restrict(self, rns_base : list[int]) -> Self:
+        if rns_base == self._rns_base:
+            return self
+        if rns_base != self._rns_base[:len(rns_base)]:
+            raise Exception(f"RNS base {rns_base} is not a prefix of {self._rns_base}")
+        ret = RNS_Poly(rns_base, self._poly_modulus, self._is_ntt_form)
+        ret._data = self._buf[:len(rns_base)]
+        ret._bound = self._bound
+        ret._ntt_engines = self._ntt_engines[:len(rns_base)]
+        return ret
+    
+    # drop the last limb q_L: x -> (x - delta) / q_L over the remaining limbs
+    # delta = x mod q_L (centered) + q_L * u with u = -x * q_L^-1 mod t, so delta = 0 mod t
+    # and the plaintext under a ciphertext component is only scaled by q_L^-1 mod t
+    def mod_switch_to_next(self, plain_modulus : int) -> Self:
         if self.is_ntt_form():
-            ntt_flag = True
-            self.transform_from_ntt_form()
-        for _, _poly in self._rns_poly.items():
-            _poly.centered_mod()
-        if ntt_flag:
-            self.transform_to_ntt_form()
-
+            raise Exception("polynomial must be basic form")
+        if len(self._rns_base) == 1:
+            raise Exception("no RNS modulus left to drop")
+        last = self._rns_base[-1]
+        rns_base = self._rns_base[:-1]
+        q_last = np.uint64(last)
+        t, t_neg_inv, t_r2 = _modulus_constants(plain_modulus)
+        q, q_neg_inv, r2 = _rns_constants(tuple(rns_base))
+        neg_last_inv_t = np.uint64((-pow(last, -1, plain_modulus)) % plain_modulus)
+        last_mod_q = np.array([ last % base for base in rns_base ], dtype=np.uint64).reshape(-1, 1)
+        last_inv = np.array([ pow(last, -1, base) for base in rns_base ], dtype=np.uint64).reshape(-1, 1)
+        r = self._data[-1:]
+        u = _vec_modulus._mul_mod(_vec_modulus._centered_lift(r, q_last, t), neg_last_inv_t, t, t_neg_inv, t_r2)
+        delta = _vec_modulus._add_mod(_vec_modulus._centered_lift(r, q_last, q),\
+            _vec_modulus._mul_mod(_vec_modulus._centered_lift(u, t, q), last_mod_q, q, q_neg_inv, r2), q)
+        ret = RNS_Poly(rns_base, self._poly_modulus)
+        ret._data = _vec_modulus._mul_mod(_vec_modulus._sub_mod(self._data[:-1], delta, q), last_inv, q, q_neg_inv, r2)
+        ret._ntt_engines = self._ntt_engines[:-1]
+        return ret
+    
     def _set_ntt_engine(self, prime : int, ntt_engines : _NTT_Engine):
         if prime not in self._rns_base:
             raise Exception(f"Invalid RNS modulus")
-        self._rns_poly[prime]._set_ntt_engine(ntt_engines)
+        self._ntt_engines[self._index(prime)] = ntt_engines
         return self
     
     def _set_ntt_engines(self, ntt_engine : dict[int, _NTT_Engine]):
-        for base in self._rns_base:
+        for idx, base in enumerate(self._rns_base):
             if base not in ntt_engine.keys():
                 raise Exception("Invalid ntt engine dictionary")
-            self._rns_poly[base]._set_ntt_engine(ntt_engine[base])
+            self._ntt_engines[idx] = ntt_engine[base]
         return self
     
+    # transform several RNS polynomials at once: all limbs sharing a modulus go
+    # through one batched engine call, so each engine is entered once per batch
+    @staticmethod
+    def _transform_batch(rns_polys : list[Self], to_ntt_form : bool):
+        rns_polys = list({ id(rns_poly): rns_poly for rns_poly in rns_polys }.values())
+        if len(rns_polys) == 0:
+            return rns_polys
+        head = rns_polys[0]
+        for rns_poly in rns_polys:
+            if rns_poly._rns_base != head._rns_base:
+                raise Exception(f"Expect RNS base {head._rns_base} but {rns_poly._rns_base}")
+            if rns_poly._is_ntt_form == to_ntt_form:
+                raise Exception(f"polynomial is already {'ntt' if to_ntt_form else 'basic'} form")
+        for idx in range(len(head._rns_base)):
+            engine = head._ntt_engines[idx]
+            if engine == None:
+                raise Exception(f"set ntt engine before ntt")
+            block = np.stack([ rns_poly._data[idx] for rns_poly in rns_polys ])
+            if to_ntt_form:
+                engine._forward(block)
+            else:
+                engine._inverse(block)
+            for rns_poly, row in zip(rns_polys, block):
+                rns_poly._data[idx] = row
+        for rns_poly in rns_polys:
+            rns_poly._is_ntt_form = to_ntt_form
+        return rns_polys
+    
     def transform_to_ntt_form(self):
-        if self._is_ntt_form == True:
-            raise Exception(f"polynomial is already ntt form")
-        for _, poly in self._rns_poly.items():
-            poly.transform_to_ntt_form()
-        self._is_ntt_form = True
+        RNS_Poly._transform_batch([self], True)
         return self
     
     def transform_from_ntt_form(self):
-        if self._is_ntt_form == False:
-            raise Exception(f"polynomial is already basic form")
-        for _, poly in self._rns_poly.items():
-            poly.transform_from_ntt_form()
-        self._is_ntt_form = False
+        RNS_Poly._transform_batch([self], False)
         return self
     
     def copy(self) -> Self:
-        ret = RNS_Poly(self._rns_base, self._poly_modulus)
-        ret._is_ntt_form = self._is_ntt_form
-        for _, poly in self._rns_poly.items():
-            ret._set_poly(poly.copy())
-        return ret
+        return self._new(self._buf.copy(), self._bound)
     
     def add_inplace(self, other : Self):
-        if self._rns_poly.keys() != other._rns_poly.keys():
-            raise Exception(f"Expect RNS base {self._rns_poly.keys()} but {other._rns_poly.keys()}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"form is different")
-        for base, poly in self._rns_poly.items():
-            poly.add_inplace(other._rns_poly[base])
+        self._check_operand(other)
+        self._fit(other, operator.add)
+        self._buf += other._buf
+        self._bound += other._bound
         return self
     
     def add_poly_inplace(self, other : Poly):
@@ -133,12 +286,10 @@ class RNS_Poly:
         self.add_inplace(other_rns)
     
     def sub_inplace(self, other : Self):
-        if self._rns_poly.keys() != other._rns_poly.keys():
-            raise Exception(f"Expect RNS base {self._rns_poly.keys()} but {other._rns_poly.keys()}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"form is different")
-        for base, poly in self._rns_poly.items():
-            poly.sub_inplace(other._rns_poly[base])
+        self._check_operand(other)
+        self._fit(other, operator.add)
+        self._buf += self._q * np.uint64(other._bound) - other._buf
+        self._bound += other._bound
         return self
     
     def sub_poly_inplace(self, other : Poly):
@@ -149,17 +300,34 @@ class RNS_Poly:
         self.sub_inplace(other_rns)
     
     def neg_inplace(self):
-        for _, poly in self._rns_poly.items():
-            poly.neg_inplace()
+        self._fit_neg()
+        self._buf[...] = self._q * np.uint64(self._bound) - self._buf
+        self._bound += 1
         return self
     
     def mul_inplace(self, other : Self):
-        if self._rns_poly.keys() != other._rns_poly.keys():
-            raise Exception(f"Expect RNS base {self._rns_poly.keys()} but {other._rns_poly.keys()}")
-        if self.is_ntt_form() != other.is_ntt_form():
-            raise Exception(f"form is different")
-        for base, poly in self._rns_poly.items():
-            poly.mul_inplace(other._rns_poly[base])
+        self._check_operand(other)
+        if self.is_ntt_form():
+            self._fit(other, operator.mul)
+            self._buf[...] = _vec_modulus._mul_mod_lazy(self._buf, other._buf, self._q, self._q_neg_inv, self._r2,\
+                self._special)
+            self._bound = 2
+        else:
+            for base in self._rns_base:
+                self._rns_poly[base].mul_inplace(other._rns_poly[base])
+        return self
+    
+    # self += a * b, the product is accumulated without being reduced
+    def mul_add_inplace(self, a : Self, b : Self):
+        self._check_operand(a)
+        if not self.is_ntt_form():
+            return self.add_inplace(a * b)
+        a._check_operand(b)
+        a._fit(b, operator.mul)
+        if self._bound + 2 > self._max_bound:
+            self._reduce()
+        self._buf += _vec_modulus._mul_mod_lazy(a._buf, b._buf, self._q, self._q_neg_inv, self._r2, self._special)
+        self._bound += 2
         return self
     
     def mul_poly_inplace(self, other : Poly):
@@ -173,32 +341,82 @@ class RNS_Poly:
             self.transform_to_ntt_form()
         self.mul_inplace(other_rns)
     
+    # self *= c * X^k: a negacyclic shift of the coefficients in coefficient form,
+    # a product with the slots psi^(k * e_j) of X^k in ntt form, then a scalar product
+    def mul_monomial_inplace(self, k : int, c : int):
+        n = self._poly_modulus
+        k %= 2 * n
+        if self.is_ntt_form():
+            if k != 0:
+                exponents = (k * _slot_exponents(n)) % (2 * n)
+                for engine in self._ntt_engines:
+                    if engine == None:
+                        raise Exception(f"set ntt engine before ntt")
+                slots = np.stack([ _psi_powers(n, engine._q, engine._psi)[exponents] for engine in self._ntt_engines ])
+                self._buf[...] = _vec_modulus._mul_mod_lazy(self._buf, slots, self._q, self._q_neg_inv, self._r2,\
+                    self._special)
+                self._bound = 2
+        else:
+            if k >= n:
+                k -= n
+                c = -c
+            if k != 0:
+                self._fit_neg()
+                shifted = np.roll(self._buf, k, axis=1)
+                shifted[:, :k] = self._q * np.uint64(self._bound) - shifted[:, :k]
+                self._buf[...] = shifted
+                self._bound += 1
+        if c != 1:
+            self.mul_scalar_inplace(c)
+        return self
+    
     def mul_scalar_inplace(self, scalar : int):
-        for _, poly in self._rns_poly.items():
-            poly.mul_scalar_inplace(scalar)
+        scalar = int(scalar)
+        w = np.array([ scalar % base for base in self._rns_base ], dtype=np.uint64).reshape(-1, 1)
+        w_shoup = np.array([ _vec_modulus._shoup_companion(scalar % base, base) for base in self._rns_base ],\
+            dtype=np.uint64).reshape(-1, 1)
+        self._buf[...] = _vec_modulus._shoup_mul(self._buf, w, w_shoup, self._q)
+        self._bound = 2
         return self
     
     def mul_scalar(self, scalar : int):
         ret = self.copy()
         ret.mul_scalar_inplace(scalar)
-        return self
+        return ret
     
     def add_scalar_inplace(self, scalar : int):
-        for _, poly in self._rns_poly.items():
-            poly.add_scalar_inplace(scalar)
+        scalar = int(scalar)
+        w = np.array([ scalar % base for base in self._rns_base ], dtype=np.uint64).reshape(-1, 1)
+        if self._bound + 1 > self._max_bound:
+            self._reduce()
+        if self.is_ntt_form():
+            self._buf += w
+        else:
+            self._buf[:, :1] += w
+        self._bound += 1
         return self
     
     def add_scalar(self, scalar : int):
         ret = self.copy()
         return ret.add_scalar_inplace(scalar)
     
+    # a(X) -> a(X^k) on every limb, k odd
+    def apply_galois(self, k : int) -> Self:
+        _check_galois_element(self._poly_modulus, k)
+        if self.is_ntt_form():
+            return self._new(self._buf[:, _galois_permutation(self._poly_modulus, k)], self._bound)
+        dest, negate = _galois_coeff_map(self._poly_modulus, k)
+        self._fit_neg()
+        res = np.zeros_like(self._buf)
+        res[:, dest] = np.where(negate, self._q * np.uint64(self._bound) - self._buf, self._buf)
+        return self._new(res, self._bound + 1)
+    
     def equal(self, other : Self) -> bool:
         if self.is_ntt_form() != other.is_ntt_form():
             raise Exception(f"polynomial form is not match {self.is_ntt_form()} {other.is_ntt_form()}")
-        for base in self._rns_base:
-            if not self._rns_poly[base].equal(other._rns_poly[base]):
-                return False
-        return True
+        if self._rns_base != other._rns_base:
+            return False
+        return bool(np.array_equal(self._data, other._data))
     
     def is_ntt_form(self) -> bool:
         return self._is_ntt_form
@@ -212,7 +430,7 @@ class RNS_Poly:
 if __name__ == "__main__":
     n = 8
     q = 12289
-    rp1 = RNS_Poly([7, 11, 12289])
+    rp1 = RNS_Poly([7681, 12289], n)
     p1 = Poly(q, n, [2, 8, 12, 0, 7])
     rp1._set_poly(p1)
-    print(rp1.toString())
\ No newline at end of file
+    print(rp1.toString())
@@ -1,8 +1,40 @@
+import json
+import numpy as np
 from _util import _prime as prime
 from _util import _modulus
-from he._ntt import _NTT_Engine
+from _util import _vec_modulus
+from _util import _sampler
+from he._ntt import _NTT_Engine, _NTT_Engine_Numpy, _NTT_Engine_Shoup, _NTT_Handle, _NTT_REGISTRY
 
 HE_SCHEME = {"bv", "bgv", "bfv"}
+# file layout of HE_Parameter.save: magic, header length (uint64), json header,
+# zero padding to _ALIGN bytes, then the uint64 tables, each starting on an _ALIGN boundary
+_MAGIC = b"HEPARAM1"
+_ALIGN = 64
+NTT_BACKEND = {"python": _NTT_Engine, "numpy": _NTT_Engine_Numpy, "shoup": _NTT_Engine_Shoup}
+
+# precomputed tables for CRT reconstruction over an RNS base Q = q_1 ... q_L
+# x = sum_i y_i * qhat_i - v * Q with y_i = [r_i * qhat_i^-1]_{q_i}, qhat_i = Q / q_i
+# and v = round(sum_i y_i / q_i), which gives the centered representative of x mod Q
+# per-limb tables are (L, 1) arrays broadcast over the (L, N) limb matrix
+class _CRT_Tables:
+    def __init__(self, rns_base : list[int], plain_modulus=None):
+        self._rns_base = list(rns_base)
+        self._total_modulus = 1
+        for base in rns_base:
+            self._total_modulus *= base
+        qhat = [ self._total_modulus // base for base in rns_base ]
+        self._qhat = qhat
+        qhat_inv = [ _modulus._mod_inverse(qhat_i % base, base) for qhat_i, base in zip(qhat, rns_base) ]
+        self._q = np.array(rns_base, dtype=np.uint64).reshape(-1, 1)
+        self._q_float = np.array(rns_base, dtype=np.float64).reshape(-1, 1)
+        self._qhat_inv = np.array(qhat_inv, dtype=np.uint64).reshape(-1, 1)
+        self._qhat_inv_shoup = np.array([ _vec_modulus._shoup_companion(w, base)\
+            for w, base in zip(qhat_inv, rns_base) ], dtype=np.uint64).reshape(-1, 1)
+        self._plain_modulus = plain_modulus
+        if plain_modulus != None:
+            self._qhat_mod_t = [ np.uint64(qhat_i % plain_modulus) for qhat_i in qhat ]
+            self._q_mod_t = np.uint64(self._total_modulus % plain_modulus)
 
 class HE_Parameter:
     def __init__(
@@ -11,9 +43,11 @@ class HE_Parameter:
         poly_modulus_deg=0,
         coeff_modulus_bits=[0],
         plain_modulus_bit=0,
-        debug=False
+        debug=False,
+        prime_mode="random"
     ):
         self.set_scheme(scheme)
+        self.set_prime_mode(prime_mode)
         if poly_modulus_deg != 0:
             self.set_poly_modulus(poly_modulus_deg)
         else:
@@ -24,6 +58,8 @@ class HE_Parameter:
             self.set_plain_modulus(plain_modulus_bit)
         self._secret_key_bound = -1
         self._first_error_bound = -1
+        self._error_sigma = 0
+        self._error_cdt = None
         self._debug = debug
         self._setup_complete = False
         
@@ -33,6 +69,19 @@ class HE_Parameter:
         self.scheme = scheme
         return self
     
+    # "catalogue": the largest NTT-friendly primes, bundled in _util._prime_catalogue, so every
+    #              run gets the same parameters and parameter sets share their NTT engines
+    # "random" (default): fresh primes from a random starting point on every call
+    # "special": coefficient primes 2^k - c * 2^m + 1 only, multiplied with shift-add reduction
+    #            (catalogue primes mostly have this form already); limbs below about 38 bits
+    #            (more for larger N) have none and are rejected, see _prime._special_bit_lengths;
+    #            pointwise products use it on every backend, transforms only on "numpy"
+    def set_prime_mode(self, prime_mode : str):
+        if prime_mode not in prime.PRIME_MODE:
+            raise Exception(f"prime mode \"{prime_mode}\" is not exist")
+        self.prime_mode = prime_mode
+        return self
+    
     def set_poly_modulus(self, poly_modulus_deg : int):
         if poly_modulus_deg <= 0:
             raise Exception("Invalid Parameter: poly_modulus_deg must be positive integer")
@@ -45,7 +94,8 @@ class HE_Parameter:
         if self.poly_modulus == 0:
             raise Exception("poly modulus must be set before coeff modulus")
         self.coeff_modulus_bits = coeff_modulus_bits
-        self.coeff_modulus = prime._generate_rns_bases(coeff_modulus_bits, self.poly_modulus)
+        self.coeff_modulus = prime._generate_rns_bases(coeff_modulus_bits, self.poly_modulus, self.prime_mode,\
+            [ getattr(self, "plain_modulus", None) ])
         self._total_modulus = 1
         for base in self.coeff_modulus:
             self._total_modulus *= base
@@ -54,6 +104,8 @@ class HE_Parameter:
             M_i = self._total_modulus // base
             y_i = _modulus._mod_inverse(M_i, base)
             self._basis[base] = M_i * y_i
+        self._crt_cache = {}
+        self._crt_tables(self.coeff_modulus)
         return self
     
     def set_plain_modulus(self, plain_modulus_bit : int):
@@ -62,26 +114,173 @@ class HE_Parameter:
         if self.poly_modulus == 0:
             raise Exception("poly modulus must be set before coeff modulus")
         self.plain_modulus_bit = plain_modulus_bit
-        self.plain_modulus = prime._generate_prime(plain_modulus_bit, self.poly_modulus)
+        # plaintext moduli are usually too small for a shift-add reduction, take them from the catalogue
+        plain_mode = "catalogue" if self.prime_mode == "special" else self.prime_mode
+        self.plain_modulus = prime._generate_prime(plain_modulus_bit, self.poly_modulus, plain_mode,\
+            getattr(self, "coeff_modulus", []))
+        if hasattr(self, "coeff_modulus"):
+            self._crt_cache = {}
+            self._crt_tables(self.coeff_modulus)
         return self
     
+    # CRT tables of rns_base (the full coefficient modulus or a prefix of it)
+    def _crt_tables(self, rns_base : list[int]) -> _CRT_Tables:
+        key = tuple(rns_base)
+        if key not in self._crt_cache:
+            self._crt_cache[key] = _CRT_Tables(rns_base, getattr(self, "plain_modulus", None))
+        return self._crt_cache[key]
+    
+    # errors are uniform in [-first_error_bound, first_error_bound] (0: noiseless)
+    # until set_error_sigma switches them to a discrete gaussian
     def set_bound(self, secret_key_bound : int, first_error_bound : int):
         self._secret_key_bound = secret_key_bound
         self._first_error_bound = first_error_bound
+        self._error_sigma = 0
+        self._error_cdt = None
         return self
     
-    def generate_context(self):
+    # discrete gaussian errors of width sigma truncated at tail * sigma, sampled from a
+    # cumulative distribution table built once here; the truncation becomes the error bound
+    def set_error_sigma(self, sigma : float, tail=6.0):
+        if sigma <= 0:
+            raise Exception("Invalid Parameter: sigma must be positive")
+        self._error_sigma = sigma
+        self._error_cdt = _sampler._gaussian_cdt(float(sigma), float(tail))
+        self._first_error_bound = len(self._error_cdt) - 1
+        return self
+    
+    # ntt_backend: "python" (pure python butterflies), "numpy" (vectorized uint64 stages)
+    #              or "shoup" (numpy with Shoup twiddles and lazy reduction)
+    # with prime_mode "special" only the "numpy" transform uses the shift-add reduction; "shoup"
+    # keeps its precomputed twiddle companions (faster still) and "python" reduces with %
+    def generate_context(self, ntt_backend="python"):
         # generate ntt tables
         if self.poly_modulus == 0 or self.coeff_modulus == None or self.plain_modulus == None\
             or self._secret_key_bound == -1 or self._first_error_bound == -1:
             raise Exception("set parameters before generate context")
+        if ntt_backend not in NTT_BACKEND:
+            raise Exception(f"ntt backend \"{ntt_backend}\" is not exist")
+        self.ntt_backend = ntt_backend
+        # handles only, the tables are built by the shared registry on the first transform
+        engine = NTT_BACKEND[ntt_backend]
         self.ntt_engines = dict()
         for base in self.coeff_modulus:
-            self.ntt_engines[base] = _NTT_Engine(self.poly_modulus, base)
-        self.ntt_engines[self.plain_modulus] = _NTT_Engine(self.poly_modulus, self.plain_modulus)
+            self.ntt_engines[base] = _NTT_Handle(self.poly_modulus, base, engine)
+        self.ntt_engines[self.plain_modulus] = _NTT_Handle(self.poly_modulus, self.plain_modulus, engine)
         self._setup_complete = True
         return self
     
+    # hit / miss / eviction counters of the process-wide NTT engine registry
+    @staticmethod
+    def ntt_registry_stats() -> dict:
+        return _NTT_REGISTRY.stats()
+    
+    @staticmethod
+    def set_ntt_registry_size(maxsize : int):
+        _NTT_REGISTRY.resize(maxsize)
+    
+    # primes, CRT basis, error table and (after generate_context) every NTT engine table
+    def save(self, path : str):
+        tables = []
+        offset = 0
+        def put(value):
+            nonlocal offset
+            if value is None:
+                return None
+            if isinstance(value, list):
+                return dict(put(np.array(value, dtype=np.uint64)), kind="list")
+            if isinstance(value, np.ndarray):
+                array = np.ascontiguousarray(value, dtype="<u8")
+                entry = {"kind": "array", "offset": offset, "shape": list(array.shape)}
+                tables.append(array)
+                offset += -(-array.nbytes // _ALIGN) * _ALIGN
+                return entry
+            if isinstance(value, np.integer):
+                return {"kind": "uint64", "value": int(value)}
+            if isinstance(value, tuple):
+                return {"kind": "tuple", "value": [ put(e) for e in value ]}
+            return {"kind": "int", "value": value}
+        header = {
+            "scheme": self.scheme,
+            "prime_mode": self.prime_mode,
+            "poly_modulus": self.poly_modulus,
+            "coeff_modulus_bits": self.coeff_modulus_bits,
+            "coeff_modulus": self.coeff_modulus,
+            "basis": [ self._basis[base] for base in self.coeff_modulus ],
+            "plain_modulus_bit": self.plain_modulus_bit,
+            "plain_modulus": self.plain_modulus,
+            "secret_key_bound": self._secret_key_bound,
+            "first_error_bound": self._first_error_bound,
+            "error_sigma": self._error_sigma,
+            "error_cdt": put(self._error_cdt),
+            "debug": self._debug,
+            "ntt_backend": self.ntt_backend if self._setup_complete else None,
+            "ntt_engines": [ [ modulus, { name : put(value) for name, value in engine._export().items() } ]\
+                for modulus, engine in self.ntt_engines.items() ] if self._setup_complete else [],
+        }
+        header = json.dumps(header).encode()
+        start = -(-(len(_MAGIC) + 8 + len(header)) // _ALIGN) * _ALIGN
+        with open(path, "wb") as f:
+            f.write(_MAGIC + len(header).to_bytes(8, "little") + header)
+            f.write(bytes(start - f.tell()))
+            for array in tables:
+                f.write(array.tobytes())
+                f.write(bytes(-array.nbytes % _ALIGN))
+        return self
+    
+    # tables are memory-mapped read-only, nothing is regenerated except the CRT tables
+    # the restored engines replace nothing already in the NTT registry
+    @staticmethod
+    def load(path : str):
+        with open(path, "rb") as f:
+            if f.read(len(_MAGIC)) != _MAGIC:
+                raise Exception(f"{path} is not a saved HE_Parameter")
+            length = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(length))
+        start = -(-(len(_MAGIC) + 8 + length) // _ALIGN) * _ALIGN
+        blob = None
+        def get(entry):
+            nonlocal blob
+            if entry == None:
+                return None
+            if entry["kind"] == "int":
+                return entry["value"]
+            if entry["kind"] == "uint64":
+                return np.uint64(entry["value"])
+            if entry["kind"] == "tuple":
+                return tuple(get(e) for e in entry["value"])
+            if blob is None:
+                blob = np.memmap(path, dtype="<u8", mode="r", offset=start)
+            size = int(np.prod(entry["shape"]))
+            array = blob[entry["offset"] // 8:entry["offset"] // 8 + size].reshape(entry["shape"])
+            return array.tolist() if entry["kind"] == "list" else array
+        ret = HE_Parameter(header["scheme"], debug=header["debug"], prime_mode=header["prime_mode"])
+        ret.poly_modulus = header["poly_modulus"]
+        ret.coeff_modulus_bits = header["coeff_modulus_bits"]
+        ret.coeff_modulus = header["coeff_modulus"]
+        ret._basis = dict(zip(ret.coeff_modulus, header["basis"]))
+        ret._total_modulus = 1
+        for base in ret.coeff_modulus:
+            ret._total_modulus *= base
+        ret.plain_modulus_bit = header["plain_modulus_bit"]
+        ret.plain_modulus = header["plain_modulus"]
+        ret._secret_key_bound = header["secret_key_bound"]
+        ret._first_error_bound = header["first_error_bound"]
+        ret._error_sigma = header["error_sigma"]
+        ret._error_cdt = get(header["error_cdt"])
+        ret._crt_cache = {}
+        ret._crt_tables(ret.coeff_modulus)
+        if header["ntt_backend"] != None:
+            engine = NTT_BACKEND[header["ntt_backend"]]
+            ret.ntt_backend = header["ntt_backend"]
+            ret.ntt_engines = dict()
+            for modulus, state in header["ntt_engines"]:
+                restored = _NTT_REGISTRY._insert((ret.poly_modulus, modulus, engine.__name__),\
+                    engine._restore({ name : get(entry) for name, entry in state.items() }))
+                ret.ntt_engines[modulus] = _NTT_Handle(ret.poly_modulus, modulus, engine, restored)
+            ret._setup_complete = True
+        return ret
+    
     def toString(self):
         ret = ""
         ret += f"scheme: {self.scheme}\n"
@@ -92,5 +291,9 @@ class HE_Parameter:
             ret += f"coeff modulus bits: {self.coeff_modulus_bits}\n"
         if self.plain_modulus != None:
             ret += f"plain modulus: {self.plain_modulus}\n"
+        if self._error_sigma > 0:
+            ret += f"error sigma: {self._error_sigma}\n"
+        if self._setup_complete:
+            ret += f"ntt backend: {self.ntt_backend}\n"
         ret += f"setup complete: {self._setup_complete}\n"
         return ret
\ No newline at end of file
@@ -1,9 +1,12 @@
-from _util import _random
+import numpy as np
+from _util import _sampler
 from _util import _modulus
 from he.galois_ring.poly import Poly
 from he.galois_ring.rns_poly import RNS_Poly
 from he.ciphertext import Ciphertext
 from he.he_parameter import HE_Parameter
+from he.relin_keys import Relin_Keys
+from he.galois_keys import Galois_Keys
 
 class Key_Generator:
     def __init__(self, parameter : HE_Parameter):
@@ -11,30 +14,56 @@ class Key_Generator:
             raise Exception("parameter setting is not complete")
         self.param = parameter
 
-    def _generate_random_poly(self, bound : int) -> list[int]:
+    # count whole polynomials of integers in [-bound, bound], expanded from a fresh seed
+    def _generate_random_poly(self, bound : int, count=1) -> np.ndarray:
         if bound < 0:
             raise Exception("bound must be positive integer")
-        ret = []
-        for _ in range(self.param.poly_modulus):
-            ret.append(_random._random_bound_int(bound))
-        return ret
+        return _sampler._sample_bounded(_sampler._new_seed(), 0, count * self.param.poly_modulus, bound)
 
     def generate_bound_poly(self, modulus : int, bound : int) -> Poly:
         if bound < 0:
             raise Exception("bound must be positive integer")
-        return Poly(modulus, self.param.poly_modulus, self._generate_random_poly(bound))\
-            ._set_ntt_engine(self.param.ntt_engines[modulus])
+        residues = (self._generate_random_poly(bound) % modulus).astype(np.uint64)
+        return Poly(modulus, self.param.poly_modulus, residues)._set_ntt_engine(self.param.ntt_engines[modulus])
+
+    # small signed integers (one row of N per polynomial) as residues of every limb
+    def _signed_rns_polys(self, values : np.ndarray) -> list[RNS_Poly]:
+        q = np.array(self.param.coeff_modulus, dtype=np.int64).reshape(1, -1, 1)
+        data = (values.reshape(-1, 1, self.param.poly_modulus) % q).astype(np.uint64)
+        ret = []
+        for limbs in data:
+            rns_poly = RNS_Poly(self.param.coeff_modulus, self.param.poly_modulus)
+            rns_poly._data = limbs
+            ret.append(rns_poly._set_ntt_engines(self.param.ntt_engines))
+        return ret
 
     # for public key, secret key, error
     def generate_bound_rns_poly(self, bound : int) -> RNS_Poly:
-        if bound < 0:
-            raise Exception("bound must be positive integer")
-        ret = RNS_Poly(self.param.coeff_modulus, self.param.poly_modulus)
-        poly = self.generate_bound_poly(self.param.plain_modulus, bound)
-        ret._eval_rns(poly)
-        for coeff, poly in ret._rns_poly.items():
-            poly._set_ntt_engine(self.param.ntt_engines[coeff])
-        return ret
+        return self.generate_bound_rns_polys(bound, 1)[0]
+    
+    def generate_bound_rns_polys(self, bound : int, count : int) -> list[RNS_Poly]:
+        return self._signed_rns_polys(self._generate_random_poly(bound, count))
+    
+    # count error polynomials drawn from one seed expansion: discrete gaussian after
+    # HE_Parameter.set_error_sigma, uniform in [-first_error_bound, first_error_bound] otherwise
+    def generate_error_rns_polys(self, count : int) -> list[RNS_Poly]:
+        n = count * self.param.poly_modulus
+        if self.param._error_cdt is not None:
+            values = _sampler._sample_gaussian(_sampler._new_seed(), 0, n, self.param._error_cdt)
+        else:
+            values = self._generate_random_poly(self.param._first_error_bound, count)
+        return self._signed_rns_polys(values)
+    
+    def generate_error_rns_poly(self) -> RNS_Poly:
+        return self.generate_error_rns_polys(1)[0]
+    
+    # uniform over Z_Q, sampled directly in NTT form
+    # the same seed always expands to the same polynomial, see RNS_Poly._from_seed
+    def generate_uniform_rns_poly(self, seed : bytes = None) -> RNS_Poly:
+        if seed == None:
+            seed = _sampler._new_seed()
+        return RNS_Poly._from_seed(self.param.coeff_modulus, self.param.poly_modulus, seed)\
+            ._set_ntt_engines(self.param.ntt_engines)
     
     def generate_secret_key(self) -> RNS_Poly:
         return self.generate_bound_rns_poly(self.param._secret_key_bound).transform_to_ntt_form()
@@ -42,24 +71,55 @@ class Key_Generator:
     def generate_public_key(self, secret_key : RNS_Poly) -> Ciphertext:
         if not secret_key.is_ntt_form():
             raise Exception("Secret Key must be NTT form")
-        c0 = self.generate_bound_rns_poly(0)
-        c0.transform_to_ntt_form()
-        for base in self.param.coeff_modulus:
-            temp_poly = self.generate_bound_poly(base, 0)
-            temp_poly._is_ntt_form = True
-            c0._set_poly(temp_poly.copy())
+        # uniform mask, stored as its seed by Ciphertext.to_bytes
+        seed = _sampler._new_seed()
+        c0 = self.generate_uniform_rns_poly(seed)
         c1 = c0.copy()
         c1.mul_inplace(secret_key)
-        # loc_error = [ self.param.plain_modulus * \
-        #     _random._random_bound_int(self.param._first_error_bound)\
-        #     for _ in range(self.param.poly_modulus) ]
-
-        # loc_error = [ self.param.plain_modulus * \
-        #     round(_random.random.gauss(0, 3.2)) \
-        #     for _ in range(self.param.poly_modulus) ]
-        # loc_error_plain = Poly(self.param.plain_modulus, self.param.poly_modulus, loc_error)
-        # loc_error_plain._set_ntt_engine(self.param.ntt_engines[self.param.plain_modulus])
-        # c1.add_poly_inplace(loc_error_plain)
-
-        ret = Ciphertext(self.param, [c0, c1.neg_inplace()], self.param._first_error_bound, True)
-        return ret
\ No newline at end of file
+        c1.neg_inplace()
+        # pk_1 = -a * s + t * e
+        error = self.generate_error_rns_poly().transform_to_ntt_form()
+        c1.add_inplace(error.mul_scalar_inplace(self.param.plain_modulus))
+        ret = Ciphertext(self.param, [c0, c1], self.param._first_error_bound, True)
+        ret._seed = seed
+        return ret
+    
+    # relinearization keys for ciphertexts up to max_size components (s^2 ... s^(max_size - 1))
+    def generate_relin_keys(self, secret_key : RNS_Poly, max_size=3) -> Relin_Keys:
+        if not secret_key.is_ntt_form():
+            raise Exception("Secret Key must be NTT form")
+        if max_size < 3:
+            raise Exception("max_size must be at least 3")
+        keys = {}
+        secret_key_power = secret_key.copy()
+        for power in range(2, max_size):
+            secret_key_power.mul_inplace(secret_key)
+            keys[power] = self._generate_switch_keys(secret_key, secret_key_power)
+        return Relin_Keys(self.param, keys)
+    
+    # one key per limb q_j: (a_j, b_j = -a_j * s + t * e_j + g_j * target), g_j = _basis[q_j]
+    def _generate_switch_keys(self, secret_key : RNS_Poly, target : RNS_Poly) -> dict[int, Ciphertext]:
+        keys = {}
+        for base in self.param.coeff_modulus:
+            seed = _sampler._new_seed()
+            a = self.generate_uniform_rns_poly(seed)
+            error = self.generate_error_rns_poly().transform_to_ntt_form()
+            b = (a * secret_key).neg_inplace()
+            b.add_inplace(error.mul_scalar_inplace(self.param.plain_modulus))
+            b.add_inplace(target.mul_scalar(self.param._basis[base]))
+            keys[base] = Ciphertext(self.param, [a, b], self.param._first_error_bound, True)
+            keys[base]._seed = seed
+        return keys
+    
+    # galois keys for X -> X^k, by default the rotations by powers of two (k = 5^(2^i))
+    # and the row swap (k = 2N - 1) used by Evaluator.sum_slots
+    def generate_galois_keys(self, secret_key : RNS_Poly, galois_elements=None) -> Galois_Keys:
+        if not secret_key.is_ntt_form():
+            raise Exception("Secret Key must be NTT form")
+        n = self.param.poly_modulus
+        if galois_elements == None:
+            galois_elements = [ pow(5, 1 << i, 2 * n) for i in range((n // 2).bit_length() - 1) ] + [ 2 * n - 1 ]
+        keys = {}
+        for k in galois_elements:
+            keys[k] = self._generate_switch_keys(secret_key, secret_key.apply_galois(k))
+        return Galois_Keys(self.param, keys)
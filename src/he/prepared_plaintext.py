@@ -0,0 +1,31 @@
+from he.galois_ring.poly import Poly
+from he.galois_ring.rns_poly import RNS_Poly
+from he.he_parameter import HE_Parameter
+
+# plaintext over Z_t lifted (centered) to every RNS limb once and kept in
+# coefficient form and, from the first use in NTT form, in NTT form
+# accepted by every Ciphertext plain operation in place of a Poly
+class Prepared_Plaintext:
+    def __init__(self, parameter : HE_Parameter, plain : Poly):
+        if plain.is_ntt_form():
+            plain = plain.copy().transform_from_ntt_form()
+        self._param = parameter
+        self._plain = plain
+        self._rns = RNS_Poly(parameter.coeff_modulus, parameter.poly_modulus)._eval_rns(plain)\
+            ._set_ntt_engines(parameter.ntt_engines)
+        self._rns_ntt = None
+        self._monomial = plain._monomial()
+    
+    def is_ntt_form(self) -> bool:
+        return False
+    
+    def norm(self):
+        return self._plain.norm()
+    
+    # limbs over rns_base (a prefix of the coefficient modulus) in the requested form
+    def _limbs(self, rns_base : list[int], is_ntt_form : bool) -> RNS_Poly:
+        if not is_ntt_form:
+            return self._rns._restrict(rns_base)
+        if self._rns_ntt == None:
+            self._rns_ntt = self._rns.copy().transform_to_ntt_form()
+        return self._rns_ntt._restrict(rns_base)
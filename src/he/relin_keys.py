@@ -0,0 +1,14 @@
+from he.ciphertext import Ciphertext
+from he.he_parameter import HE_Parameter
+
+# RNS-decomposed relinearization keys
+# keys[power][q_j] is a ciphertext (a, b) in NTT form with a * s + b = t * e + g_j * s^power
+# where g_j = _basis[q_j] is 1 mod q_j and 0 mod every other limb
+class Relin_Keys:
+    def __init__(self, parameter : HE_Parameter, keys : dict[int, dict[int, Ciphertext]]):
+        self._param = parameter
+        self._keys = keys
+    
+    # largest ciphertext size that can be brought back to size 2
+    def max_size(self) -> int:
+        return max(self._keys.keys()) + 1
@@ -28,16 +28,15 @@ class HomHash_Manager:
     def cipher_hash(self, cipher : Ciphertext) -> RNS_Poly:
         r_poly = self.r_poly
         ret = cipher._data[-1].copy()
-        r_pow = r_poly._data[0]
+        r = int(r_poly._data[0])
+        r_pow = r
         if not cipher.is_ntt_form():
             cipher.transform_to_ntt_form()
         # if not r_pow.is_ntt_form():
         #     r_pow.transform_to_ntt_form()
         for rns_poly in reversed(cipher._data[:-1]):
-            rns_poly_copy = rns_poly.copy()
-            rns_poly_copy.mul_scalar_inplace(r_pow)
-            ret += rns_poly_copy
-            r_pow *= r_pow
+            ret.add_inplace(rns_poly.mul_scalar(r_pow))
+            r_pow *= r
         return ret
     
     def to_field(self, val : int) -> Field:
@@ -37,12 +37,19 @@ class Gate:
         return ret
     
     # poly, rns_poly, ciphertext...
-    def compute_poly(self, data : list):
+    # evaluator: ciphertext products go through evaluator.multiply (relinearized) when given
+    def compute_poly(self, data : list, evaluator=None):
         if len(data) < self.right:
             raise Exception("data list is small")
         if self.op == OpType.ADD:
             return data[self.left] + data[self.right]
         elif self.op == OpType.MULT:
+            if self.left == self.right and isinstance(data[self.left], Ciphertext):
+                if evaluator != None:
+                    return evaluator.square(data[self.left])
+                return data[self.left].square()
+            if evaluator != None:
+                return evaluator.multiply(data[self.left], data[self.right])
             return data[self.left] * data[self.right]
     
     def compute_poly_const(self, data : list):
@@ -106,11 +113,11 @@ class Layer:
             ret += f"{idx} gate : {gate.toString()}\n"
         return ret
     
-    def compute_poly(self, data : list) -> list:
+    def compute_poly(self, data : list, evaluator=None) -> list:
         # data.append(data[0] - data[0])  # zero poly
         ret = []
         for gate in self.gates:
-            ret.append(gate.compute_poly(data))
+            ret.append(gate.compute_poly(data, evaluator))
         return ret
     
     def compute_poly_const(self, data : list) -> list:
@@ -157,7 +164,9 @@ class Circuit:
     
     # input : list of polynomial (plain, cipher...)
     # output : list of layer's output (output[layer][gates]), each elemenent is poly
-    def compute_poly(self, data : list):
+    # evaluator : optional he.evaluator.Evaluator, relinearizes ciphertext products
+    #             (the result is then no longer comparable with cipher_hash of the inputs)
+    def compute_poly(self, data : list, evaluator=None):
         # self._modify_label_m1(data)
         # data_copy = copy.deepcopy(data)
         # ret = [copy.deepcopy(data)]
@@ -169,7 +178,7 @@ class Circuit:
         self._modify_label_m1(data)
         data_copy = copy.deepcopy(data)
         for layer in self.layers:
-            data_copy = layer.compute_poly(data_copy)
+            data_copy = layer.compute_poly(data_copy, evaluator)
         return data_copy
     
     # data : list of poly and field
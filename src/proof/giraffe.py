@@ -460,7 +460,7 @@ class Demo:
         for _cipher in cipher_input:
             hashed_cipher = hasher.cipher_hash(_cipher)
             for _bais in param.coeff_modulus:
-                input_dict[_bais].append(fielder_dict[_bais].to_field_list(hashed_cipher._rns_poly[_bais]._data))
+                input_dict[_bais].append(fielder_dict[_bais].to_field_list(hashed_cipher._rns_poly[_bais]._data.tolist()))
         end = time.perf_counter()
         self.log(f"input hashing time: {end - start}")
         hash_time = end - start
@@ -488,7 +488,7 @@ class Demo:
         self.log(f"result hashing time: {end - start}")
         is_same = True
         for _bais in param.coeff_modulus:
-            hashed_result_field = fielder_dict[_bais].to_field_list(hashed_result[0]._rns_poly[_bais]._data)
+            hashed_result_field = fielder_dict[_bais].to_field_list(hashed_result[0]._rns_poly[_bais]._data.tolist())
             same = all(hashed_result_field[i] == output_dict[_bais][i] for i in range(len(output_dict[_bais])))
             if not same: 
                 is_same = False
@@ -513,7 +513,7 @@ class Demo:
             end = time.perf_counter()
             hash_time += end - start
             for _bais in param.coeff_modulus:
-                input_dict[_bais].append(fielder_dict[_bais].to_field_list(hashed_cipher._rns_poly[_bais]._data))
+                input_dict[_bais].append(fielder_dict[_bais].to_field_list(hashed_cipher._rns_poly[_bais]._data.tolist()))
         # end = time.perf_counter()
         # hash_time = end - start
         self.log(f"input hashing time: {end - start}")
@@ -548,7 +548,7 @@ class Demo:
 
         is_same = True
         for _bais in param.coeff_modulus:
-            hashed_result_field = fielder_dict[_bais].to_field_list(hashed_result._rns_poly[_bais]._data)
+            hashed_result_field = fielder_dict[_bais].to_field_list(hashed_result._rns_poly[_bais]._data.tolist())
             same = all(hashed_result_field[i] == output_dict[_bais][i] for i in range(len(output_dict[_bais])))
             if not same: 
                 is_same = False
@@ -572,8 +572,8 @@ class Demo:
         # matrix encryption
         start = time.perf_counter()
         plain_list = [encoder.slot_encode(m) for m in matrix]
-        cipher_list = [encryptor.encrypt(plain.transform_from_ntt_form()) for plain in plain_list]
-        enc_vec = [encryptor.encrypt(encoder.coeff_encode([v])) for v in vec]
+        cipher_list = encryptor.encrypt_batch([plain.transform_from_ntt_form() for plain in plain_list])
+        enc_vec = encryptor.encrypt_batch([encoder.coeff_encode([v]) for v in vec])
         end = time.perf_counter()
         encrypt_time = end - start
 
@@ -615,11 +615,11 @@ class Demo:
 
         # len(input_cipher) must be power of 2
         start = time.perf_counter()
-        input_cipher = [
-            encryptor.encrypt(encoder.slot_encode(data).transform_from_ntt_form()),
-            *[encryptor.encrypt(encoder.coeff_encode([_coeff])) for _coeff in coeff],
-            encryptor.encrypt(encoder.coeff_encode([0]))
-        ]
+        input_cipher = encryptor.encrypt_batch([
+            encoder.slot_encode(data).transform_from_ntt_form(),
+            *[encoder.coeff_encode([_coeff]) for _coeff in coeff],
+            encoder.coeff_encode([0])
+        ])
         end = time.perf_counter()
         encrypt_time = end - start
         
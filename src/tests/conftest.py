@@ -0,0 +1,21 @@
+import os
+import sys
+import pytest
+
+# modules import each other as top level packages (he, _util, proof) from src
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from he.he_parameter import HE_Parameter
+from he.encoder import Encoder
+from he.key_generator import Key_Generator
+from he.encryptor import Encryptor
+from he.decryptor import Decryptor
+
+
+@pytest.fixture(scope="module")
+def context():
+    parms = HE_Parameter("bv").set_poly_modulus(6).set_coeff_modulus([30, 40, 40]).set_plain_modulus(17).set_bound(1, 0)
+    parms.generate_context()
+    key_generator = Key_Generator(parms)
+    secret_key = key_generator.generate_secret_key()
+    public_key = key_generator.generate_public_key(secret_key)
+    return parms, Encoder(parms), Encryptor(parms, public_key), Decryptor(parms, secret_key)
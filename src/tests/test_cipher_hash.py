@@ -0,0 +1,22 @@
+import random
+from proof.cipher_hash import HomHash_Manager
+
+
+def _encrypt(context, rng):
+    parms, encoder, encryptor, decryptor = context
+    values = [ rng.randrange(parms.plain_modulus) for _ in range(parms.poly_modulus) ]
+    return encryptor.encrypt(encoder.slot_encode(values).transform_from_ntt_form())
+
+
+# the hash evaluates the ciphertext as a polynomial in s at r, so it maps ciphertext
+# products of any size to products of hashes
+def test_cipher_hash_is_homomorphic(context):
+    rng = random.Random(12)
+    hasher = HomHash_Manager(context[0])
+    ca, cb = _encrypt(context, rng), _encrypt(context, rng)
+    square = cb * cb
+    assert (ca * cb).size() == 3 and (ca * square).size() == 4
+    assert hasher.cipher_hash(ca + cb).equal(hasher.cipher_hash(ca) + hasher.cipher_hash(cb))
+    assert hasher.cipher_hash(ca * cb).equal(hasher.cipher_hash(ca) * hasher.cipher_hash(cb))
+    assert hasher.cipher_hash(ca * square).equal(hasher.cipher_hash(ca) * hasher.cipher_hash(square))
+    assert hasher.cipher_hash(square * square).equal(hasher.cipher_hash(square) * hasher.cipher_hash(square))
@@ -0,0 +1,106 @@
+import random
+import pytest
+from he.ciphertext import Ciphertext
+
+
+def _decrypt(decryptor, cipher):
+    return [ int(x) for x in decryptor.decrypt(cipher).transform_to_ntt_form()._data ]
+
+
+def _values(parms):
+    rng = random.Random(1)
+    return [ rng.randrange(parms.plain_modulus) for _ in range(parms.poly_modulus) ]
+
+
+def test_add_scalar_round_trip(context):
+    parms, encoder, encryptor, decryptor = context
+    values, t = _values(parms), parms.plain_modulus
+    cipher = encryptor.encrypt(encoder.slot_encode(list(values)).transform_from_ntt_form())
+    assert _decrypt(decryptor, cipher.add_scalar(5)) == [ (v + 5) % t for v in values ]
+    product = cipher * cipher
+    assert _decrypt(decryptor, product.add_scalar(5)) == [ (v * v + 5) % t for v in values ]
+
+
+def test_add_scalar_after_mod_switch(context):
+    parms, encoder, encryptor, decryptor = context
+    values, t = _values(parms), parms.plain_modulus
+    cipher = encryptor.encrypt(encoder.slot_encode(list(values)).transform_from_ntt_form())
+    switched = cipher.mod_switch_to_next().add_scalar(-3)
+    assert _decrypt(decryptor, switched) == [ (v - 3) % t for v in values ]
+
+
+def test_align_scales_error_bound(context):
+    parms, encoder, encryptor, decryptor = context
+    values, t = _values(parms), parms.plain_modulus
+    switched = encryptor.encrypt(encoder.slot_encode(list(values)).transform_from_ntt_form()).mod_switch_to_next()
+    square = switched * switched
+    assert square._correction != switched._correction
+    factor = square._correction * pow(switched._correction, -1, t) % t
+    factor = min(factor, t - factor)
+    total = square + switched
+    assert total._error_bound >= square._error_bound + factor * switched._error_bound
+    assert _decrypt(decryptor, total) == [ (v * v + v) % t for v in values ]
+    inplace = square.copy().add_inplace(switched)
+    assert inplace._error_bound == total._error_bound
+
+
+def _schoolbook_tensor(a, b):
+    ret = [ None ] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            ret[i + j] = x * y if ret[i + j] == None else ret[i + j] + x * y
+    return ret
+
+
+def test_karatsuba_tensor_matches_schoolbook(context):
+    parms, encoder, encryptor, decryptor = context
+    values = _values(parms)
+    fresh = encryptor.encrypt(encoder.slot_encode(list(values)).transform_from_ntt_form())
+    ciphers = { 2: fresh, 3: fresh * fresh.copy(), 4: fresh * fresh.copy() * fresh.copy() }
+    for left, right in ((2, 2), (2, 3), (3, 2), (3, 3), (4, 4), (2, 4)):
+        a, b = ciphers[left]._data, ciphers[right]._data
+        tensor = fresh._tensor(a, b)
+        assert len(tensor) == left + right - 1
+        assert all(x.equal(y) for x, y in zip(tensor, _schoolbook_tensor(a, b)))
+
+
+def test_square_matches_product(context):
+    parms, encoder, encryptor, decryptor = context
+    values, t = _values(parms), parms.plain_modulus
+    cipher = encryptor.encrypt(encoder.slot_encode(list(values)).transform_from_ntt_form())
+    for power in (2, 4):
+        product = cipher * cipher.copy()
+        square = cipher.square()
+        assert square.size() == product.size()
+        assert all(x.equal(y) for x, y in zip(square._data, product._data))
+        assert square._error_bound == product._error_bound
+        assert _decrypt(decryptor, square) == [ pow(v, power, t) for v in values ]
+        cipher = square
+
+
+def test_serialization_round_trip(context):
+    parms, encoder, encryptor, decryptor = context
+    values = _values(parms)
+    plain = encoder.slot_encode(list(values)).transform_from_ntt_form()
+    seeded = encryptor.encrypt_symmetric(plain, decryptor._secret_keys[0])
+    unseeded = encryptor.encrypt(plain)
+    product = unseeded * seeded
+    for cipher in (seeded, unseeded, seeded.mod_switch_to_next(), unseeded.mod_switch_to_next(),\
+        product.mod_switch_to_next().mod_switch_to_next(), unseeded.copy().transform_from_ntt_form()):
+        restored = Ciphertext.from_bytes(parms, cipher.to_bytes())
+        assert (restored.size(), restored.level(), restored.is_ntt_form()) == (cipher.size(), cipher.level(), cipher.is_ntt_form())
+        assert (restored._correction, restored._error_bound) == (cipher._correction, cipher._error_bound)
+        assert all(x.equal(y) for x, y in zip(restored._data, cipher._data))
+        assert decryptor.decrypt(restored).equal(decryptor.decrypt(cipher))
+    assert _decrypt(decryptor, Ciphertext.from_bytes(parms, seeded.to_bytes())) == values
+    # the seeded component is sent as its 32 byte seed
+    assert len(unseeded.to_bytes()) - len(seeded.to_bytes()) >= 8 * parms.poly_modulus * len(parms.coeff_modulus) - 32 - 16
+
+
+def test_serialization_rejects_corrupted_header(context):
+    parms, encoder, encryptor, decryptor = context
+    data = encryptor.encrypt(encoder.coeff_encode([1, 2, 3])).to_bytes()
+    with pytest.raises(Exception, match="not a serialized ciphertext"):
+        Ciphertext.from_bytes(parms, b"XECT" + data[4:])
+    with pytest.raises(Exception, match="format version"):
+        Ciphertext.from_bytes(parms, data[:4] + bytes([Ciphertext._VERSION + 1]) + data[5:])
@@ -0,0 +1,43 @@
+import random
+import numpy as np
+import pytest
+from he.he_parameter import HE_Parameter
+from he.key_generator import Key_Generator
+from he.decryptor import Decryptor
+from he.galois_ring.rns_poly import RNS_Poly
+
+
+@pytest.mark.parametrize("bits", [[30, 40, 40], [40, 50, 60], [60, 60, 60, 60]])
+def test_recover_rns_matches_exact_crt(bits):
+    parms = HE_Parameter("bv").set_poly_modulus(5).set_coeff_modulus(bits).set_plain_modulus(17)\
+        .set_bound(1, 0).generate_context("numpy")
+    decryptor = Decryptor(parms, Key_Generator(parms).generate_secret_key())
+    total_modulus = 1
+    for base in parms.coeff_modulus:
+        total_modulus *= base
+    half = total_modulus // 2
+    rng = random.Random(len(bits))
+    # centered values at and next to +-Q/2, where a float rounding of sum_i y_i / q_i goes off by one
+    values = [ sign * (half - d) for sign in (1, -1) for d in (0, 1, 2, 3, 1000, total_modulus >> 48) ]
+    values += [ rng.randrange(-half, half + 1) for _ in range(parms.poly_modulus - len(values)) ]
+    rns_poly = RNS_Poly(parms.coeff_modulus, parms.poly_modulus)
+    rns_poly._data = np.array([ [ x % base for x in values ] for base in parms.coeff_modulus ], dtype=np.uint64)
+    recovered = decryptor._recover_rns(rns_poly)
+    assert recovered._data.tolist() == [ x % parms.plain_modulus for x in values ]
+
+
+def test_horner_and_key_power_decryption(context):
+    parms, encoder, encryptor, decryptor = context
+    rng = random.Random(11)
+    t = parms.plain_modulus
+    a = [ rng.randrange(t) for _ in range(parms.poly_modulus) ]
+    b = [ rng.randrange(t) for _ in range(parms.poly_modulus) ]
+    ca = encryptor.encrypt(encoder.slot_encode(list(a)).transform_from_ntt_form())
+    cb = encryptor.encrypt(encoder.slot_encode(list(b)).transform_from_ntt_form())
+    for cipher, expected in ((ca * cb, [ x * y % t for x, y in zip(a, b) ]),\
+        (ca * cb * ca, [ x * y * x % t for x, y in zip(a, b) ])):
+        powers = decryptor.decrypt(cipher)
+        horner = decryptor.decrypt(cipher, True)
+        assert powers.equal(horner)
+        assert [ int(x) for x in powers.transform_to_ntt_form()._data ] == expected
+    assert len(decryptor._secret_keys) == 3
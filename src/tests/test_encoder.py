@@ -0,0 +1,44 @@
+import random
+from he.encoder import Encoder
+
+
+def _plain(encoder, seed):
+    rng = random.Random(seed)
+    return encoder.coeff_encode([ rng.randrange(encoder.plain_modulus) for _ in range(encoder.poly_modulus) ])
+
+
+def test_prepare_returns_cached_object(context):
+    parms, encoder, encryptor, decryptor = context
+    encoder = Encoder(parms)
+    prepared = encoder.prepare(_plain(encoder, 1))
+    assert encoder.prepare(_plain(encoder, 1)) is prepared
+    assert encoder.prepare(_plain(encoder, 1).transform_to_ntt_form()) is prepared
+    assert encoder.prepare(_plain(encoder, 2)) is not prepared
+
+
+def test_prepare_cache_evicts_least_recently_used(context):
+    parms, encoder, encryptor, decryptor = context
+    encoder = Encoder(parms, prepared_cache_size=2)
+    first, second = encoder.prepare(_plain(encoder, 1)), encoder.prepare(_plain(encoder, 2))
+    assert encoder.prepare(_plain(encoder, 1)) is first
+    encoder.prepare(_plain(encoder, 3))
+    assert len(encoder._prepared_cache) == 2
+    assert encoder.prepare(_plain(encoder, 1)) is first
+    assert encoder.prepare(_plain(encoder, 2)) is not second
+
+
+def test_prepared_plaintext_matches_poly(context):
+    parms, encoder, encryptor, decryptor = context
+    cipher = encryptor.encrypt(_plain(encoder, 4))
+    ciphers = [ cipher, cipher.copy().transform_from_ntt_form(), cipher.mod_switch_to_next(),\
+        cipher.mod_switch_to_next().transform_from_ntt_form() ]
+    for plain in (_plain(encoder, 5), encoder.coeff_encode([3])):
+        prepared = encoder.prepare(plain)
+        for target in ciphers:
+            for op in ("mul_plain", "add_plain", "sub_plain"):
+                expected, got = getattr(target, op)(plain), getattr(target, op)(prepared)
+                assert got.is_ntt_form() == expected.is_ntt_form() == target.is_ntt_form()
+                assert got.level() == target.level()
+                assert all(x.equal(y) for x, y in zip(got._data, expected._data))
+        # constants take the scalar fast path and never need the ntt limbs
+        assert (prepared._rns_ntt == None) == (prepared._monomial != None)
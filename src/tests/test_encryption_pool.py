@@ -0,0 +1,29 @@
+import random
+from he.encryptor import Encryptor
+from he.encryption_pool import Encryption_Pool
+
+
+def _decrypt(decryptor, cipher):
+    return [ int(x) for x in decryptor.decrypt(cipher).transform_to_ntt_form()._data ]
+
+
+def test_encryptor_reduces_public_key(context):
+    parms, encoder, encryptor, decryptor = context
+    public_key = encryptor.public_key.copy()
+    public_key._data = [ rns_poly + rns_poly - rns_poly for rns_poly in public_key._data ]
+    assert max(rns_poly._bound for rns_poly in public_key._data) > 1
+    encryptor = Encryptor(parms, public_key)
+    assert [ rns_poly._bound for rns_poly in encryptor.public_key._data ] == [1, 1]
+
+
+def test_pool_round_trip(context):
+    parms, encoder, encryptor, decryptor = context
+    rng = random.Random(2)
+    values = [ [ rng.randrange(parms.plain_modulus) for _ in range(parms.poly_modulus) ] for _ in range(6) ]
+    with Encryption_Pool(encryptor, size=4, low_watermark=2, refill_batch=2) as pool:
+        for value in values:
+            cipher = pool.encrypt(encoder.slot_encode(list(value)).transform_from_ntt_form())
+            assert _decrypt(decryptor, cipher) == value
+        stats = pool.stats()
+    assert stats["hits"] + stats["misses"] == len(values)
+    assert [ rns_poly._bound for rns_poly in encryptor.public_key._data ] == [1, 1]
@@ -0,0 +1,21 @@
+import random
+import pytest
+
+
+def _decrypt(decryptor, cipher):
+    return [ int(x) for x in decryptor.decrypt(cipher).transform_to_ntt_form()._data ]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_encrypt_batch_round_trip(context, processes):
+    parms, encoder, encryptor, decryptor = context
+    rng = random.Random(processes)
+    values = [ [ rng.randrange(parms.plain_modulus) for _ in range(parms.poly_modulus) ] for _ in range(5) ]
+    # the same plaintext twice: its ciphertexts must still differ
+    values.append(list(values[0]))
+    polys = [ encoder.slot_encode(list(value)).transform_from_ntt_form() for value in values ]
+    encrypted = encryptor.encrypt_batch(polys, processes)
+    assert len(encrypted) == len(values)
+    assert [ _decrypt(decryptor, cipher) for cipher in encrypted ] == values
+    masks = { cipher._data[0]._data.tobytes() for cipher in encrypted }
+    assert len(masks) == len(encrypted)
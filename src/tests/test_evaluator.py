@@ -0,0 +1,80 @@
+import random
+import pytest
+from he.he_parameter import HE_Parameter
+from he.encoder import Encoder
+from he.key_generator import Key_Generator
+from he.encryptor import Encryptor
+from he.decryptor import Decryptor
+from he.evaluator import Evaluator
+
+
+@pytest.fixture(scope="module")
+def keys():
+    parms = HE_Parameter("bv").set_poly_modulus(5).set_coeff_modulus([40, 50, 60]).set_plain_modulus(17)\
+        .set_bound(1, 0).set_error_sigma(3.2).generate_context("shoup")
+    key_generator = Key_Generator(parms)
+    secret_key = key_generator.generate_secret_key()
+    encryptor = Encryptor(parms, key_generator.generate_public_key(secret_key))
+    evaluator = Evaluator(parms, key_generator.generate_relin_keys(secret_key, 4),\
+        galois_keys=key_generator.generate_galois_keys(secret_key))
+    return parms, Encoder(parms), encryptor, Decryptor(parms, secret_key), evaluator
+
+
+def _encrypt(keys, values):
+    parms, encoder, encryptor, decryptor, evaluator = keys
+    return encryptor.encrypt(encoder.slot_encode(list(values)).transform_from_ntt_form())
+
+
+def _decrypt(keys, cipher):
+    parms, encoder, encryptor, decryptor, evaluator = keys
+    return [ int(x) for x in decryptor.decrypt(cipher).transform_to_ntt_form()._data ]
+
+
+def _values(parms, seed):
+    rng = random.Random(seed)
+    return [ rng.randrange(parms.plain_modulus) for _ in range(parms.poly_modulus) ]
+
+
+def test_relinearize(keys):
+    parms, encoder, encryptor, decryptor, evaluator = keys
+    a, b, t = _values(parms, 1), _values(parms, 2), parms.plain_modulus
+    ca, cb = _encrypt(keys, a), _encrypt(keys, b)
+    product = evaluator.multiply(ca, cb)
+    assert product.size() == 2
+    assert _decrypt(keys, product) == [ x * y % t for x, y in zip(a, b) ]
+    cubic = evaluator.relinearize(ca * cb * ca)
+    assert cubic.size() == 2
+    assert _decrypt(keys, cubic) == [ x * y * x % t for x, y in zip(a, b) ]
+
+
+def test_mod_switch_keeps_plaintext(keys):
+    parms, encoder, encryptor, decryptor, evaluator = keys
+    a, b, t = _values(parms, 5), _values(parms, 6), parms.plain_modulus
+    ca, cb = _encrypt(keys, a), _encrypt(keys, b)
+    switched = evaluator.mod_switch_to_next(ca)
+    assert switched.level() == ca.level() - 1
+    assert _decrypt(keys, switched) == a
+    assert _decrypt(keys, switched + cb) == [ (x + y) % t for x, y in zip(a, b) ]
+    assert _decrypt(keys, evaluator.multiply(switched, cb)) == [ x * y % t for x, y in zip(a, b) ]
+    lowest = evaluator.mod_switch_to_next(switched)
+    assert _decrypt(keys, lowest) == a
+
+
+@pytest.mark.parametrize("steps", [1, 3, 6, 15])
+def test_rotate(keys, steps):
+    parms, encoder, encryptor, decryptor, evaluator = keys
+    values, half = _values(parms, 3), parms.poly_modulus // 2
+    order = encoder.slot_rotation_order()
+    rotated = _decrypt(keys, evaluator.rotate(_encrypt(keys, values), steps))
+    for row in (0, half):
+        for i in range(half):
+            assert rotated[order[row + i]] == values[order[row + (i + steps) % half]]
+
+
+def test_conjugate_and_sum_slots(keys):
+    parms, encoder, encryptor, decryptor, evaluator = keys
+    values, half, t = _values(parms, 4), parms.poly_modulus // 2, parms.plain_modulus
+    order = encoder.slot_rotation_order()
+    swapped = _decrypt(keys, evaluator.conjugate(_encrypt(keys, values)))
+    assert [ swapped[order[i]] for i in range(2 * half) ] == [ values[order[(i + half) % (2 * half)]] for i in range(2 * half) ]
+    assert _decrypt(keys, evaluator.sum_slots(_encrypt(keys, values))) == [ sum(values) % t ] * parms.poly_modulus
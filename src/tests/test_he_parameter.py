@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from he import _ntt, he_parameter
+from he._ntt import _NTT_Registry
+from he.he_parameter import HE_Parameter
+from he.encoder import Encoder
+from he.key_generator import Key_Generator
+from he.encryptor import Encryptor
+from he.decryptor import Decryptor
+
+
+def _parameter():
+    return HE_Parameter("bv").set_poly_modulus(5).set_coeff_modulus([40, 50, 60]).set_plain_modulus(17)\
+        .set_bound(1, 0).set_error_sigma(3.2)
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy", "shoup"])
+def test_save_load_round_trip(backend, tmp_path, monkeypatch):
+    parms = _parameter().generate_context(backend)
+    parms.save(tmp_path / "parms.bin")
+    registry = _NTT_Registry()
+    monkeypatch.setattr(_ntt, "_NTT_REGISTRY", registry)
+    monkeypatch.setattr(he_parameter, "_NTT_REGISTRY", registry)
+    loaded = HE_Parameter.load(tmp_path / "parms.bin")
+    assert (loaded.coeff_modulus, loaded.plain_modulus, loaded.ntt_backend) == (parms.coeff_modulus, parms.plain_modulus, backend)
+    assert loaded._basis == parms._basis
+    assert loaded._error_cdt.tolist() == parms._error_cdt.tolist()
+    block = np.arange(2 * parms.poly_modulus, dtype=np.uint64).reshape(2, -1)
+    for modulus, engine in parms.ntt_engines.items():
+        assert loaded.ntt_engines[modulus]._forward(block.copy()).tolist() == engine._forward(block.copy()).tolist()
+    # every engine comes from the file, none is rebuilt
+    assert registry.stats()["misses"] == 0
+
+    key_generator = Key_Generator(loaded)
+    secret_key = key_generator.generate_secret_key()
+    encryptor = Encryptor(loaded, key_generator.generate_public_key(secret_key))
+    plain = Encoder(loaded).coeff_encode(list(range(10)))
+    assert Decryptor(loaded, secret_key).decrypt(encryptor.encrypt(plain))._data.tolist() == plain._data.tolist()
+
+
+def test_load_before_generate_context(tmp_path):
+    _parameter().save(tmp_path / "parms.bin")
+    loaded = HE_Parameter.load(tmp_path / "parms.bin")
+    assert not loaded._setup_complete
+    assert loaded.generate_context("numpy")._setup_complete
+
+
+def test_load_rejects_other_files(tmp_path):
+    (tmp_path / "other.bin").write_bytes(b"not a parameter file")
+    with pytest.raises(Exception, match="is not a saved HE_Parameter"):
+        HE_Parameter.load(tmp_path / "other.bin")
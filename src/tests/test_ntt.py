@@ -0,0 +1,97 @@
+import random
+import numpy as np
+import pytest
+from _util import _prime
+from he import _ntt, he_parameter
+from he._ntt import _NTT_Engine, _NTT_Engine_Numpy, _NTT_Engine_Shoup, _NTT_Handle, _NTT_Registry
+from he.he_parameter import HE_Parameter
+
+N = 16
+Q = 12289
+
+
+@pytest.mark.parametrize("engine_class", [_NTT_Engine_Numpy, _NTT_Engine_Shoup])
+@pytest.mark.parametrize("bits", [17, 40, 62])
+def test_backends_match_python_engine(engine_class, bits):
+    n = 64
+    q = _prime._generate_prime(bits, n, "catalogue")
+    rng = random.Random(bits)
+    block = np.array([ [ rng.randrange(q) for _ in range(n) ] for _ in range(3) ], dtype=np.uint64)
+    reference, engine = _NTT_Engine(n, q), engine_class(n, q)
+    forward = engine._forward(block.copy())
+    assert forward.tolist() == reference._forward(block.copy()).tolist()
+    assert engine._inverse(forward.copy()).tolist() == block.tolist()
+    assert engine._transform_to_ntt_form(block[0].tolist()) == forward[0].tolist()
+
+
+def test_ntt_product_is_negacyclic():
+    n = 16
+    engine = _NTT_Engine_Numpy(n, Q)
+    rng = random.Random(4)
+    a = [ rng.randrange(Q) for _ in range(n) ]
+    b = [ rng.randrange(Q) for _ in range(n) ]
+    expected = [ 0 ] * n
+    for i in range(n):
+        for j in range(n):
+            sign = 1 if i + j < n else -1
+            expected[(i + j) % n] = (expected[(i + j) % n] + sign * a[i] * b[j]) % Q
+    slots = engine._forward(np.array([ a, b ], dtype=np.uint64))
+    product = (slots[0].astype(object) * slots[1].astype(object) % Q).astype(np.uint64).reshape(1, n)
+    assert engine._inverse(product)[0].tolist() == expected
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    registry = _NTT_Registry(2)
+    monkeypatch.setattr(_ntt, "_NTT_REGISTRY", registry)
+    monkeypatch.setattr(he_parameter, "_NTT_REGISTRY", registry)
+    return registry
+
+
+def test_registry_evicts_least_recently_used():
+    registry = _NTT_Registry(2)
+    first = registry._get((N, Q, "_NTT_Engine"), _NTT_Engine)
+    registry._get((N, 40961, "_NTT_Engine"), _NTT_Engine)
+    assert registry._get((N, Q, "_NTT_Engine"), _NTT_Engine) is first
+    registry._get((N, 65537, "_NTT_Engine"), _NTT_Engine)
+    assert registry.stats() == { "engines": 2, "maxsize": 2, "hits": 1, "misses": 3, "evictions": 1 }
+    assert registry._get((N, Q, "_NTT_Engine"), _NTT_Engine) is first
+    registry.resize(1)
+    assert registry.stats()["evictions"] == 2
+    with pytest.raises(Exception):
+        registry.resize(0)
+
+
+def test_handle_keeps_engine_after_eviction(registry):
+    handle = _NTT_Handle(N, Q, _NTT_Engine_Numpy)
+    assert registry.stats()["misses"] == 0
+    engine = handle._engine()
+    for q in (40961, 65537, 114689):
+        _NTT_Handle(N, q, _NTT_Engine_Numpy)._engine()
+    assert registry.stats()["evictions"] == 2
+    assert handle._engine() is engine and handle._psi == engine._psi
+    assert registry.stats()["misses"] == 4
+
+
+def test_ntt_registry_stats(registry):
+    parms = HE_Parameter("bv", prime_mode="catalogue").set_poly_modulus(4).set_coeff_modulus([30, 40]).set_plain_modulus(17).set_bound(1, 0)
+    parms.generate_context("numpy")
+    other = HE_Parameter("bv", prime_mode="catalogue").set_poly_modulus(4).set_coeff_modulus([30, 40]).set_plain_modulus(17).set_bound(1, 0)
+    other.generate_context("numpy")
+    assert HE_Parameter.ntt_registry_stats()["misses"] == 0
+    for modulus in parms.ntt_engines:
+        parms.ntt_engines[modulus]._engine()
+        assert other.ntt_engines[modulus]._engine() is parms.ntt_engines[modulus]._engine()
+    stats = HE_Parameter.ntt_registry_stats()
+    assert (stats["misses"], stats["hits"], stats["evictions"]) == (3, 3, 1)
+
+
+def test_special_prime_transforms():
+    n = 256
+    q = _prime._generate_prime(50, n, "special")
+    rng = random.Random(25)
+    block = np.array([ [ rng.randrange(q) for _ in range(n) ] for _ in range(2) ], dtype=np.uint64)
+    numpy_engine, shoup_engine = _NTT_Engine_Numpy(n, q), _NTT_Engine_Shoup(n, q)
+    assert numpy_engine._special != None
+    expected = _NTT_Engine(n, q)._forward(block.copy()).tolist()
+    assert numpy_engine._forward(block.copy()).tolist() == shoup_engine._forward(block.copy()).tolist() == expected
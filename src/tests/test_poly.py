@@ -0,0 +1,51 @@
+import random
+import numpy as np
+import pytest
+from he.galois_ring.poly import Poly, _karatsuba_mul
+
+Q = 12289
+
+
+def test_array_input_is_reduced_to_residues():
+    poly = Poly(Q, 8, np.array([-1, 2, Q + 3], dtype=np.int64))
+    assert poly._data.dtype == np.uint64
+    assert poly._data.tolist() == [Q - 1, 2, 3, 0, 0, 0, 0, 0]
+    assert Poly(Q, 4, np.array([Q + 1, 0, 0, 0], dtype=np.uint64))._data.tolist() == [1, 0, 0, 0]
+
+
+def test_array_input_is_folded_like_lists():
+    values = list(range(6))
+    from_array = Poly(Q, 4, np.array(values, dtype=np.uint64))
+    assert from_array._data.tolist() == Poly(Q, 4, values)._data.tolist() == [Q - 4, Q - 4, 2, 3]
+
+
+def _schoolbook_negacyclic(a, b, q):
+    n = len(a)
+    ret = [ 0 ] * n
+    for i in range(n):
+        for j in range(n):
+            sign = 1 if i + j < n else -1
+            ret[(i + j) % n] = (ret[(i + j) % n] + sign * a[i] * b[j]) % q
+    return ret
+
+
+# no ntt engine attached (and no 2N-th root for the first two moduli): the Karatsuba fallback
+@pytest.mark.parametrize("q, n", [(65539, 128), ((1 << 61) - 1, 64), (Q, 4)])
+def test_karatsuba_fallback_matches_schoolbook(q, n):
+    rng = random.Random(n)
+    a = [ rng.randrange(q) for _ in range(n) ]
+    b = [ rng.randrange(q) for _ in range(n) ]
+    product = Poly(q, n, a) * Poly(q, n, b)
+    assert product._data.tolist() == _schoolbook_negacyclic(a, b, q)
+
+
+def test_karatsuba_unequal_lengths():
+    rng = random.Random(7)
+    a = [ rng.randrange(-100, 100) for _ in range(77) ]
+    b = [ rng.randrange(-100, 100) for _ in range(40) ]
+    expected = [ 0 ] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        for j, y in enumerate(b):
+            expected[i + j] += x * y
+    assert _karatsuba_mul(a, b) == expected
+    assert _karatsuba_mul(b, a) == expected
@@ -0,0 +1,73 @@
+import inspect
+import itertools
+import random
+import pytest
+from _util import _prime, _vec_modulus
+from _util._prime_catalogue import _CATALOGUE
+from he.he_parameter import HE_Parameter
+
+
+def _trial_division(n):
+    return n >= 2 and all(n % d != 0 for d in range(2, int(n ** 0.5) + 1))
+
+
+def test_is_prime_small_numbers():
+    assert [ n for n in range(20000) if _prime._is_prime(n) ] == [ n for n in range(20000) if _trial_division(n) ]
+
+
+def test_is_prime_pseudoprimes():
+    # carmichael numbers and strong pseudoprimes to the first prime bases
+    for n in (561, 41041, 2047, 3215031751, 3825123056546413051, 318665857834031151167461):
+        assert not _prime._is_prime(n)
+    for n in ((1 << 61) - 1, (1 << 64) - 59, (1 << 89) - 1):
+        assert _prime._is_prime(n)
+
+
+def test_is_prime_agrees_with_miller_rabin():
+    rng = random.Random(5)
+    for _ in range(2000):
+        n = rng.randrange(1 << 40, 1 << 63) | 1
+        assert _prime._is_prime(n) == _prime._miller_rabin(n)
+
+
+@pytest.mark.parametrize("bits, n_degree", [(14, 4), (18, 64), (20, 256)])
+def test_ntt_primes_match_brute_force(bits, n_degree):
+    m = 2 * n_degree
+    expected = [ p for p in range((1 << bits) - 1, (1 << (bits - 1)) - 1, -1) if p % m == 1 and _trial_division(p) ]
+    assert list(_prime._ntt_primes(bits, n_degree, window=7)) == expected
+
+
+@pytest.mark.parametrize("bits, log_n", [(17, 12), (30, 13), (40, 1), (62, 16)])
+def test_catalogue_holds_largest_primes(bits, log_n):
+    n_degree = 1 << log_n
+    assert list(_CATALOGUE[(bits, log_n)]) == list(itertools.islice(_prime._ntt_primes(bits, n_degree), _prime._CATALOGUE_SIZE))
+    assert list(itertools.islice(_prime._catalogue_primes(bits, n_degree), 12)) ==\
+        list(itertools.islice(_prime._ntt_primes(bits, n_degree), 12))
+
+
+def test_rns_bases_are_distinct():
+    rns_base = _prime._generate_rns_bases([40, 40, 40], 1 << 12, "random", exclude=(1099511480321,))
+    assert len(set(rns_base)) == 3 and 1099511480321 not in rns_base
+    assert all(q.bit_length() == 40 and q % (1 << 13) == 1 and _prime._is_prime(q) for q in rns_base)
+
+
+def test_special_mode_supported_limbs():
+    n_degree = 1 << 12
+    rns_base = _prime._generate_rns_bases([45, 50, 60], n_degree, "special")
+    assert [ q.bit_length() for q in rns_base ] == [45, 50, 60]
+    for q in rns_base:
+        assert q % (2 * n_degree) == 1
+        assert _vec_modulus._special_constants(q) != None
+
+
+def test_special_mode_rejects_short_limbs():
+    n_degree = 1 << 13
+    assert min(_prime._special_bit_lengths(n_degree)) == 39
+    with pytest.raises(Exception, match="supported bit lengths for N = 8192: 39..62"):
+        _prime._generate_rns_bases([30, 30, 40], n_degree, "special")
+
+
+def test_parameter_default_prime_mode_matches_generator():
+    default = inspect.signature(_prime._generate_rns_bases).parameters["mode"].default
+    assert default == "random"
+    assert HE_Parameter("bv").prime_mode == default
@@ -0,0 +1,91 @@
+import random
+import numpy as np
+from _util import _prime
+from he.galois_ring.rns_poly import RNS_Poly
+
+N = 16
+
+def _rns_poly(rns_base, values):
+    ret = RNS_Poly(rns_base, N)
+    ret._data = np.array([ [ v % q for v in values ] for q in rns_base ], dtype=np.uint64)
+    return ret
+
+def _rns_base():
+    return _prime._generate_rns_bases([40, 50, 60], N, "catalogue")
+
+def test_neg_keeps_zero_coefficients():
+    rns_base = _rns_base()
+    values = [ 0, 1, -1, 5, 0, 7, 0, 0 ] + [ 3 ] * (N - 8)
+    poly = _rns_poly(rns_base, values)
+    expected = _rns_poly(rns_base, [ -v for v in values ])
+    assert (-poly).equal(expected)
+    assert poly.copy().neg_inplace().equal(expected)
+    zero = _rns_poly(rns_base, [ 0 ] * N)
+    assert zero.equal(-zero)
+    assert zero.equal(zero.copy().neg_inplace())
+
+def test_neg_of_unreduced_buffer():
+    rns_base = _rns_base()
+    values = [ 0, 2, 0, -4 ] * (N // 4)
+    poly = _rns_poly(rns_base, values)
+    lazy = poly + poly + poly
+    expected = _rns_poly(rns_base, [ -3 * v for v in values ])
+    negated = lazy.copy()
+    for _ in range(10):
+        negated.neg_inplace()
+        negated.neg_inplace()
+    assert (-negated).equal(expected)
+    assert (-lazy).equal(expected)
+
+def _negacyclic_shift(values, k):
+    ret = [ 0 ] * N
+    for i, v in enumerate(values):
+        j = i + k
+        ret[j % N] += v if (j // N) % 2 == 0 else -v
+    return ret
+
+def test_mul_monomial_wraps_zero_coefficients():
+    rns_base = _rns_base()
+    values = [ 1, 2, 3 ] + [ 0 ] * (N - 3)
+    for k in [ 1, 5, N - 1, N + 2 ]:
+        poly = _rns_poly(rns_base, values).mul_monomial_inplace(k, 1)
+        assert poly.equal(_rns_poly(rns_base, _negacyclic_shift(values, k)))
+
+def test_apply_galois_coefficient_form_with_zeros():
+    rns_base = _rns_base()
+    values = [ 0, 1, 0, 2, 0, 0, 3, 0 ] * (N // 8)
+    for k in [ 3, 5, 2 * N - 1 ]:
+        expected = [ 0 ] * N
+        for i, v in enumerate(values):
+            j = i * k % (2 * N)
+            expected[j % N] += v if j < N else -v
+        poly = _rns_poly(rns_base, values).apply_galois(k)
+        assert poly.equal(_rns_poly(rns_base, expected))
+
+def _slots(rns_base, values):
+    ret = RNS_Poly(rns_base, N, True)
+    ret._data = np.array([ [ v % q for v in values ] for q in rns_base ], dtype=np.uint64)
+    return ret
+
+def test_lazy_accumulation_matches_exact_arithmetic():
+    rng = random.Random(3)
+    rns_base = _rns_base()
+    acc = _slots(rns_base, [ 0 ] * N)
+    exact = [ 0 ] * N
+    for step in range(40):
+        a = [ rng.randrange(1 << 62) for _ in range(N) ]
+        b = [ rng.randrange(1 << 62) for _ in range(N) ]
+        acc.mul_add_inplace(_slots(rns_base, a), _slots(rns_base, b))
+        exact = [ e + x * y for e, x, y in zip(exact, a, b) ]
+        if step % 3 == 0:
+            acc.add_inplace(acc.copy())
+            exact = [ 2 * e for e in exact ]
+        if step % 5 == 0:
+            acc = acc - _slots(rns_base, a) * _slots(rns_base, b)
+            exact = [ e - x * y for e, x, y in zip(exact, a, b) ]
+        assert 1 <= acc._bound <= acc._max_bound
+        assert int(acc._buf.max()) < acc._bound * max(rns_base)
+    assert acc._bound > 1
+    assert acc.equal(_slots(rns_base, exact))
+    assert acc._data.tolist() == [ [ e % q for e in exact ] for q in rns_base ]
+    assert acc._bound == 1
@@ -0,0 +1,44 @@
+import math
+import numpy as np
+import pytest
+from _util import _sampler
+
+SEED = bytes(range(32))
+
+
+def test_gaussian_cdt_shape():
+    cdt = _sampler._gaussian_cdt(3.2, 6.0)
+    assert len(cdt) == math.ceil(6.0 * 3.2) + 1
+    assert (np.diff(cdt.astype(np.int64)) >= 0).all()
+    assert int(cdt[-1]) == (1 << 63) - 1
+    assert not cdt.flags.writeable
+    assert _sampler._gaussian_cdt(3.2, 6.0) is cdt
+    # P(x = 0) = 1 / sum_x rho(x)
+    total = sum(math.exp(-k * k / (2 * 3.2 ** 2)) for k in range(-20, 21))
+    assert abs(int(cdt[0]) / (1 << 63) - 1 / total) < 1e-12
+
+
+def test_gaussian_samples():
+    cdt = _sampler._gaussian_cdt(3.2, 6.0)
+    samples = _sampler._sample_gaussian(SEED, 0, 1 << 16, cdt)
+    assert samples.dtype == np.int64
+    assert np.abs(samples).max() <= len(cdt) - 1
+    assert abs(samples.mean()) < 0.1
+    assert abs(samples.std() - 3.2) < 0.1
+    assert (samples == _sampler._sample_gaussian(SEED, 0, 1 << 16, cdt)).all()
+    assert not (samples == _sampler._sample_gaussian(SEED, 1, 1 << 16, cdt)).all()
+
+
+def test_gaussian_cdt_rejects_invalid_width():
+    with pytest.raises(Exception):
+        _sampler._gaussian_cdt(0.0, 6.0)
+
+
+def test_uniform_and_bounded_samples():
+    q = (1 << 40) - 87
+    uniform = _sampler._sample_uniform(SEED, 3, 4096, q)
+    assert uniform.dtype == np.uint64 and int(uniform.max()) < q
+    assert (uniform == _sampler._sample_uniform(SEED, 3, 4096, q)).all()
+    bounded = _sampler._sample_bounded(SEED, 4, 4096, 2)
+    assert set(bounded.tolist()) == { -2, -1, 0, 1, 2 }
+    assert set(_sampler._sample_ternary(SEED, 5, 4096).tolist()) == { -1, 0, 1 }